@@ -0,0 +1,70 @@
+"""
+Benchmark: per-date JSON forecast files vs the indexed SQLite forecast store.
+
+Writes --days forecasts as JSON, imports them into a store, then times
+loading the full history through JSONFileForecastSource.load (one file
+open + pydantic validation per day), SQLiteForecastSource.load (indexed
+point lookups) and SQLiteForecastSource.load_range (one range scan).
+
+    python benchmarks/bench_forecast_store.py --days 5000
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the indexed forecast store.")
+    parser.add_argument('--days', type=int, default=5000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    from prediction_logger.forecast_store import SQLiteForecastSource, import_json_folder
+    from prediction_logger.sources import JSONFileForecastSource
+
+    start = datetime(2000, 1, 1)
+    dates = [start + timedelta(days=i) for i in range(args.days)]
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = os.path.join(tmp, 'forecast')
+        os.makedirs(folder)
+        for date in dates:
+            with open(os.path.join(folder, f"{date:%Y-%m-%d}.json"), 'w') as f:
+                json.dump({"scenario": "fade", "resistance": 23650, "support": 23400,
+                           "sigma_plus": None, "sigma_minus": None}, f)
+        store = os.path.join(tmp, 'forecasts.db')
+        t = time.perf_counter()
+        import_json_folder(folder, store)
+        print(f"{args.days} forecasts, import {time.perf_counter() - t:.2f} s")
+
+        timings = {}
+        source = JSONFileForecastSource(folder)
+        t = time.perf_counter()
+        for date in dates:
+            source.load(date)
+        timings['json load'] = time.perf_counter() - t
+
+        source = SQLiteForecastSource(store)
+        t = time.perf_counter()
+        for date in dates:
+            source.load(date)
+        timings['sqlite load'] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        assert len(source.load_range(dates[0], dates[-1])) == args.days
+        timings['sqlite load_range'] = time.perf_counter() - t
+        source.close()
+
+        for name, elapsed in timings.items():
+            print(f"{name:>18}: {elapsed:8.3f} s  {1e6 * elapsed / args.days:8.1f} us/forecast")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: batched validate_forecasts() vs one Forecast model per record.
+
+Builds --records forecast dicts (a few invalid) and times the current
+per-object path, Forecast(**record).dict(), against the batched validator.
+Both must accept and reject exactly the same records.
+
+    python benchmarks/bench_forecast_validation.py --records 100000
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import warnings
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+
+def make_records(n):
+    records = []
+    for i in range(n):
+        record = {"scenario": "fade", "resistance": 23650 + i % 100, "support": 23400,
+                  "sigma_plus": None, "sigma_minus": None}
+        if i % 10000 == 9999:
+            del record["support"]
+        records.append(record)
+    return records
+
+
+def per_object(records):
+    from pydantic import ValidationError
+    from prediction_logger.forecast_schema import Forecast
+    forecasts, errors = [], {}
+    for i, record in enumerate(records):
+        try:
+            forecasts.append(Forecast(**record).dict())
+        except ValidationError as e:
+            forecasts.append(None)
+            errors[i] = e
+    return forecasts, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched forecast validation.")
+    parser.add_argument('--records', type=int, default=100_000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    warnings.simplefilter('ignore', DeprecationWarning)
+
+    from prediction_logger.forecast_schema import validate_forecasts
+    records = make_records(args.records)
+    validate_forecasts(records[:10])  # build the batch adapter outside the timing
+
+    results = {}
+    for name, fn in (('per-object', per_object), ('batched', validate_forecasts)):
+        start = time.perf_counter()
+        results[name] = fn(records)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>10}: {elapsed:7.3f} s  {1e6 * elapsed / args.records:6.2f} us/record  "
+              f"({len(results[name][1])} invalid)")
+    assert results['per-object'][0] == results['batched'][0]
+    assert sorted(results['per-object'][1]) == sorted(results['batched'][1])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: streaming ingest throughput (ticks/sec).
+
+Runs the stand-in websocket server (prediction_logger.stream_server) in a
+child process and times the full pipeline -- socket read, bounded queue,
+JSON parsing and bar aggregation -- plus the BarAggregator and the intraday
+LiveEvaluator on their own.
+
+    python benchmarks/bench_ingest.py --ticks 1000000 --batch 100
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+
+def _server(ticks, batch, port_queue):
+    logging.basicConfig(level=logging.WARNING)
+    from prediction_logger.stream_server import serve
+    asyncio.run(serve('127.0.0.1', 0, ticks=ticks, batch=batch, tick_interval=1.0, ready=port_queue.put))
+
+
+async def pipeline(port, ticks, queue_size):
+    from prediction_logger.ingest import Ingester
+    stop = asyncio.Event()
+    ingester = Ingester(f"ws://127.0.0.1:{port}", ['NQ', 'ES'], queue_size=queue_size)
+    task = asyncio.create_task(ingester.run(stop))
+    while ingester.stats['ticks'] < ticks:
+        await asyncio.sleep(0.005)
+    stop.set()
+    await task
+    return ingester.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming market-data ingest.")
+    parser.add_argument('--ticks', type=int, default=1_000_000)
+    parser.add_argument('--batch', type=int, default=100, help='Ticks per websocket message')
+    parser.add_argument('--queue-size', type=int, default=1000)
+    parser.add_argument('--forecasts', type=int, default=1000, help='Forecasts per symbol for the live evaluator')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    from prediction_logger.ingest import BarAggregator, Tick
+    ctx = multiprocessing.get_context('spawn')
+    port_queue = ctx.Queue()
+    server = ctx.Process(target=_server, args=(args.ticks, args.batch, port_queue), daemon=True)
+    server.start()
+    try:
+        port = port_queue.get(timeout=30)
+        start = time.perf_counter()
+        stats = asyncio.run(pipeline(port, args.ticks, args.queue_size))
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+    print(f"pipeline: {stats['ticks']} ticks in {elapsed:.2f} s = {stats['ticks'] / elapsed:,.0f} ticks/s  "
+          f"({stats['bars']} bars, queue high water {stats['queue_high_water']}/{args.queue_size})")
+
+    ticks = [Tick('NQ' if i % 2 else 'ES', 23500.0 + (i % 7) * 0.25, 1.0, 1753660800.0 + i)
+             for i in range(args.ticks)]
+    agg = BarAggregator()
+    start = time.perf_counter()
+    for tick in ticks:
+        agg.add(tick)
+    elapsed = time.perf_counter() - start
+    print(f"aggregator only: {args.ticks / elapsed:,.0f} ticks/s ({1e9 * elapsed / args.ticks:.0f} ns/tick)")
+
+    from prediction_logger.live import LiveEvaluator
+    scenarios = ('breakout', 'range', 'fade')
+    forecasts = [{'scenario': scenarios[i % 3], 'resistance': 23500.0 + i * 0.5, 'support': 23000.0 - i * 0.5}
+                 for i in range(args.forecasts)]
+    evaluator = LiveEvaluator(loader=lambda symbol, session: forecasts)
+    start = time.perf_counter()
+    for tick in ticks:
+        evaluator.on_tick(tick)
+    elapsed = time.perf_counter() - start
+    print(f"live evaluator ({args.forecasts} forecasts/symbol): {args.ticks / elapsed:,.0f} ticks/s, "
+          f"{evaluator.stats['events']} events")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: incremental RollingMetrics vs the dashboard's full recompute.
+
+Writes a --rows results CSV, then times (1) the notebook's approach: read
+the whole CSV with pandas and recompute overall/per-scenario hit rates,
+rolling windows and binomial tests, (2) building the snapshot once, and
+(3) the steady state: appending --append rows and loading the snapshot,
+which reads only the new bytes.
+
+    python benchmarks/bench_metrics.py --rows 1000000
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+
+def write_rows(path, n, seed=0):
+    rng = random.Random(seed)
+    new = not os.path.exists(path)
+    with open(path, 'a') as f:
+        if new:
+            f.write("date,symbol,predicted,actual,scenario,result,version\n")
+        for i in range(n):
+            f.write(f"2025-07-{1 + i % 28:02d},{rng.choice(['/NQ', '/ES'])},23650,23600,"
+                    f"{rng.choice(['fade', 'breakout', 'range', 'trend'])},{rng.choice(['hit', 'miss'])},v1.0\n")
+
+
+def full_recompute(path):
+    import pandas as pd
+    from prediction_logger.metrics import binomial_pvalue
+    df = pd.read_csv(path)
+    df['hit'] = (df['result'] == 'hit').astype(int)
+    out = {'overall': df['hit'].mean(), 'scenarios': df.groupby('scenario')['hit'].agg(['count', 'mean'])}
+    for window in (5, 10, 20):
+        out[window] = df['hit'].rolling(window).mean()
+    out['p'] = binomial_pvalue(int(df['hit'].sum()), len(df))
+    for _, group in df.groupby('scenario'):
+        binomial_pvalue(int(group['hit'].sum()), len(group))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental rolling metrics.")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--append', type=int, default=2)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    from prediction_logger.metrics import load_metrics, snapshot_path_for
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'results.csv')
+        write_rows(path, args.rows)
+        start = time.perf_counter()
+        full_recompute(path)
+        print(f"full recompute (pandas): {time.perf_counter() - start:8.3f} s")
+        start = time.perf_counter()
+        load_metrics(path)
+        print(f"initial snapshot build:  {time.perf_counter() - start:8.3f} s  "
+              f"({os.path.getsize(snapshot_path_for(path))} byte snapshot)")
+        write_rows(path, args.append, seed=1)
+        start = time.perf_counter()
+        metrics = load_metrics(path)
+        print(f"reload + {args.append} new rows:     {time.perf_counter() - start:8.3f} s")
+        start = time.perf_counter()
+        metrics.table('scenario')
+        print(f"per-scenario table:      {time.perf_counter() - start:8.3f} s  ({metrics.rows} rows)")
+
+
+if __name__ == '__main__':
+    main()
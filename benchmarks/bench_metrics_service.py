@@ -0,0 +1,186 @@
+"""
+Load test: metrics_service latency under concurrent clients.
+
+Writes a --rows results CSV spread over --days sessions, serves
+metrics_service on an ephemeral port (or targets --url), and runs --clients
+threads issuing --requests hit-rate queries each over a mix of symbols,
+scenarios, date ranges and last-N-session windows. Reports p50/p99 latency
+and throughput for plain requests and for revalidations that send the ETag
+back (304s). For scale, one pandas load-and-filter per query is timed too.
+
+    python benchmarks/bench_metrics_service.py --rows 500000 --clients 16
+"""
+import argparse
+import http.client
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+SYMBOLS = ['/NQ', '/ES', '/CL', '/GC']
+SCENARIOS = ['fade', 'breakout', 'range', 'trend']
+
+
+def day(i):
+    return f"{2000 + i // 336}-{1 + i // 28 % 12:02d}-{1 + i % 28:02d}"
+
+
+def write_rows(path, n, days, seed=0):
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        f.write("date,symbol,predicted,actual,scenario,result,version\n")
+        for i in range(n):
+            f.write(f"{day(i * days // n)},{rng.choice(SYMBOLS)},23650,23600,"
+                    f"{rng.choice(SCENARIOS)},{rng.choice(['hit', 'miss'])},v1.0\n")
+
+
+def queries(days, n=500, seed=1):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        query = f"/metrics/hit_rate?symbol={rng.choice(SYMBOLS)}&scenario={rng.choice(SCENARIOS + ['*'])}"
+        if rng.random() < 0.5:
+            query += f"&last={rng.choice([5, 20, 60, 250])}"
+        else:
+            a, b = sorted(rng.sample(range(days), 2))
+            query += f"&start={day(a)}&end={day(b)}"
+        out.append(query)
+    return out
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def load(host, port, paths, clients, per_client, conditional):
+    latencies = []
+    lock = threading.Lock()
+    etags = {}
+    if conditional:
+        conn = http.client.HTTPConnection(host, port)
+        for path in set(paths):
+            conn.request('GET', path)
+            response = conn.getresponse()
+            response.read()
+            etags[path] = response.getheader('ETag')
+            if response.will_close:
+                conn.close()
+                conn = http.client.HTTPConnection(host, port)
+        conn.close()
+
+    def client(seed):
+        rng = random.Random(seed)
+        conn = http.client.HTTPConnection(host, port)
+        mine = []
+        for _ in range(per_client):
+            path = rng.choice(paths)
+            headers = {'If-None-Match': etags[path]} if conditional else {}
+            start = time.perf_counter()
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            mine.append(time.perf_counter() - start)
+            if response.status not in (200, 304):
+                raise RuntimeError(f"{path}: HTTP {response.status}")
+            if response.will_close:
+                conn.close()
+                conn = http.client.HTTPConnection(host, port)
+        conn.close()
+        with lock:
+            latencies.extend(mine)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def report(label, latencies, elapsed):
+    print(f"{label:<26} p50 {percentile(latencies, 0.50) * 1e3:7.2f} ms  p99 {percentile(latencies, 0.99) * 1e3:7.2f} ms"
+          f"  mean {statistics.fmean(latencies) * 1e3:7.2f} ms  {len(latencies) / elapsed:8.0f} req/s")
+
+
+def pandas_query(path, symbol, scenario, start, end):
+    import pandas as pd
+    df = pd.read_csv(path)
+    df = df[(df['symbol'] == symbol) & (df['scenario'] == scenario) & (df['date'] >= start) & (df['date'] <= end)]
+    return len(df), int((df['result'] == 'hit').sum())
+
+
+def serve(path, cache_size, ready):
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    from werkzeug.serving import make_server
+    import metrics_service
+    from prediction_logger.aggregates import DailyAggregates
+    metrics_service.aggregates = DailyAggregates(path)
+    metrics_service.responses.resize(cache_size)
+    start = time.perf_counter()
+    metrics_service.aggregates.refresh()
+    server = make_server('127.0.0.1', 0, metrics_service.app, threaded=True)
+    ready.put((server.server_address[1], time.perf_counter() - start))
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the metrics query service.")
+    parser.add_argument('--rows', type=int, default=500_000)
+    parser.add_argument('--days', type=int, default=2_500)
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=500, help="requests per client")
+    parser.add_argument('--url', help="benchmark a running service instead of an in-process one")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    # werkzeug logs every request at INFO on its own logger
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+    paths = queries(args.days)
+    if args.url:
+        url = urlsplit(args.url)
+        for conditional in (False, True):
+            report('conditional (304)' if conditional else 'plain',
+                   *load(url.hostname, url.port or 80, paths, args.clients, args.requests, conditional))
+        return
+
+    import multiprocessing
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'results.csv')
+        write_rows(path, args.rows, args.days)
+        start = time.perf_counter()
+        pandas_query(path, '/NQ', 'breakout', day(0), day(args.days // 2))
+        print(f"{'pandas load + filter':<26} {(time.perf_counter() - start) * 1e3:8.1f} ms per query")
+        print(f"{args.clients} clients x {args.requests} requests, {len(paths)} distinct queries")
+        for cache_size in (4096, 0):
+            # The server gets its own process so client threads do not compete with it for the GIL
+            ready = multiprocessing.Queue()
+            server = multiprocessing.Process(target=serve, args=(path, cache_size, ready), daemon=True)
+            server.start()
+            try:
+                port, build = ready.get(timeout=600)
+                suffix = '' if cache_size else ', no response cache'
+                if cache_size:
+                    print(f"{'index build':<26} {build * 1e3:8.1f} ms ({args.rows} rows, {args.days} days)")
+                    report('first pass (cold cache)',
+                           *load('127.0.0.1', port, paths, args.clients, args.requests // 5, False))
+                report(f'plain{suffix}', *load('127.0.0.1', port, paths, args.clients, args.requests, False))
+                if cache_size:
+                    report('conditional (304)', *load('127.0.0.1', port, paths, args.clients, args.requests, True))
+            finally:
+                server.terminate()
+                server.join()
+
+if __name__ == '__main__':
+    main()
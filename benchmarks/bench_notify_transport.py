@@ -0,0 +1,71 @@
+"""
+Benchmark: pooled keep-alive webhook transport vs one-shot requests.post().
+
+Starts a local HTTP/1.1 webhook, sends a burst of notifications both ways
+and prints per-post latency plus the transport's connection-reuse counters.
+
+    python benchmarks/bench_notify_transport.py --posts 500
+"""
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled notification transport.")
+    parser.add_argument('--posts', type=int, default=500)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    import requests
+    from prediction_logger.transport import HTTPTransport
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/hook"
+
+    start = time.perf_counter()
+    for i in range(args.posts):
+        requests.post(url, json={'text': f"message {i}"}, timeout=5).raise_for_status()
+    oneshot = time.perf_counter() - start
+
+    transport = HTTPTransport()
+    start = time.perf_counter()
+    for i in range(args.posts):
+        transport.post(url, json={'text': f"message {i}"})
+    pooled = time.perf_counter() - start
+    (stats,) = transport.stats().values()
+    transport.close()
+    server.shutdown()
+
+    print(f"{args.posts} posts")
+    print(f"  one-shot: {1000 * oneshot / args.posts:7.3f} ms/post")
+    print(f"    pooled: {1000 * pooled / args.posts:7.3f} ms/post  "
+          f"({stats['new_connections']} new / {stats['reused_connections']} reused connections, "
+          f"avg {stats['avg_latency_ms']:.3f} ms, max {stats['max_latency_ms']:.3f} ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: per-row append cost of ResultsWriter as the results history grows.
+
+Seeds a results CSV with N rows of history (up to 1M), then times single-row
+appends against it. With the append-only writer the per-row cost stays flat;
+pass --legacy to time the old read_csv/concat/to_csv cycle for comparison.
+
+    python benchmarks/bench_results_store.py
+    python benchmarks/bench_results_store.py --legacy --sizes 1000 10000 100000
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from prediction_logger.results_store import ResultsWriter, RESULT_FIELDS  # noqa: E402
+
+ROW = {
+    'date': '2025-07-31',
+    'symbol': '/NQ',
+    'predicted': 23650.0,
+    'actual': 23500.0,
+    'scenario': 'breakout',
+    'result': 'miss',
+    'version': 'v1.0',
+}
+
+
+def seed_history(path, rows):
+    line = ",".join(str(ROW[field]) for field in RESULT_FIELDS) + "\n"
+    with open(path, 'w') as f:
+        f.write(",".join(RESULT_FIELDS) + "\n")
+        chunk = line * 10000
+        for _ in range(rows // 10000):
+            f.write(chunk)
+        f.write(line * (rows % 10000))
+
+
+def time_appends(path, appends, fsync):
+    start = time.perf_counter()
+    for _ in range(appends):
+        writer = ResultsWriter(path, fsync=fsync)
+        writer.append(ROW)
+        writer.flush()
+    return (time.perf_counter() - start) / appends
+
+
+def time_legacy(path, appends):
+    import pandas as pd
+    start = time.perf_counter()
+    for _ in range(appends):
+        df = pd.read_csv(path)
+        df = pd.concat([df, pd.DataFrame([ROW])], ignore_index=True)
+        df.to_csv(path, index=False)
+    return (time.perf_counter() - start) / appends
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark results appends against growing history.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[0, 1000, 10000, 100000, 1000000])
+    parser.add_argument('--appends', type=int, default=200, help='Appends timed per history size')
+    parser.add_argument('--no-fsync', action='store_true', help='Skip fsync to isolate CPU cost')
+    parser.add_argument('--legacy', action='store_true', help='Also time the read/concat/rewrite cycle')
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"{'history rows':>14} {'append us/row':>14}" + (f" {'legacy us/row':>14}" if args.legacy else ""))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'results.csv')
+        for size in args.sizes:
+            seed_history(path, size)
+            per_row = time_appends(path, args.appends, fsync=not args.no_fsync)
+            line = f"{size:>14} {per_row * 1e6:>14.1f}"
+            if args.legacy:
+                seed_history(path, size)
+                legacy = time_legacy(path, max(1, args.appends // 20))
+                line += f" {legacy * 1e6:>14.1f}"
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: TensorModel.predict_batch() vs one predict() call per row.
+
+Uses a small MLP on the [resistance, close] features the logger feeds the
+model and times --rows rows through the per-row path and the batched path
+at a few batch sizes and thread counts. Outputs must match. With --export
+the model is also saved, exported to TorchScript, and cold-loaded in fresh
+interpreters through both backends to compare load time and batch latency.
+
+    python benchmarks/bench_tensor_batch.py --rows 20000 --export
+"""
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+
+COLD_LOAD = """
+import logging, sys, time
+logging.basicConfig(level=logging.WARNING)
+began = time.perf_counter()
+sys.path.insert(0, {root!r})
+from prediction_logger.tensor_model import TensorModel
+model = TensorModel({path!r}, prefer_exported={exported})
+model.load()
+model.predict_batch([[23600.0, 23550.0]] * {rows})
+first = model.latency_report()['batch_ms_avg']
+for _ in range(5):
+    model.predict_batch([[23600.0, 23550.0]] * {rows})
+report = model.latency_report()
+print(f"{{report['backend']:>11}}: import+load {{(time.perf_counter() - began) * 1000:7.1f}} ms  "
+      f"load {{report['load_ms']:6.1f}} ms  first-call batch {{first:.3f}} ms  "
+      f"avg batch {{report['batch_ms_avg']:.3f}} ms over {{report['batches']}}")
+"""
+
+
+def cold_loads(model, rows):
+    import torch
+    from prediction_logger.tensor_model import export_model
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'model.pt')
+        torch.save(model, path)
+        export_model(path)
+        for exported in (False, True):
+            subprocess.run([sys.executable, '-c', COLD_LOAD.format(root=ROOT, path=path, exported=exported,
+                                                                    rows=rows)], check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched tensor model inference.")
+    parser.add_argument('--rows', type=int, default=20_000)
+    parser.add_argument('--hidden', type=int, default=64)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[256, 1024, 4096])
+    parser.add_argument('--export', action='store_true', help='Also compare eager vs TorchScript cold loads')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    import numpy as np
+    import torch
+    from prediction_logger.tensor_model import TensorModel
+    torch.manual_seed(0)
+    model = TensorModel('bench.pt')
+    model.model = torch.nn.Sequential(torch.nn.Linear(2, args.hidden), torch.nn.ReLU(),
+                                      torch.nn.Linear(args.hidden, 1)).eval()
+    rng = np.random.default_rng(0)
+    features = np.column_stack([rng.uniform(23000, 24000, args.rows),
+                                rng.uniform(23000, 24000, args.rows)]).astype(np.float32)
+
+    start = time.perf_counter()
+    expected = [model.predict(row.tolist()) for row in features]
+    elapsed = time.perf_counter() - start
+    print(f"{'per-row':>22}: {elapsed:7.3f} s  {1e6 * elapsed / args.rows:7.2f} us/row")
+    for threads in args.threads:
+        for batch_size in args.batch_sizes:
+            start = time.perf_counter()
+            result = model.predict_batch(features, batch_size=batch_size, num_threads=threads)
+            elapsed = time.perf_counter() - start
+            print(f"batch {batch_size:>5} x {threads} thr: {elapsed:7.3f} s  {1e6 * elapsed / args.rows:7.2f} us/row")
+            assert np.allclose(result, expected, rtol=1e-4)
+    if args.export:
+        cold_loads(model.model, args.rows)
+
+
+if __name__ == '__main__':
+    main()
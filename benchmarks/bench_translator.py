@@ -0,0 +1,55 @@
+"""
+Benchmark: concurrent, cached LLM summaries vs one blocking call per row.
+
+Runs --rows summaries against a local fake client that sleeps --latency
+seconds per request (no network or API key needed): serially through
+summarize_tensor_output, concurrently through summarize_many, and again
+through summarize_many with a warm on-disk cache.
+
+    python benchmarks/bench_translator.py --rows 200 --latency 0.05 --concurrency 16
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent cached LLM summarization.")
+    parser.add_argument('--rows', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds per fake completion')
+    parser.add_argument('--concurrency', type=int, default=16)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    from prediction_logger.translator import Translator
+
+    def fake(**request):
+        time.sleep(args.latency)
+        return "summary"
+
+    items = [([float(i)], {'scenario': 'fade', 'resistance': 23650 + i}) for i in range(args.rows)]
+    with tempfile.TemporaryDirectory() as cache_dir:
+        serial = Translator(client=fake)
+        concurrent = Translator(client=fake, max_concurrency=args.concurrency, cache_dir=cache_dir)
+        runs = (
+            ('serial', lambda: [serial.summarize_tensor_output(*item) for item in items]),
+            (f'concurrent x{args.concurrency}', lambda: concurrent.summarize_many(items)),
+            ('cached rerun', lambda: concurrent.summarize_many(items)),
+        )
+        for name, fn in runs:
+            start = time.perf_counter()
+            summaries = fn()
+            elapsed = time.perf_counter() - start
+            assert summaries == ["summary"] * args.rows
+            print(f"{name:>16}: {elapsed:7.3f} s  {1000 * elapsed / args.rows:7.2f} ms/row")
+        print(f"stats: {concurrent.stats}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""
+Benchmark: streaming, chunked validate_results() on a large results file.
+
+Generates a results CSV (a few rows have missing fields), then validates it
+in a child process and reports wall time, throughput and peak RSS. Peak
+memory stays bounded by VALIDATION_CHUNK_SIZE rather than the file size.
+results_metadata.yaml is typed, so "streaming" runs the compiled SchemaPlan
+(number, date and enum checks). Pass --compare to also time presence-only
+checks and the same typed checks as a per-row Python loop, and --legacy for
+the old whole-file load + iterrows() loop.
+
+    python benchmarks/bench_validate_results.py --rows 2000000
+    python benchmarks/bench_validate_results.py --rows 40000000      # ~2 GB
+    python benchmarks/bench_validate_results.py --rows 200000 --legacy
+    python benchmarks/bench_validate_results.py --rows 2000000 --compare
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+HEADER = "date,symbol,predicted,actual,scenario,result,version\n"
+LINE = "2025-07-31,/NQ,23650.0,23500.0,breakout,miss,v1.0\n"
+BAD_LINE = "2025-07-31,,23650.0,23500.0,breakout,,v1.0\n"
+
+
+def generate(path, rows):
+    block = LINE * 9999 + BAD_LINE
+    with open(path, 'w') as f:
+        f.write(HEADER)
+        for _ in range(rows // 10000):
+            f.write(block)
+        f.write(LINE * (rows % 10000))
+
+
+def streaming(results_path, schema_path, chunk_size):
+    os.environ['RESULTS_FILE_PATH'] = results_path
+    os.environ['SCHEMA_FILE_PATH'] = schema_path
+    os.environ['VALIDATION_CHUNK_SIZE'] = str(chunk_size)
+    from validate_results import validate_results
+    logging.getLogger("validate_results").disabled = True
+    report, code = validate_results()
+    return report["valid_rows"], report["invalid_rows"]
+
+
+def legacy(results_path, schema_path, chunk_size):
+    import pandas as pd
+    import yaml
+    with open(results_path) as f:
+        from io import StringIO
+        df = pd.read_csv(StringIO(f.read()))
+    from validate_results import schema_field_names
+    with open(schema_path) as f:
+        fields = schema_field_names(yaml.safe_load(f))
+    valid = invalid = 0
+    for index, row in df.iterrows():
+        if any(pd.isna(row.get(field)) for field in fields):
+            invalid += 1
+        else:
+            valid += 1
+    return valid, invalid
+
+
+def presence(results_path, schema_path, chunk_size):
+    """The same streaming validation with the schema's types dropped (presence checks only)."""
+    import yaml
+    from validate_results import schema_field_names
+    with open(schema_path) as f:
+        fields = schema_field_names(yaml.safe_load(f))
+    plain = os.path.join(os.path.dirname(results_path), 'presence_schema.yaml')
+    with open(plain, 'w') as f:
+        yaml.safe_dump({'fields': fields}, f)
+    return streaming(results_path, plain, chunk_size)
+
+
+def rowwise(results_path, schema_path, chunk_size):
+    """The typed checks as a per-row Python loop over csv.DictReader, for comparison."""
+    import csv
+    import re
+    import yaml
+    from datetime import date
+    import validate_results as vr
+    with open(schema_path) as f:
+        plan = vr.SchemaPlan.compile(yaml.safe_load(f))
+    patterns = {kind: re.compile(pattern) for kind, pattern in vr.PATTERNS.items()}
+    valid = invalid = 0
+    with open(results_path, newline='') as f:
+        for row in csv.DictReader(f):
+            ok = True
+            for rule in plan.rules:
+                value = row.get(rule.name)
+                if value is None or value in vr.PANDAS_NA_VALUES:
+                    ok = False
+                elif rule.kind == 'enum':
+                    ok = value in rule.values
+                elif rule.kind in patterns:
+                    ok = patterns[rule.kind].fullmatch(value) is not None
+                    if ok and rule.kind == 'date':
+                        try:
+                            date.fromisoformat(value[:10])
+                        except ValueError:
+                            ok = False
+                if not ok:
+                    break
+            valid += ok
+            invalid += not ok
+    return valid, invalid
+
+
+def _child(name, results_path, schema_path, chunk_size, queue):
+    try:
+        import validate_results  # noqa: F401 -- keep import time out of the measurement
+        start = time.perf_counter()
+        counts = globals()[name](results_path, schema_path, chunk_size)
+        elapsed = time.perf_counter() - start
+        queue.put((elapsed, counts, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+    except BaseException as e:
+        queue.put(e)
+        raise
+
+
+def measure(name, results_path, schema_path, chunk_size):
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_child, args=(name, results_path, schema_path, chunk_size, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming results validation.")
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    parser.add_argument('--legacy', action='store_true', help='Also time the whole-file iterrows() validator')
+    parser.add_argument('--compare', action='store_true',
+                        help='Also time presence-only checks and the typed checks as a Python row loop')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results_path = os.path.join(tmp, 'results.csv')
+        schema_path = os.path.join(ROOT, 'results_metadata.yaml')
+        generate(results_path, args.rows)
+        size_mb = os.path.getsize(results_path) / 1e6
+        print(f"{args.rows} rows, {size_mb:.0f} MB, chunk size {args.chunk_size}")
+        modes = ['streaming'] + (['presence', 'rowwise'] if args.compare else []) + (['legacy'] if args.legacy else [])
+        for name in modes:
+            elapsed, (valid, invalid), maxrss_kb = measure(name, results_path, schema_path, args.chunk_size)
+            print(f"{name:>10}: {elapsed:8.2f} s  {args.rows / elapsed / 1e6:6.2f} M rows/s  "
+                  f"peak RSS {maxrss_kb / 1024:7.0f} MB  (valid={valid}, invalid={invalid})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,17 @@
+# Production serving for webhook_receiver: gunicorn -c gunicorn.conf.py
+# (pip install -e .[webhook]). Validation runs as background jobs shared by
+# all workers through VALIDATION_JOBS_DIR, so requests return in milliseconds
+# and any worker can answer status queries.
+import multiprocessing
+import os
+
+wsgi_app = "webhook_receiver:app"
+bind = f"{os.getenv('WEBHOOK_HOST', '0.0.0.0')}:{os.getenv('WEBHOOK_PORT', 8080)}"
+workers = int(os.getenv("WEBHOOK_WORKERS", min(2 * multiprocessing.cpu_count() + 1, 8)))
+# Threaded workers keep serving (and heartbeating) while one of their threads runs a validation
+worker_class = "gthread"
+threads = int(os.getenv("WEBHOOK_THREADS", 4))
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+accesslog = "-"
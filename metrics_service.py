@@ -0,0 +1,81 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+from flask import Flask, Response, jsonify, request
+from prediction_logger.aggregates import DailyAggregates
+from prediction_logger.cache import LRUCache
+from prediction_logger.metrics import ALL
+
+app = Flask(__name__)
+RESULTS_FILE_PATH = os.getenv("RESULTS_FILE_PATH", "results.csv")
+# Read-only: answers come from per-day prefix sums, refreshed from the file's appended tail
+aggregates = DailyAggregates(RESULTS_FILE_PATH, os.getenv("RESULTS_BACKEND") or None)
+# Rendered bodies keyed by (results version, path, query); a new version never hits stale entries
+responses = LRUCache(int(os.getenv("METRICS_RESPONSE_CACHE_SIZE", 4096)))
+
+
+def _date_arg(name):
+    value = request.args.get(name)
+    if value:
+        datetime.strptime(value, "%Y-%m-%d")
+    return value or None
+
+
+def _cached(compute):
+    """
+    Serve compute() as JSON with an ETag derived from the results version and
+    the request: a matching If-None-Match gets 304, otherwise the body comes
+    from the response cache or is computed once for this version.
+    """
+    version = aggregates.refresh()
+    key = (request.path, tuple(sorted(request.args.items(multi=True))))
+    etag = hashlib.sha256(repr((version, key)).encode()).hexdigest()[:32]
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        body = responses.get((version, key))
+        if body is None:
+            try:
+                body = json.dumps(compute())
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            responses.put((version, key), body)
+        response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+@app.route("/metrics/hit_rate")
+def hit_rate():
+    """?symbol=&scenario=&start=&end=&last=&p= -> rows, hits, hit rate and p-value."""
+    def compute():
+        last = request.args.get("last", type=int)
+        if last is not None and last <= 0:
+            raise ValueError("last must be a positive number of sessions")
+        return aggregates.query(request.args.get("symbol", ALL), request.args.get("scenario", ALL),
+                                _date_arg("start"), _date_arg("end"), last, request.args.get("p", 0.5, type=float))
+    return _cached(compute)
+
+
+@app.route("/metrics/daily")
+def daily():
+    """?symbol=&scenario=&start=&end= -> per-day rows and hits."""
+    return _cached(lambda: aggregates.daily(request.args.get("symbol", ALL), request.args.get("scenario", ALL),
+                                            _date_arg("start"), _date_arg("end")))
+
+
+@app.route("/metrics/keys")
+def keys():
+    return _cached(aggregates.keys)
+
+
+@app.route("/health")
+def health():
+    return jsonify({"status": "ok", "version": aggregates.refresh(), "rows": aggregates.rows,
+                    "response_cache": responses.stats()}), 200
+
+
+if __name__ == "__main__":
+    app.run(port=int(os.getenv("METRICS_PORT", 8082)), threaded=True)
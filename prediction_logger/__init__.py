@@ -1 +1,30 @@
-from pathlib import Path"""Prediction vs Reality Logger package.This package provides tools for logging and analyzing predictions against actual market data."""from .version import __version__from .logger import runfrom .cli import main__all__ = ['__version__', 'run', 'main']
\ No newline at end of file
+from pathlib import Path
+"""Prediction vs Reality Logger package.
+
+This package provides tools for logging and analyzing predictions against actual market data.
+"""
+from .version import __version__
+
+__all__ = ['__version__', 'run', 'main', 'evaluate_scenario', 'evaluate_scenarios']
+
+# Public names are imported on first access so `import prediction_logger` (and
+# `python -m prediction_logger.cli --help`) does not pay for numpy/pydantic/requests
+_LAZY = {
+    'run': 'logger',
+    'main': 'cli',
+    'evaluate_scenario': 'evaluation',
+    'evaluate_scenarios': 'evaluation',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        value = getattr(importlib.import_module(f'.{_LAZY[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
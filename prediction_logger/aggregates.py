@@ -0,0 +1,238 @@
+import bisect
+import csv
+import io
+import os
+import threading
+from collections import Counter
+from .metrics import ALL, BULK_BYTES, binomial_pvalue
+from .results_store import prefix_hash
+
+
+class _DailySeries:
+    """
+    Days of one (symbol, scenario) series in sorted order with prefix sums
+    of their counts and hits: counts[i] is the number of rows on days[:i].
+    A date-range total is two bisects and two subtractions.
+    """
+    __slots__ = ('days', 'counts', 'hits')
+
+    def __init__(self):
+        self.days = []
+        self.counts = [0]
+        self.hits = [0]
+
+    def add(self, day: str, count: int, hits: int):
+        days = self.days
+        if not days or day > days[-1]:
+            days.append(day)
+            self.counts.append(self.counts[-1] + count)
+            self.hits.append(self.hits[-1] + hits)
+        elif day == days[-1]:
+            self.counts[-1] += count
+            self.hits[-1] += hits
+        else:
+            # A late row for an earlier day: rebuild the prefix sums from there on
+            i = bisect.bisect_left(days, day)
+            per_day = [(self.counts[j + 1] - self.counts[j], self.hits[j + 1] - self.hits[j])
+                       for j in range(i, len(days))]
+            if days[i] == day:
+                per_day[0] = (per_day[0][0] + count, per_day[0][1] + hits)
+            else:
+                days.insert(i, day)
+                per_day.insert(0, (count, hits))
+            del self.counts[i + 1:], self.hits[i + 1:]
+            for day_count, day_hits in per_day:
+                self.counts.append(self.counts[-1] + day_count)
+                self.hits.append(self.hits[-1] + day_hits)
+
+    def bounds(self, start: str | None = None, end: str | None = None):
+        i = bisect.bisect_left(self.days, start) if start else 0
+        j = bisect.bisect_right(self.days, end) if end else len(self.days)
+        return i, max(i, j)
+
+    def total(self, start: str | None = None, end: str | None = None):
+        """(rows, hits, days with rows) over the inclusive [start, end] date range."""
+        i, j = self.bounds(start, end)
+        return self.counts[j] - self.counts[i], self.hits[j] - self.hits[i], j - i
+
+
+class DailyAggregates:
+    """
+    Read-only query index over a results file: per-day counts and hits for
+    every (symbol, scenario), per symbol, per scenario and overall, stored as
+    prefix sums so any date-range aggregate is answered in O(log n).
+
+    refresh() keeps it current: an unchanged file costs one stat, appended
+    rows are read from the last byte offset (as RollingMetrics.refresh does),
+    and a rewritten file is re-indexed from scratch. version identifies the
+    indexed content and changes whenever the results do.
+    """
+
+    def __init__(self, results_path: str, backend: str | None = None):
+        self.results_path = results_path
+        self.backend = backend
+        self.series = {}
+        self.rows = 0
+        self.offset = 0
+        self.header = None
+        self.version = 'empty'
+        self._stat = None
+        self._lock = threading.RLock()
+
+    def _reset(self):
+        self.series = {}
+        self.rows = 0
+        self.offset = 0
+        self.header = None
+
+    def _add(self, counts: Counter):
+        """Fold {(day, symbol, scenario): [rows, hits]} into every series, in day order."""
+        for (day, symbol, scenario), (count, hits) in sorted(counts.items()):
+            for key in ((ALL, ALL), (symbol, ALL), (ALL, scenario), (symbol, scenario)):
+                series = self.series.get(key)
+                if series is None:
+                    series = self.series[key] = _DailySeries()
+                series.add(day, count, hits)
+            self.rows += count
+
+    def _count_lines(self, lines, header) -> Counter:
+        counts = Counter()
+        i_date, i_scenario, i_result = header.index('date'), header.index('scenario'), header.index('result')
+        i_symbol = header.index('symbol') if 'symbol' in header else None
+        needed = max(i_date, i_scenario, i_result)
+        totals = {}
+        for values in csv.reader(lines):
+            if len(values) <= needed:
+                continue
+            symbol = (values[i_symbol] if i_symbol is not None and i_symbol < len(values) else '') or '/NQ'
+            key = (values[i_date][:10], symbol, values[i_scenario])
+            total = totals.get(key)
+            if total is None:
+                total = totals[key] = [0, 0]
+            total[0] += 1
+            total[1] += values[i_result].strip().lower() == 'hit'
+        counts.update(totals)
+        return counts
+
+    @staticmethod
+    def _count_frame(frame) -> dict:
+        frame = frame.assign(
+            date=frame['date'].astype(str).str[:10],
+            symbol=frame['symbol'].fillna('').astype(str).replace('', '/NQ') if 'symbol' in frame else '/NQ',
+            scenario=frame['scenario'].fillna('').astype(str),
+            hit=(frame['result'].astype(str).str.strip().str.lower() == 'hit').astype(int),
+        )
+        grouped = frame.groupby(['date', 'symbol', 'scenario'], sort=False)['hit'].agg(['size', 'sum'])
+        return {key: [int(count), int(hits)] for key, (count, hits) in grouped.iterrows()}
+
+    def refresh(self) -> str:
+        """Bring the index up to date with the results file and return its version."""
+        with self._lock:
+            from .results_store import read_results, results_backend
+            path = self.results_path
+            if results_backend(path, self.backend) == 'parquet':
+                stat = _tree_stat(path)
+                if stat != self._stat:
+                    self._reset()
+                    frame = read_results(path, columns=['date', 'symbol', 'scenario', 'result'], backend='parquet')
+                    self._add(self._count_frame(frame))
+                    self._stat = stat
+                    self.version = f"p{abs(hash(stat)):x}"
+                return self.version
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                self._reset()
+                self._stat, self.version = None, 'empty'
+                return self.version
+            stat = (st.st_size, st.st_mtime_ns)
+            if stat == self._stat:
+                return self.version
+            if self.offset and (self.offset > st.st_size or prefix_hash(path, self.offset) != self._prefix):
+                self._reset()
+                # A new version even if no complete line follows yet, so cached answers for the old data go stale
+                self.version = f"0-{st.st_size:x}-{st.st_mtime_ns:x}"
+            with open(path, 'rb') as f:
+                f.seek(self.offset)
+                data = f.read(st.st_size - self.offset)
+            end = data.rfind(b'\n') + 1
+            if end:
+                lines = io.StringIO(data[:end].decode('utf-8'), newline='')
+                if self.offset == 0:
+                    self.header = next(csv.reader([lines.readline()]))
+                if {'date', 'scenario', 'result'} <= set(self.header):
+                    if end > BULK_BYTES:
+                        import pandas as pd
+                        usecols = [col for col in ('date', 'symbol', 'scenario', 'result') if col in self.header]
+                        counts = self._count_frame(pd.read_csv(lines, header=None, names=self.header, usecols=usecols,
+                                                               dtype=str, keep_default_na=False))
+                    else:
+                        counts = self._count_lines(lines, self.header)
+                    self._add(counts)
+                self.offset += end
+                self._prefix = prefix_hash(path, self.offset)
+                self.version = f"{self.offset:x}-{self._prefix[:16]}"
+            self._stat = stat
+            return self.version
+
+    def _sessions_start(self, symbol: str, last: int):
+        """First day of the symbol's last `last` sessions (days with any row)."""
+        series = self.series.get((symbol, ALL))
+        if series is None or last <= 0 or not series.days:
+            return None
+        return series.days[max(0, len(series.days) - last)]
+
+    def query(self, symbol: str = ALL, scenario: str = ALL, start: str | None = None, end: str | None = None,
+              last: int | None = None, p: float = 0.5) -> dict:
+        """
+        Rows, hits, hit rate and binomial p-value of a series over the
+        inclusive [start, end] range (YYYY-MM-DD), or over the symbol's last
+        `last` sessions.
+        """
+        with self._lock:
+            if last:
+                start = self._sessions_start(symbol, last) or start
+            series = self.series.get((symbol, scenario))
+            count, hits, days = series.total(start, end) if series else (0, 0, 0)
+        return {
+            'symbol': symbol,
+            'scenario': scenario,
+            'start': start,
+            'end': end,
+            'days': days,
+            'count': count,
+            'hits': hits,
+            'hit_rate': hits / count if count else None,
+            'p_value': binomial_pvalue(hits, count, p),
+        }
+
+    def daily(self, symbol: str = ALL, scenario: str = ALL, start: str | None = None,
+              end: str | None = None) -> list:
+        """Per-day rows and hits of a series over [start, end]."""
+        with self._lock:
+            series = self.series.get((symbol, scenario))
+            if series is None:
+                return []
+            i, j = series.bounds(start, end)
+            return [{'date': series.days[k], 'count': series.counts[k + 1] - series.counts[k],
+                     'hits': series.hits[k + 1] - series.hits[k]} for k in range(i, j)]
+
+    def keys(self) -> dict:
+        with self._lock:
+            return {
+                'symbols': sorted({symbol for symbol, _ in self.series if symbol != ALL}),
+                'scenarios': sorted({scenario for _, scenario in self.series if scenario != ALL}),
+                'rows': self.rows,
+            }
+
+
+def _tree_stat(path: str):
+    """(files, total size, newest mtime) of a Parquet dataset directory."""
+    files = size = newest = 0
+    for root, _, names in os.walk(path):
+        for name in names:
+            st = os.stat(os.path.join(root, name))
+            files += 1
+            size += st.st_size
+            newest = max(newest, st.st_mtime_ns)
+    return files, size, newest
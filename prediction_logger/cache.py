@@ -0,0 +1,195 @@
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from .sources import ActualsSource, ForecastSource
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded mapping that evicts the least recently used
+    entry and counts hits, misses and evictions.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached value or None, updating recency and hit/miss counts."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def resize(self, maxsize: int):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+
+
+class _CachedSource:
+    """
+    Shared logic for the cached wrappers. Entries are keyed on the wrapped
+    source's file for the date plus that file's (mtime, size), so rewriting a
+    file invalidates its entry without any explicit purge. Sources without a
+    path_for(date) method are passed through uncached.
+    """
+
+    def __init__(self, source, cache: LRUCache | None = None):
+        self.source = source
+        self.cache = cache if cache is not None else LRUCache()
+
+    def _key(self, date):
+        path_for = getattr(self.source, 'path_for', None)
+        if path_for is None:
+            return None
+        path = path_for(date)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (type(self.source).__name__, getattr(self.source, 'symbol', None), date.strftime("%Y-%m-%d"),
+                path, st.st_mtime_ns, st.st_size)
+
+    def _cached(self, date, load):
+        key = self._key(date)
+        if key is None:
+            return load(date)
+        value = self.cache.get(key)
+        if value is None:
+            value = load(date)
+            self.cache.put(key, value)
+        # Hand out copies so callers that annotate a result don't alter the cache
+        return dict(value)
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+class CachedForecastSource(_CachedSource, ForecastSource):
+    """LRU cache in front of any ForecastSource, invalidated by file mtime/size."""
+
+    def load(self, date: datetime) -> dict:
+        return self._cached(date, self.source.load)
+
+    def load_range(self, start: datetime, end: datetime) -> dict:
+        """
+        Serve cached dates from memory and load the rest with the wrapped
+        source's load_range (or load) over the smallest window covering them.
+        """
+        loaded, missing = {}, []
+        day = start
+        while day <= end:
+            key = self._key(day)
+            value = self.cache.get(key) if key is not None else None
+            if value is not None:
+                loaded[day.strftime("%Y-%m-%d")] = dict(value)
+            elif key is not None:
+                missing.append((day, key))
+            day += timedelta(days=1)
+        if missing:
+            if hasattr(self.source, 'load_range'):
+                fresh = self.source.load_range(missing[0][0], missing[-1][0])
+            else:
+                fresh = {}
+                for day, _ in missing:
+                    try:
+                        fresh[day.strftime("%Y-%m-%d")] = self.source.load(day)
+                    except FileNotFoundError:
+                        continue
+                    except Exception as e:
+                        fresh[day.strftime("%Y-%m-%d")] = e
+            for day, key in missing:
+                value = fresh.get(day.strftime("%Y-%m-%d"))
+                if value is None:
+                    continue
+                if not isinstance(value, Exception):
+                    self.cache.put(key, value)
+                    value = dict(value)
+                loaded[day.strftime("%Y-%m-%d")] = value
+        return dict(sorted(loaded.items()))
+
+    def get_actuals(self, date):
+        return self.source.get_actuals(date)
+
+    @property
+    def symbol(self):
+        return getattr(self.source, 'symbol', None)
+
+    @property
+    def actuals_source(self):
+        return getattr(self.source, 'actuals_source', None)
+
+
+class CachedActualsSource(_CachedSource, ActualsSource):
+    """LRU cache in front of any ActualsSource, invalidated by file mtime/size."""
+
+    def get_actuals(self, date) -> dict:
+        return self._cached(date, self.source.get_actuals)
+
+    @property
+    def symbol(self):
+        return getattr(self.source, 'symbol', None)
+
+    def for_symbol(self, symbol):
+        return self if symbol == self.symbol else CachedActualsSource(self.source.for_symbol(symbol), self.cache)
+
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache(name: str, maxsize: int = DEFAULT_CACHE_SIZE) -> LRUCache:
+    """Return the process-wide cache with this name, so it outlives individual sources."""
+    with _shared_lock:
+        cache = _shared.get(name)
+        if cache is None:
+            cache = _shared[name] = LRUCache(maxsize)
+        elif cache.maxsize != maxsize:
+            cache.resize(maxsize)
+        return cache
+
+
+def cache_stats() -> dict:
+    """Hit/miss counters for every shared cache."""
+    with _shared_lock:
+        caches = dict(_shared)
+    return {name: cache.stats() for name, cache in caches.items()}
@@ -1,49 +1,159 @@
 import click
 import logging
-from dateutil.parser import parse
-from .logger import run
+from datetime import datetime
 from pathlib import Path
 
+# Heavy modules (logger and its numpy/pydantic/requests dependencies, torch,
+# dateutil) are imported inside the commands that need them, so --help and
+# --dry-run start fast
+
 def setup_logging(verbose):
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(level=level, format='[%(levelname)s] %(message)s')
 
-@click.command(context_settings=dict(help_option_names=['-h', '--help']))
+def load_tensor_model(cfg):
+    """Load the configured tensor model (or its exported artifact)."""
+    from .tensor_model import TensorModel, DEFAULT_BATCH_SIZE
+    tensor_model = TensorModel(cfg.get('tensor_model_path', 'model.pt'),
+                               batch_size=int(cfg.get('tensor_batch_size', DEFAULT_BATCH_SIZE)),
+                               num_threads=cfg.get('tensor_num_threads'))
+    tensor_model.load()
+    return tensor_model
+
+@click.group(invoke_without_command=True, context_settings=dict(help_option_names=['-h', '--help']))
 @click.option('--date', help='Date for forecast (YYYY-MM-DD)', default=None)
+@click.option('--start', help='Backfill start date (YYYY-MM-DD), evaluated in one run', default=None)
+@click.option('--end', help='Backfill end date (YYYY-MM-DD), defaults to today', default=None)
+@click.option('--symbol', 'symbols', multiple=True, help='Symbol to evaluate (repeatable); defaults to config symbols')
 @click.option('--dry-run', is_flag=True, help='Preview without writing outputs')
 @click.option('--verbose', is_flag=True, help='Enable verbose logging')
 @click.option('--tensor', is_flag=True, help='Enable tensor model integration')
-@click.option('--actuals', type=click.Choice(['stub', 'file'], case_sensitive=False), default='stub', help='Actuals source type')
-def main(date, dry_run, verbose, tensor, actuals):
+@click.option('--summarize', is_flag=True, help='Add LLM summaries of the tensor outputs (needs --tensor)')
+@click.option('--actuals', type=click.Choice(['stub', 'file', 'ohlc'], case_sensitive=False), default='stub', help='Actuals source type')
+@click.pass_context
+def main(ctx, date, start, end, symbols, dry_run, verbose, tensor, summarize, actuals):
     """
     CLI for Prediction vs Reality Logger.
     Use --help to see all options.
     """
     setup_logging(verbose)
+    if ctx.invoked_subcommand is not None:
+        return
+    if date and (start or end):
+        raise click.UsageError("--date cannot be combined with --start/--end")
+    if end and not start:
+        raise click.UsageError("--end requires --start")
     try:
-        logging.debug(f"CLI invoked for date={date}, dry_run={dry_run}, tensor={tensor}, actuals={actuals}")
+        logging.debug(f"CLI invoked for date={date}, start={start}, end={end}, symbols={symbols}, dry_run={dry_run}, tensor={tensor}, summarize={summarize}, actuals={actuals}")
         if dry_run:
             logging.info("DRY RUN: exiting without changes")
             return
-        # Import tensor model and actuals source factory if needed
-        tensor_model = None
-        if tensor:
-            from .tensor_model import TensorModel
-            tensor_model = TensorModel('model.pt')  # Path can be made configurable
-            tensor_model.load()
+        from dateutil.parser import parse
+        from .logger import run, run_range
         from .sources import get_actuals_source_from_config
         from .config import load_config
         cfg = load_config()
+        tensor_model = load_tensor_model(cfg) if tensor else None
+        translator = None
+        if summarize:
+            from .translator import get_translator_from_config
+            translator = get_translator_from_config(cfg)
         # Override actuals source type if specified
         if actuals:
             cfg['actuals_source'] = actuals
-        actuals_source = get_actuals_source_from_config(cfg)
-        run(parse(date) if date else None, actuals_source=actuals_source, tensor_model=tensor_model)
+        if symbols or cfg.get('symbols'):
+            from .runner import run_symbols
+            first = parse(start or date) if (start or date) else None
+            last = (parse(end) if end else datetime.now()) if start else first
+            run_symbols(first, last, symbols=list(symbols) or None, cfg=cfg, tensor_model=tensor_model,
+                        translator=translator)
+        elif start:
+            run_range(parse(start), parse(end) if end else datetime.now(),
+                      actuals_source=get_actuals_source_from_config(cfg), tensor_model=tensor_model,
+                      translator=translator)
+        else:
+            run(parse(date) if date else None, actuals_source=get_actuals_source_from_config(cfg),
+                tensor_model=tensor_model, translator=translator)
+        if tensor_model is not None:
+            logging.info(f"Tensor model latency: {tensor_model.latency_report()}")
+        if translator is not None:
+            logging.info(f"LLM summaries: {translator.stats}")
     except Exception as e:
         logging.critical(f"Unhandled error: {e}")
         from .notifications import notify
         notify(f"Critical failure in CLI: {e}")
         raise
 
+@main.command('import-forecasts')
+@click.argument('folder', type=click.Path(exists=True, file_okay=False))
+@click.option('--store', default=None, help='SQLite forecast store to write (defaults to config forecast_store)')
+def import_forecasts(folder, store):
+    """Import a folder of YYYY-MM-DD.json forecasts into the indexed store."""
+    from .forecast_store import import_json_folder
+    if store is None:
+        from .config import load_config
+        store = load_config().get('forecast_store', './forecasts.db')
+    count = import_json_folder(folder, store)
+    click.echo(f"Imported {count} forecast(s) into {store}")
+
+@main.command('export')
+@click.argument('model_path', required=False)
+@click.option('--format', 'fmt', type=click.Choice(['torchscript', 'onnx']), default='torchscript', help='Artifact format')
+@click.option('--output', default=None, help='Artifact path (defaults to MODEL_PATH with a .ts/.onnx suffix)')
+def export(model_path, fmt, output):
+    """Export the tensor model to a TorchScript or ONNX artifact that --tensor loads automatically."""
+    from .tensor_model import export_model
+    if model_path is None:
+        from .config import load_config
+        model_path = load_config().get('tensor_model_path', 'model.pt')
+    path = export_model(model_path, fmt, output)
+    click.echo(f"Exported {model_path} to {path}")
+
+@main.command('serve')
+@click.option('--host', default=None, help='Address for the health/trigger endpoints (default: daemon_host or 127.0.0.1)')
+@click.option('--port', type=int, default=None, help='Port for the health/trigger endpoints (default: daemon_port or 8081)')
+@click.option('--tensor', is_flag=True, help='Load the tensor model once and use it in every cycle')
+def serve(host, port, tensor):
+    """Run resident, evaluating every configured symbol daily at schedule_time."""
+    import signal
+    from .config import load_config
+    from .daemon import Daemon
+    cfg = load_config()
+    tensor_model = load_tensor_model(cfg) if tensor else None
+    daemon = Daemon(cfg, tensor_model=tensor_model, host=host, port=port)
+    signal.signal(signal.SIGTERM, lambda *_: daemon.stop_event.set())
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+@main.command('metrics')
+@click.option('--results', default=None, help='Results file (defaults to config output_csv)')
+@click.option('--by', type=click.Choice(['all', 'scenario', 'symbol', 'symbol_scenario']), default='scenario',
+              help='Series to report')
+def metrics(results, by):
+    """Print hit rates, rolling windows and binomial p-values as JSON, updated incrementally."""
+    import json
+    from .metrics import load_metrics
+    cfg = None
+    if results is None:
+        from .config import load_config
+        cfg = load_config()
+        results = cfg['output_csv']
+    rolling = load_metrics(results, backend=cfg.get('results_backend') if cfg else None)
+    click.echo(json.dumps({'rows': rolling.rows, 'overall': rolling.summary(), by: rolling.table(by)}, indent=2))
+
+@main.command('live')
+@click.option('--symbol', 'symbols', multiple=True, help='Symbol to stream (repeatable); defaults to config symbols')
+@click.option('--events', default=None, help='JSONL file to append hit/miss events to')
+def live(symbols, events):
+    """Resolve today's forecasts intraday from the live tick stream."""
+    import asyncio
+    from .live import run_live
+    try:
+        asyncio.run(run_live(symbols=list(symbols) or None, events_file=events))
+    except KeyboardInterrupt:
+        pass
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
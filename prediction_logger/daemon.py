@@ -0,0 +1,203 @@
+import json
+import logging
+import threading
+import time
+from datetime import datetime, time as time_type, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8081
+# Clients allowed to call /trigger; /health is open so probes can reach it
+LOCAL_CLIENTS = ('127.0.0.1', '::1', '::ffff:127.0.0.1')
+
+
+def parse_schedule_time(value):
+    """
+    Return (hour, minute) for a schedule_time config value. Accepts "HH:MM"
+    strings, datetime.time, and the integer YAML 1.1 produces for an unquoted
+    16:30 (sexagesimal, i.e. 990 minutes).
+    """
+    if isinstance(value, time_type):
+        return value.hour, value.minute
+    if isinstance(value, int) and not isinstance(value, bool):
+        hour, minute = divmod(value, 60)
+    elif isinstance(value, str) and ':' in value:
+        hour, minute = (int(part) for part in value.strip().split(':')[:2])
+    else:
+        raise ValueError(f"Invalid schedule_time: {value!r} (expected HH:MM)")
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"Invalid schedule_time: {value!r} (expected HH:MM)")
+    return hour, minute
+
+
+def next_run(now: datetime, hour: int, minute: int) -> datetime:
+    """The first hour:minute strictly after now, in now's timezone."""
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if candidate <= now:
+        candidate = datetime.combine(candidate.date() + timedelta(days=1), candidate.timetz())
+    return candidate
+
+
+class Daemon:
+    """
+    Resident scheduler: runs an evaluation cycle every day at schedule_time
+    (in session_timezone, default UTC) for every configured symbol, and
+    serves GET /health and a loopback-only POST /trigger over HTTP.
+
+    Config, the tensor model, source caches and pooled HTTP/SMTP sessions are
+    set up once and reused by every cycle. Cycles never overlap; a trigger
+    while one is running is refused with 409.
+    """
+
+    def __init__(self, cfg: dict | None = None, tensor_model=None, host: str | None = None, port: int | None = None):
+        from .config import load_config
+        from .ingest import get_session_timezone
+        self.cfg = cfg or load_config()
+        self.tensor_model = tensor_model
+        self.host = host or self.cfg.get('daemon_host', DEFAULT_HOST)
+        self.port = int(port if port is not None else self.cfg.get('daemon_port', DEFAULT_PORT))
+        self.tz = get_session_timezone(self.cfg)
+        self.hour, self.minute = parse_schedule_time(self.cfg['schedule_time'])
+        self.started = time.time()
+        self.next_run = None
+        self.stop_event = threading.Event()
+        self.server = None
+        self._cycle_lock = threading.Lock()
+        self.stats = {'cycles': 0, 'failures': 0, 'running': False, 'last_run': None, 'last_date': None,
+                      'last_rows': None, 'last_duration': None, 'last_error': None}
+
+    def run_cycle(self, date: datetime | None = None, symbols: list | None = None, trigger: str = 'schedule'):
+        """
+        Evaluate date (default: today in session_timezone) for the given or
+        configured symbols, skipping rows already recorded. Returns the number
+        of rows written, or None if a cycle is already running.
+        """
+        if not self._cycle_lock.acquire(blocking=False):
+            logging.warning(f"Skipping {trigger} cycle: another cycle is still running")
+            return None
+        return self._run_locked(date, symbols, trigger)
+
+    def _run_locked(self, date, symbols, trigger):
+        from .logger import run_range
+        from .runner import run_symbols
+        from .sources import get_actuals_source_from_config
+        day = date or datetime.combine(datetime.now(self.tz).date(), time_type())
+        began = time.perf_counter()
+        self.stats['running'] = True
+        rows = None
+        try:
+            logging.info(f"Starting {trigger} cycle for {day:%Y-%m-%d}")
+            if symbols or self.cfg.get('symbols'):
+                rows = run_symbols(day, day, symbols=symbols, cfg=self.cfg, tensor_model=self.tensor_model)
+            else:
+                rows = run_range(day, day, actuals_source=get_actuals_source_from_config(self.cfg),
+                                 tensor_model=self.tensor_model)
+            self.stats['last_error'] = None
+        except Exception as e:
+            self.stats['failures'] += 1
+            self.stats['last_error'] = str(e)
+            logging.error(f"{trigger.capitalize()} cycle for {day:%Y-%m-%d} failed: {e}")
+            from .notifications import notify
+            notify(f"{trigger.capitalize()} evaluation cycle for {day:%Y-%m-%d} failed: {e}")
+        finally:
+            self.stats.update(cycles=self.stats['cycles'] + 1, running=False, last_run=time.time(),
+                              last_date=day.strftime("%Y-%m-%d"), last_rows=rows,
+                              last_duration=round(time.perf_counter() - began, 3))
+            self._cycle_lock.release()
+        return rows
+
+    def _schedule(self):
+        while not self.stop_event.is_set():
+            self.next_run = next_run(datetime.now(self.tz), self.hour, self.minute)
+            logging.info(f"Next evaluation cycle at {self.next_run.isoformat()}")
+            # Re-check the clock at least once a minute so suspend/clock changes do not skip a day
+            while not self.stop_event.is_set():
+                remaining = (self.next_run - datetime.now(self.tz)).total_seconds()
+                if remaining <= 0:
+                    break
+                self.stop_event.wait(min(remaining, 60.0))
+            if self.stop_event.is_set():
+                return
+            self.run_cycle(datetime.combine(self.next_run.date(), time_type()))
+
+    def health(self) -> dict:
+        from .cache import cache_stats
+        from .transport import transport_stats
+        return dict(self.stats, status='ok', uptime=round(time.time() - self.started, 1),
+                    next_run=self.next_run.isoformat() if self.next_run else None,
+                    caches=cache_stats(), transports=transport_stats())
+
+    def trigger(self, date: datetime | None = None, symbols: list | None = None) -> bool:
+        """Start a cycle in the background; False if one is already running."""
+        if not self._cycle_lock.acquire(blocking=False):
+            return False
+        # The cycle thread owns the lock and releases it when done
+        threading.Thread(target=self._run_locked, args=(date, symbols, 'trigger'), daemon=True).start()
+        return True
+
+    def start(self):
+        """Bind the HTTP server and start the scheduler and server threads."""
+        self.server = ThreadingHTTPServer((self.host, self.port), _handler(self))
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self._schedule, name='prediction-logger-scheduler', daemon=True).start()
+        threading.Thread(target=self.server.serve_forever, name='prediction-logger-http', daemon=True).start()
+        logging.info(f"Serving health/trigger endpoints on http://{self.host}:{self.port}")
+
+    def serve_forever(self):
+        self.start()
+        try:
+            while not self.stop_event.wait(1.0):
+                pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        self.stop_event.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        from .notifications import flush
+        flush()
+
+
+def _handler(daemon: Daemon):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, body: dict):
+            data = json.dumps(body, default=str).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if urlsplit(self.path).path in ('/health', '/healthz'):
+                self._reply(200, daemon.health())
+            else:
+                self._reply(404, {'error': 'not found'})
+
+        def do_POST(self):
+            url = urlsplit(self.path)
+            if url.path != '/trigger':
+                self._reply(404, {'error': 'not found'})
+                return
+            if self.client_address[0] not in LOCAL_CLIENTS:
+                self._reply(403, {'error': 'trigger is only accepted from localhost'})
+                return
+            query = parse_qs(url.query)
+            try:
+                date = datetime.strptime(query['date'][0], "%Y-%m-%d") if 'date' in query else None
+            except ValueError:
+                self._reply(400, {'error': 'date must be YYYY-MM-DD'})
+                return
+            if daemon.trigger(date, query.get('symbol')):
+                self._reply(202, {'status': 'started', 'date': date.strftime("%Y-%m-%d") if date else None})
+            else:
+                self._reply(409, {'status': 'busy'})
+
+        def log_message(self, format, *args):
+            logging.debug(f"daemon http: {format % args}")
+
+    return Handler
@@ -0,0 +1,101 @@
+import logging
+import numpy as np
+
+SCENARIOS = ('breakout', 'fade', 'range', 'trend', 'reversal', 'momentum')
+
+
+def evaluate_scenario(forecast: dict, actuals: dict) -> bool:
+    """
+    Evaluate whether the actuals hit a single forecast scenario.
+    Raises on malformed forecast/actuals so callers can report the error.
+    """
+    scenario = forecast['scenario']
+    # Expanded scenario support
+    if scenario == 'breakout':
+        # Hit if high >= resistance
+        return actuals['high'] >= forecast['resistance']
+    elif scenario == 'fade':
+        # Hit if high <= support (or resistance if no support)
+        support = forecast.get('support')
+        reference_level = support if support is not None else forecast['resistance']
+        return actuals['high'] <= reference_level
+    elif scenario == 'range':
+        # Hit if low >= support and high <= resistance
+        support = forecast.get('support')
+        return (actuals['low'] >= (support if support is not None else 0)) and (actuals['high'] <= forecast['resistance'])
+    elif scenario == 'trend':
+        # Hit if close > open
+        return actuals.get('close', 0) > actuals.get('open', 0)
+    elif scenario == 'reversal':
+        # Hit if close < open
+        return actuals.get('close', 0) < actuals.get('open', 0)
+    elif scenario == 'momentum':
+        # Hit if close > previous close (requires previous actuals)
+        prev_close = actuals.get('prev_close')
+        return prev_close is not None and actuals.get('close', 0) > prev_close
+    logging.warning(f"Unknown scenario '{scenario}'")
+    return False
+
+
+def _as_columns(data):
+    """Accept a DataFrame, a mapping of column -> array-like, or a list of row dicts."""
+    if isinstance(data, (list, tuple)):
+        names = {key for row in data for key in row}
+        return {name: [row.get(name) for row in data] for name in names}
+    return data
+
+
+def _column(data, name: str, length: int, default=np.nan) -> np.ndarray:
+    if name not in data:
+        return np.full(length, default, dtype=float)
+    return np.asarray(data[name], dtype=float)
+
+
+def evaluate_scenarios(forecasts, actuals=None) -> np.ndarray:
+    """
+    Vectorized counterpart of evaluate_scenario for many rows at once.
+
+    forecasts and actuals are row-aligned DataFrames, mappings of column name
+    to NumPy array, or lists of dicts; when actuals is None the forecast frame
+    must also carry the actuals columns (high, low, open, close, prev_close).
+    Returns a boolean array of hits. Missing or null levels never hit, so
+    rows that would raise in the scalar path evaluate as misses here.
+    """
+    if isinstance(forecasts, (list, tuple)) and not forecasts:
+        return np.zeros(0, dtype=bool)
+    forecasts = _as_columns(forecasts)
+    actuals = forecasts if actuals is None else _as_columns(actuals)
+    scenario = np.asarray(forecasts['scenario'], dtype=object)
+    n = len(scenario)
+
+    resistance = _column(forecasts, 'resistance', n)
+    support = _column(forecasts, 'support', n)
+    high = _column(actuals, 'high', n)
+    low = _column(actuals, 'low', n)
+    close = np.nan_to_num(_column(actuals, 'close', n), nan=0.0)
+    open_ = np.nan_to_num(_column(actuals, 'open', n), nan=0.0)
+    prev_close = _column(actuals, 'prev_close', n)
+    has_support = ~np.isnan(support)
+
+    hit = np.zeros(n, dtype=bool)
+    with np.errstate(invalid='ignore'):
+        mask = scenario == 'breakout'
+        hit[mask] = high[mask] >= resistance[mask]
+        mask = scenario == 'fade'
+        reference_level = np.where(has_support, support, resistance)
+        hit[mask] = high[mask] <= reference_level[mask]
+        mask = scenario == 'range'
+        floor = np.where(has_support, support, 0.0)
+        hit[mask] = (low[mask] >= floor[mask]) & (high[mask] <= resistance[mask])
+        mask = scenario == 'trend'
+        hit[mask] = close[mask] > open_[mask]
+        mask = scenario == 'reversal'
+        hit[mask] = close[mask] < open_[mask]
+        mask = scenario == 'momentum'
+        hit[mask] = ~np.isnan(prev_close[mask]) & (close[mask] > prev_close[mask])
+
+    unknown = ~np.isin(scenario, SCENARIOS)
+    if unknown.any():
+        for name in sorted({str(s) for s in scenario[unknown]}):
+            logging.warning(f"Unknown scenario '{name}'")
+    return hit
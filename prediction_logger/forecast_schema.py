@@ -1,5 +1,11 @@
 from pydantic import BaseModel, Field, ValidationError
 from typing import Optional
+from typing_extensions import TypedDict
+
+try:
+    from pydantic import ConfigDict, TypeAdapter
+except ImportError:  # pydantic v1: validate_forecasts falls back to one model per record
+    ConfigDict = TypeAdapter = None
 
 class Forecast(BaseModel):
     scenario: str
@@ -10,3 +16,75 @@ class Forecast(BaseModel):
 
     class Config:
         extra = 'forbid'
+
+
+_batch_adapter = None
+
+
+def _get_batch_adapter():
+    """
+    TypeAdapter for a list of plain-dict forecasts, built from Forecast's own
+    fields and extra='forbid' so both paths apply identical rules.
+    """
+    global _batch_adapter
+    if _batch_adapter is None:
+        fields = {name: field.annotation for name, field in Forecast.model_fields.items()}
+        record = TypedDict('ForecastRecord', fields)
+        record.__pydantic_config__ = ConfigDict(extra='forbid')
+        _batch_adapter = TypeAdapter(list[record])
+    return _batch_adapter
+
+
+def _validate_one(record) -> dict:
+    if not isinstance(record, dict):
+        record = dict(record)
+    return Forecast(**record).dict()
+
+
+def _frame_records(frame) -> list:
+    # Missing cells become None, as they would be null in a JSON forecast
+    return frame.astype(object).where(frame.notna(), None).to_dict('records')
+
+
+def validate_forecasts(records) -> tuple[list, dict]:
+    """
+    Validate many forecasts in one batched pydantic call instead of building
+    a Forecast model per record. Accepts a list of dicts or a DataFrame.
+
+    Returns (forecasts, errors): forecasts is aligned with records and holds
+    the same dict Forecast(**record).dict() would (None for failures);
+    errors maps the index of each failing record to the ValidationError
+    Forecast raised for it.
+    """
+    if hasattr(records, 'to_dict'):
+        records = _frame_records(records)
+    records = list(records)
+    if TypeAdapter is None:
+        forecasts, errors = [], {}
+        for i, record in enumerate(records):
+            try:
+                forecasts.append(_validate_one(record))
+            except ValidationError as e:
+                forecasts.append(None)
+                errors[i] = e
+        return forecasts, errors
+
+    adapter = _get_batch_adapter()
+    try:
+        return adapter.validate_python(records), {}
+    except ValidationError as e:
+        failed = sorted({error['loc'][0] for error in e.errors() if error['loc']})
+    # Rare path: re-validate the good records in bulk and build each failing
+    # record's error from the model itself so messages match exactly
+    failed_set = set(failed)
+    good = [i for i in range(len(records)) if i not in failed_set]
+    forecasts = [None] * len(records)
+    for i, forecast in zip(good, adapter.validate_python([records[i] for i in good])):
+        forecasts[i] = forecast
+    errors = {}
+    for i in failed:
+        try:
+            forecasts[i] = _validate_one(records[i])
+        except (ValidationError, TypeError, ValueError) as e:
+            errors[i] = e
+    return forecasts, errors
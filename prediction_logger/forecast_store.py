@@ -0,0 +1,159 @@
+import os
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from .forecast_schema import validate_forecasts
+from .sources import ForecastSource, symbol_key
+
+# Store key used for forecasts that are not filed under a symbol subfolder
+DEFAULT_SYMBOL = '/NQ'
+FIELDS = ('scenario', 'resistance', 'support', 'sigma_plus', 'sigma_minus')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS forecasts (
+    symbol TEXT NOT NULL,
+    date TEXT NOT NULL,
+    scenario TEXT NOT NULL,
+    resistance REAL NOT NULL,
+    support REAL,
+    sigma_plus REAL,
+    sigma_minus REAL,
+    PRIMARY KEY (symbol, date)
+) WITHOUT ROWID
+"""
+
+
+def connect(path: str, readonly: bool = False) -> sqlite3.Connection:
+    """
+    Open the forecast store. Read-only connections fail with FileNotFoundError
+    instead of creating an empty database.
+    """
+    if readonly:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Forecast store not found: {path}")
+        return sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMA)
+    return conn
+
+
+class SQLiteForecastSource(ForecastSource):
+    """
+    Loads forecasts from a single SQLite file keyed by (symbol, date).
+
+    The (symbol, date) primary key is a clustered B-tree, so a point lookup
+    is O(log n) and a date range for one symbol is a single index scan.
+    Rows are validated against the Forecast schema when they are imported,
+    so loads skip pydantic. Mirrors JSONFileForecastSource: with a symbol,
+    the symbol is added to each loaded forecast.
+    """
+    def __init__(self, path: str, actuals_source=None, symbol: str | None = None):
+        self.path = path
+        self.actuals_source = actuals_source
+        self.symbol = symbol
+        self.key = symbol_key(symbol or DEFAULT_SYMBOL)
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = connect(self.path, readonly=True)
+        return self._conn
+
+    def _to_forecast(self, row) -> dict:
+        forecast = dict(zip(FIELDS, row))
+        if self.symbol is not None:
+            forecast['symbol'] = self.symbol
+        return forecast
+
+    def path_for(self, date: datetime) -> str:
+        # Every date lives in the same file, so any write invalidates cached loads
+        return self.path
+
+    def load(self, date: datetime) -> dict:
+        """Return the forecast for a date or raise FileNotFoundError."""
+        row = self._connection().execute(
+            f"SELECT {', '.join(FIELDS)} FROM forecasts WHERE symbol = ? AND date = ?",
+            (self.key, date.strftime("%Y-%m-%d")),
+        ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"No forecast found for {date}")
+        return self._to_forecast(row)
+
+    def load_range(self, start: datetime, end: datetime) -> dict:
+        """Return {'YYYY-MM-DD': forecast} for every stored date in [start, end]."""
+        rows = self._connection().execute(
+            f"SELECT date, {', '.join(FIELDS)} FROM forecasts WHERE symbol = ? AND date BETWEEN ? AND ? ORDER BY date",
+            (self.key, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")),
+        )
+        return {row[0]: self._to_forecast(row[1:]) for row in rows}
+
+    def get_actuals(self, date):
+        return self.actuals_source.get_actuals(date) if self.actuals_source else None
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __getstate__(self):
+        # Connections cannot cross process boundaries; reopen lazily
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        return state
+
+
+def _iter_json_forecasts(folder: str):
+    """Yield (symbol_key, path) for top-level and per-symbol-subfolder JSON forecasts."""
+    default_key = symbol_key(DEFAULT_SYMBOL)
+    with os.scandir(folder) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.is_file() and entry.name.endswith('.json'):
+                yield default_key, entry.path
+            elif entry.is_dir():
+                with os.scandir(entry.path) as files:
+                    for f in sorted(files, key=lambda e: e.name):
+                        if f.is_file() and f.name.endswith('.json'):
+                            yield entry.name, f.path
+
+
+def import_json_folder(folder: str, path: str) -> int:
+    """
+    One-shot import of a forecast folder (YYYY-MM-DD.json files, optionally
+    in per-symbol subfolders such as forecasts/NQ/) into the store at path.
+    Existing (symbol, date) rows are replaced. Invalid files are logged and
+    skipped. Returns the number of forecasts imported.
+    """
+    if not os.path.isdir(folder):
+        raise FileNotFoundError(f"Forecast directory not found: {folder}")
+    keys, paths, raw = [], [], []
+    for key, file_path in _iter_json_forecasts(folder):
+        date = os.path.basename(file_path)[:-len('.json')]
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
+            with open(file_path, 'r') as f:
+                raw.append(json.load(f))
+        except ValueError as e:
+            logging.error(f"Skipping invalid forecast {file_path}: {e}")
+            continue
+        keys.append((key, date))
+        paths.append(file_path)
+    forecasts, errors = validate_forecasts(raw)
+    rows = []
+    for i, (key, forecast) in enumerate(zip(keys, forecasts)):
+        if i in errors:
+            logging.error(f"Skipping invalid forecast {paths[i]}: {errors[i]}")
+            continue
+        rows.append(key + tuple(forecast[field] for field in FIELDS))
+    conn = connect(path)
+    try:
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO forecasts (symbol, date, {', '.join(FIELDS)}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+    finally:
+        conn.close()
+    logging.info(f"Imported {len(rows)} forecast(s) from {folder} into {path}")
+    return len(rows)
@@ -0,0 +1,347 @@
+import asyncio
+import json
+import logging
+import os
+import random
+from collections import namedtuple
+from datetime import datetime, time, timedelta, timezone
+
+# Messages buffered between the socket reader and the aggregator; when full
+# the reader stops pulling from the socket, so TCP pushes back on the feed
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30.0
+# Columns of an OHLC actuals file created by persist_bar; existing files keep their own layout
+OHLC_COLUMNS = ['date', 'symbol', 'open', 'high', 'low', 'close', 'volume']
+OHLC_REQUIRED = ('date', 'open', 'high', 'low', 'close')
+
+Tick = namedtuple('Tick', 'symbol price size ts')
+
+
+def _timestamp(value) -> float:
+    """Epoch seconds from epoch seconds, epoch milliseconds or an ISO-8601 string."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    value = float(value)
+    return value / 1000.0 if value > 1e11 else value
+
+
+def parse_ticks(message) -> list:
+    """
+    Parse one feed message into ticks. Accepts a single tick object, a list
+    of them, or {"ticks": [...]}; each tick needs symbol and price (or last)
+    and may carry size/volume and ts/timestamp. Non-tick messages such as
+    subscription acks yield no ticks. Raises ValueError on malformed data.
+    """
+    data = json.loads(message) if isinstance(message, (str, bytes)) else message
+    if isinstance(data, dict) and 'ticks' in data:
+        data = data['ticks']
+    items = data if isinstance(data, list) else [data]
+    ticks = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError(f"Unexpected tick payload: {item!r}")
+        price = item.get('price', item.get('last'))
+        if price is None or 'symbol' not in item:
+            continue
+        ts = item.get('ts', item.get('timestamp'))
+        ticks.append(Tick(
+            item['symbol'],
+            float(price),
+            float(item.get('size', item.get('volume', 0)) or 0),
+            _timestamp(ts) if ts is not None else datetime.now(timezone.utc).timestamp(),
+        ))
+    return ticks
+
+
+def session_bounds(ts: float, tz=timezone.utc):
+    """Return (YYYY-MM-DD, start, end) of the calendar-day session containing epoch ts in tz."""
+    day = datetime.fromtimestamp(ts, tz).date()
+    start = datetime.combine(day, time(0), tzinfo=tz).timestamp()
+    end = datetime.combine(day + timedelta(days=1), time(0), tzinfo=tz).timestamp()
+    return day.isoformat(), start, end
+
+
+class Bar:
+    """Running OHLC bar for one symbol and session; update() is O(1)."""
+    __slots__ = ('symbol', 'session', 'start', 'end', 'open', 'high', 'low', 'close', 'volume', 'ticks')
+
+    def __init__(self, symbol: str, session: str, start: float, end: float, price: float):
+        self.symbol = symbol
+        self.session = session
+        self.start = start
+        self.end = end
+        self.open = self.high = self.low = self.close = price
+        self.volume = 0.0
+        self.ticks = 0
+
+    def update(self, price: float, size: float):
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += size
+        self.ticks += 1
+
+    def as_actuals(self) -> dict:
+        """The bar in the shape ActualsSource.get_actuals returns."""
+        return {'open': self.open, 'high': self.high, 'low': self.low, 'close': self.close, 'volume': self.volume}
+
+
+class BarAggregator:
+    """
+    Aggregates ticks into per-symbol session (calendar day) OHLC bars.
+
+    Each bar caches its session's [start, end) epoch bounds, so a tick costs
+    a dict lookup, two float comparisons and the bar update. A tick past the
+    end of its symbol's session completes that bar and opens the next one;
+    ticks older than the open session are counted and dropped.
+    """
+
+    def __init__(self, tz=timezone.utc):
+        self.tz = tz
+        self.bars = {}
+        self.late_ticks = 0
+
+    def _session(self, ts: float):
+        return session_bounds(ts, self.tz)
+
+    def add(self, tick: Tick):
+        """Add a tick; returns the completed Bar when it closes a session, else None."""
+        bar = self.bars.get(tick.symbol)
+        if bar is not None and bar.start <= tick.ts < bar.end:
+            bar.update(tick.price, tick.size)
+            return None
+        if bar is not None and tick.ts < bar.start:
+            self.late_ticks += 1
+            return None
+        self.bars[tick.symbol] = Bar(tick.symbol, *self._session(tick.ts), tick.price)
+        self.bars[tick.symbol].update(tick.price, tick.size)
+        return bar
+
+    def open_bars(self) -> list:
+        """Bars of sessions that are still in progress."""
+        return list(self.bars.values())
+
+
+def _ohlc_row(bar: Bar, columns: list, path: str, multi_symbol: bool) -> dict:
+    """The bar as a row of an OHLC file with the given columns; refuses layouts it cannot fill."""
+    missing = [c for c in OHLC_REQUIRED if c not in columns]
+    if missing:
+        raise ValueError(f"Cannot append bars to {path}: missing column(s) {', '.join(missing)}")
+    if 'symbol' not in columns and multi_symbol:
+        raise ValueError(f"Cannot append bars for several symbols to {path}: it has no symbol column")
+    values = dict(bar.as_actuals(), date=bar.session, symbol=bar.symbol)
+    return {column: values.get(column) for column in columns}
+
+
+def _append_ohlc_csv(path: str, bar: Bar, multi_symbol: bool):
+    import csv
+    columns = None
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        with open(path, newline='') as f:
+            columns = next(csv.reader(f), None)
+            f.seek(0, os.SEEK_END)
+            f.seek(f.tell() - 1)
+            newline = f.read(1) in ('\n', '\r')
+    if not columns:
+        columns, newline = OHLC_COLUMNS, True
+        with open(path, 'w', newline='') as f:
+            csv.writer(f).writerow(columns)
+    row = _ohlc_row(bar, columns, path, multi_symbol)
+    with open(path, 'a', newline='') as f:
+        if not newline:
+            f.write('\n')
+        csv.writer(f).writerow(['' if row[c] is None else row[c] for c in columns])
+
+
+def _append_ohlc_parquet(path: str, bar: Bar, multi_symbol: bool):
+    import pandas as pd
+    frame = pd.read_parquet(path) if os.path.exists(path) else pd.DataFrame(columns=OHLC_COLUMNS)
+    new = pd.DataFrame([_ohlc_row(bar, list(frame.columns), path, multi_symbol)])
+    if pd.api.types.is_datetime64_any_dtype(frame['date']):
+        new['date'] = pd.to_datetime(new['date']).astype(frame['date'].dtype)
+    frame = pd.concat([frame, new], ignore_index=True) if len(frame) else new
+    # A Parquet file cannot be appended to in place; rewrite it atomically
+    tmp = path + '.tmp'
+    frame.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+
+def persist_bar(bar: Bar, cfg: dict):
+    """
+    Store a completed bar where the configured actuals source reads it.
+    For 'ohlc' the bar is added to actuals_file in that file's own layout:
+    a CSV gets a row in its header's column order, a .parquet file is
+    rewritten with the row added, and a new file is created with
+    OHLC_COLUMNS. A file without the OHLC columns, or without a symbol
+    column when cfg lists several symbols, is refused with a ValueError.
+    Otherwise the bar becomes the JSON file FileActualsSource reads:
+    <actuals_folder>/<session>.actuals.json, or
+    <actuals_folder>/<symbol>/<session>.actuals.json when cfg lists symbols
+    (written atomically).
+    """
+    from .sources import FileActualsSource
+    if cfg.get('actuals_source') == 'ohlc':
+        path = cfg.get('actuals_file', './actuals.csv')
+        multi_symbol = len(cfg.get('symbols') or []) > 1
+        if path.lower().endswith(('.parquet', '.pq')):
+            _append_ohlc_parquet(path, bar, multi_symbol)
+        else:
+            _append_ohlc_csv(path, bar, multi_symbol)
+        return path
+    source = FileActualsSource(cfg.get('actuals_folder', './actuals'), bar.symbol if cfg.get('symbols') else None)
+    os.makedirs(source.folder, exist_ok=True)
+    path = source.path_for(datetime.strptime(bar.session, "%Y-%m-%d"))
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(bar.as_actuals(), f)
+    os.replace(tmp, path)
+    return path
+
+
+class Ingester:
+    """
+    Streaming market-data pipeline: websocket -> bounded queue -> bar aggregator.
+
+    A reader task subscribes and pushes raw messages onto an asyncio.Queue of
+    queue_size; a consumer task parses ticks and feeds the BarAggregator,
+    handing each tick to on_tick and completed bars to on_bar (sync or
+    async); a failing callback is logged and counted in stats without
+    stopping the stream. When the consumer falls behind, the full queue blocks the reader. Dropped connections are
+    retried with full-jitter exponential backoff until stop is set.
+    """
+
+    def __init__(self, uri: str, symbols: list, on_bar=None, aggregator: BarAggregator | None = None,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, backoff_base: float = DEFAULT_BACKOFF_BASE,
+                 backoff_max: float = DEFAULT_BACKOFF_MAX, on_tick=None):
+        self.uri = uri
+        self.symbols = list(symbols)
+        self.on_bar = on_bar
+        self.on_tick = on_tick
+        self.aggregator = aggregator or BarAggregator()
+        self.queue_size = queue_size
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stats = {'messages': 0, 'ticks': 0, 'bars': 0, 'malformed': 0, 'connects': 0, 'reconnects': 0,
+                      'queue_high_water': 0, 'tick_errors': 0, 'bar_errors': 0}
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before reconnect attempt number `attempt` (0-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def _read(self, queue: asyncio.Queue, stop: asyncio.Event):
+        import websockets
+        attempt = 0
+        while not stop.is_set():
+            try:
+                async with websockets.connect(self.uri) as ws:
+                    self.stats['connects'] += 1
+                    attempt = 0
+                    await ws.send(json.dumps({"action": "subscribe", "symbols": self.symbols}))
+                    async for msg in ws:
+                        await queue.put(msg)
+                        if queue.qsize() > self.stats['queue_high_water']:
+                            self.stats['queue_high_water'] = queue.qsize()
+                        if stop.is_set():
+                            return
+                logging.warning(f"Market data stream {self.uri} closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"Market data socket error: {e}")
+            if stop.is_set():
+                return
+            delay = self.backoff(attempt)
+            attempt += 1
+            self.stats['reconnects'] += 1
+            logging.info(f"Reconnecting to {self.uri} in {delay:.2f}s (attempt {attempt})")
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _emit(self, callback, value):
+        result = callback(value)
+        if asyncio.iscoroutine(result):
+            await result
+
+    async def _consume(self, queue: asyncio.Queue):
+        add = self.aggregator.add
+        while True:
+            msg = await queue.get()
+            try:
+                ticks = parse_ticks(msg)
+            except (ValueError, TypeError, KeyError) as e:
+                self.stats['malformed'] += 1
+                logging.debug(f"Dropping malformed market data message: {e}")
+                continue
+            finally:
+                queue.task_done()
+            self.stats['messages'] += 1
+            self.stats['ticks'] += len(ticks)
+            for tick in ticks:
+                bar = add(tick)
+                if self.on_tick is not None:
+                    try:
+                        await self._emit(self.on_tick, tick)
+                    except Exception as e:
+                        self.stats['tick_errors'] += 1
+                        logging.error(f"Failed to handle tick {tick.symbol} at {tick.ts}: {e}")
+                if bar is not None:
+                    self.stats['bars'] += 1
+                    if self.on_bar is not None:
+                        try:
+                            await self._emit(self.on_bar, bar)
+                        except Exception as e:
+                            self.stats['bar_errors'] += 1
+                            logging.error(f"Failed to handle completed bar {bar.symbol} {bar.session}: {e}")
+
+    async def run(self, stop: asyncio.Event | None = None):
+        """Ingest until stop is set; messages already queued are processed first."""
+        stop = stop or asyncio.Event()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        consumer = asyncio.create_task(self._consume(queue))
+        reader = asyncio.create_task(self._read(queue, stop))
+        try:
+            await stop.wait()
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+            await queue.join()
+        finally:
+            reader.cancel()
+            consumer.cancel()
+            await asyncio.gather(reader, consumer, return_exceptions=True)
+
+
+def get_session_timezone(cfg: dict):
+    """Timezone whose calendar days delimit sessions (session_timezone, default UTC)."""
+    if cfg.get('session_timezone'):
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(cfg['session_timezone'])
+    return timezone.utc
+
+
+def get_ingester_from_config(cfg: dict, symbols: list | None = None, **kw) -> Ingester:
+    """
+    Build an Ingester for the thinkorswim stream in cfg whose completed bars
+    are persisted as actuals (see persist_bar). Sessions are calendar days in
+    session_timezone (default UTC), and a bar completes when the first tick
+    of a later session arrives: a day's actuals are stored the next trading
+    day, after that day's scheduled cycle has run, so evaluate it with a
+    backfill (--start/--end) or a later /trigger.
+    """
+    tos = cfg['thinkorswim']
+    scheme = 'wss' if tos.get('use_ssl') else 'ws'
+    uri = f"{scheme}://{tos['host']}:{tos['port']}"
+    from .sources import symbol_key
+    symbols = [symbol_key(s) for s in symbols or cfg.get('symbols') or [cfg.get('target_symbol', '/NQ')]]
+    tz = get_session_timezone(cfg)
+
+    async def on_bar(bar):
+        path = await asyncio.to_thread(persist_bar, bar, cfg)
+        logging.info(f"Stored {bar.symbol} bar for {bar.session} ({bar.ticks} ticks) in {path}")
+
+    kw.setdefault('queue_size', int(cfg.get('ingest_queue_size', DEFAULT_QUEUE_SIZE)))
+    return Ingester(uri, symbols, on_bar=on_bar, aggregator=BarAggregator(tz), **kw)
@@ -0,0 +1,283 @@
+import asyncio
+import bisect
+import json
+import logging
+import time
+from collections import deque, namedtuple
+from datetime import datetime, timezone
+from .evaluation import evaluate_scenario
+from .ingest import session_bounds
+
+# Latencies kept for the p50/p99 summary
+LATENCY_WINDOW = 10_000
+
+LiveEvent = namedtuple('LiveEvent', 'symbol session scenario forecast result price tick_ts detected_at latency final')
+
+
+class _Entry:
+    __slots__ = ('forecast', 'resolved')
+
+    def __init__(self, forecast: dict):
+        self.forecast = forecast
+        self.resolved = False
+
+
+class _Ladder:
+    """
+    Thresholds sorted in the order the price reaches them, with a pointer to
+    the next unreached one. Advancing past n thresholds costs O(n) in total
+    over the session, and a tick that sets no new extreme costs nothing.
+    """
+    __slots__ = ('levels', 'entries', 'next', 'descending')
+
+    def __init__(self, descending: bool = False):
+        self.levels = []
+        self.entries = []
+        self.next = 0
+        self.descending = descending
+
+    def add(self, level: float, entry: _Entry):
+        key = -level if self.descending else level
+        i = bisect.bisect_right(self.levels, key, lo=self.next)
+        self.levels.insert(i, key)
+        self.entries.insert(i, entry)
+
+    def crossed(self, price: float, inclusive: bool):
+        """Yield entries whose level the price has now reached (or passed)."""
+        key = -price if self.descending else price
+        levels = self.levels
+        while self.next < len(levels) and (levels[self.next] <= key if inclusive else levels[self.next] < key):
+            entry = self.entries[self.next]
+            self.next += 1
+            yield entry
+
+
+class _Book:
+    """Forecasts and running OHLC for one symbol's current session."""
+
+    def __init__(self, session: str, start: float, end: float, prev_close=None):
+        self.session = session
+        self.start = start
+        self.end = end
+        self.prev_close = prev_close
+        self.open = self.high = self.low = self.close = None
+        self.entries = []
+        # breakout hits when the high reaches resistance
+        self.hit_above = _Ladder()
+        # range/fade miss when the high goes above their upper level
+        self.miss_above = _Ladder()
+        # range misses when the low goes below support
+        self.miss_below = _Ladder(descending=True)
+
+
+class LiveEvaluator:
+    """
+    Incremental intraday hit detection over a tick stream.
+
+    Holds each symbol's forecasts for the current session and resolves them
+    as ticks arrive instead of after the close:
+    - breakout is a hit the moment the high reaches resistance,
+    - range is a miss the moment price leaves [support, resistance],
+    - fade is a miss the moment the high exceeds its level,
+    and whatever is still open at the session end (plus trend, reversal and
+    momentum, which need the close) is settled with evaluate_scenario on the
+    session's OHLC. Thresholds live in sorted ladders that are only walked
+    when a tick sets a new high or low, so a tick costs O(1) plus the
+    forecasts it actually resolves, never a rescan of every forecast.
+
+    Each LiveEvent carries the triggering tick's timestamp, the wall-clock
+    detection time and their difference (latency-to-detection).
+    """
+
+    def __init__(self, loader=None, on_event=None, tz=timezone.utc):
+        self.loader = loader
+        self.on_event = on_event
+        self.tz = tz
+        self.books = {}
+        self.prev_closes = {}
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.stats = {'ticks': 0, 'events': 0, 'hits': 0, 'misses': 0, 'sessions': 0, 'unresolved': 0}
+
+    def add_forecast(self, symbol: str, forecast: dict, ts: float | None = None):
+        """Track a forecast for the symbol's session containing ts (default: now)."""
+        book = self._book(symbol, ts if ts is not None else time.time(), load=False)
+        entry = _Entry(forecast)
+        book.entries.append(entry)
+        scenario = forecast.get('scenario')
+        support = forecast.get('support')
+        if scenario == 'breakout':
+            book.hit_above.add(forecast['resistance'], entry)
+        elif scenario == 'fade':
+            book.miss_above.add(support if support is not None else forecast['resistance'], entry)
+        elif scenario == 'range':
+            book.miss_above.add(forecast['resistance'], entry)
+            book.miss_below.add(support if support is not None else 0.0, entry)
+        # Forecasts added mid-session see the extremes already traded
+        if book.high is not None:
+            self._cross(symbol, book, book.high, book.low, book.close, ts or time.time())
+
+    def _book(self, symbol: str, ts: float, load: bool = True) -> _Book:
+        book = self.books.get(symbol)
+        if book is not None and book.start <= ts < book.end:
+            return book
+        if book is not None and ts >= book.end:
+            self.close_session(symbol, ts=book.end)
+        book = self.books[symbol] = _Book(*session_bounds(ts, self.tz), self.prev_closes.get(symbol))
+        self.stats['sessions'] += 1
+        if load and self.loader is not None:
+            for forecast in self.loader(symbol, book.session) or []:
+                self.add_forecast(symbol, forecast, ts)
+        return book
+
+    def on_tick(self, tick) -> list:
+        """Feed one tick (symbol, price, size, ts); returns the events it triggered."""
+        self.stats['ticks'] += 1
+        events = []
+        book = self.books.get(tick.symbol)
+        if book is None or not (book.start <= tick.ts < book.end):
+            if book is not None and tick.ts < book.start:
+                return events
+            if book is not None:
+                events = self.close_session(tick.symbol, ts=book.end)
+            book = self._book(tick.symbol, tick.ts)
+        price = tick.price
+        book.close = price
+        if book.open is None:
+            book.open = book.high = book.low = price
+        elif book.low <= price <= book.high:
+            return events
+        else:
+            book.high = max(book.high, price)
+            book.low = min(book.low, price)
+        return events + self._cross(tick.symbol, book, book.high, book.low, price, tick.ts)
+
+    def _cross(self, symbol, book, high, low, price, ts) -> list:
+        events = []
+        for entry in book.hit_above.crossed(high, inclusive=True):
+            self._resolve(events, symbol, book, entry, 'hit', price, ts)
+        for entry in book.miss_above.crossed(high, inclusive=False):
+            self._resolve(events, symbol, book, entry, 'miss', price, ts)
+        for entry in book.miss_below.crossed(low, inclusive=False):
+            self._resolve(events, symbol, book, entry, 'miss', price, ts)
+        return events
+
+    def _resolve(self, events, symbol, book, entry, result, price, ts, final=False):
+        if entry.resolved:
+            return
+        entry.resolved = True
+        detected_at = time.time()
+        event = LiveEvent(symbol, book.session, entry.forecast.get('scenario'), entry.forecast, result, price,
+                          ts, detected_at, detected_at - ts, final)
+        self.latencies.append(event.latency)
+        self.stats['events'] += 1
+        self.stats['hits' if result == 'hit' else 'misses'] += 1
+        events.append(event)
+        if self.on_event is not None:
+            self.on_event(event)
+
+    def close_session(self, symbol: str, ts: float | None = None) -> list:
+        """Settle every unresolved forecast of the symbol's session from its OHLC."""
+        book = self.books.pop(symbol, None)
+        if book is None:
+            return []
+        events = []
+        if book.close is not None:
+            self.prev_closes[symbol] = book.close
+        actuals = {'open': book.open, 'high': book.high, 'low': book.low, 'close': book.close,
+                   'prev_close': book.prev_close}
+        for entry in book.entries:
+            if entry.resolved:
+                continue
+            if book.close is None:
+                result = 'miss'
+            else:
+                try:
+                    result = 'hit' if evaluate_scenario(entry.forecast, actuals) else 'miss'
+                except Exception as e:
+                    logging.error(f"Live evaluation error for {symbol} {book.session}: {e}")
+                    result = 'miss'
+            self._resolve(events, symbol, book, entry, result, book.close, ts if ts is not None else book.end,
+                          final=True)
+        return events
+
+    def shutdown(self, now: float | None = None) -> list:
+        """
+        Settle, with final verdicts, only sessions that have ended by now.
+        Forecasts of sessions still in progress get a non-final 'unresolved'
+        event instead, so a restart that reloads them is not contradicted.
+        """
+        now = now if now is not None else time.time()
+        events = []
+        for symbol, book in list(self.books.items()):
+            if now >= book.end:
+                events += self.close_session(symbol, ts=now)
+                continue
+            for entry in book.entries:
+                if entry.resolved:
+                    continue
+                event = LiveEvent(symbol, book.session, entry.forecast.get('scenario'), entry.forecast, 'unresolved',
+                                  book.close, now, now, 0.0, False)
+                self.stats['unresolved'] += 1
+                events.append(event)
+                if self.on_event is not None:
+                    self.on_event(event)
+        return events
+
+    def summary(self) -> dict:
+        """Event counts plus latency-to-detection percentiles (seconds)."""
+        latencies = sorted(self.latencies)
+        pick = (lambda q: latencies[min(int(q * len(latencies)), len(latencies) - 1)]) if latencies else None
+        return dict(self.stats, **({
+            'latency_p50': pick(0.5),
+            'latency_p99': pick(0.99),
+            'latency_max': latencies[-1],
+        } if latencies else {}))
+
+
+def forecast_loader(cfg: dict):
+    """Loader for LiveEvaluator that reads a symbol's forecast for a session from the configured source."""
+    from .sources import get_forecast_source_from_config
+
+    def load(symbol: str, session: str) -> list:
+        source = get_forecast_source_from_config(cfg, symbol=symbol if cfg.get('symbols') else None)
+        try:
+            return [source.load(datetime.strptime(session, "%Y-%m-%d"))]
+        except FileNotFoundError:
+            logging.info(f"No forecast for {symbol} on {session}")
+        except Exception as e:
+            logging.error(f"Failed to load forecast for {symbol} on {session}: {e}")
+        return []
+    return load
+
+
+def event_writer(path: str):
+    """on_event callback that logs each event and appends it to a JSONL file."""
+    def write(event: LiveEvent):
+        logging.info(f"{event.symbol} {event.session} {event.scenario}: {event.result} at {event.price} "
+                     f"(detected {event.latency * 1000:.1f} ms after tick)")
+        if path:
+            with open(path, 'a') as f:
+                f.write(json.dumps(event._asdict()) + "\n")
+    return write
+
+
+async def run_live(cfg: dict | None = None, symbols: list | None = None, events_file: str | None = None,
+                   stop: asyncio.Event | None = None) -> LiveEvaluator:
+    """
+    Long-running live mode: stream ticks through the ingester (which still
+    persists completed bars) and resolve today's forecasts as ticks arrive.
+    On shutdown, sessions that have ended are settled and forecasts of the
+    session in progress are reported as unresolved (see shutdown()).
+    """
+    from .config import load_config
+    from .ingest import get_ingester_from_config, get_session_timezone
+    cfg = cfg or load_config()
+    evaluator = LiveEvaluator(forecast_loader(cfg), event_writer(events_file or cfg.get('live_events_file')),
+                              tz=get_session_timezone(cfg))
+    ingester = get_ingester_from_config(cfg, symbols, on_tick=evaluator.on_tick)
+    try:
+        await ingester.run(stop)
+    finally:
+        evaluator.shutdown()
+        logging.info(f"Live evaluation summary: {evaluator.summary()}")
+    return evaluator
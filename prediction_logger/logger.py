@@ -1,25 +1,150 @@
 import logging
 import os
 import json
-import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 from .config import load_config
-from .sources import JSONFileForecastSource, ActualsSource, StubActualsSource
+from .sources import PREV_CLOSE_LOOKBACK, ActualsSource, StubActualsSource, actuals_records, get_forecast_source_from_config
 from .notifications import notify
+from .evaluation import evaluate_scenario, evaluate_scenarios
+from .results_store import get_results_writer, read_results_index
 from pathlib import Path
 
-logging.basicConfig(level=logging.DEBUG)
-logging.debug(f"Current working directory: {os.getcwd()}")
+
+def build_row(date: datetime, forecast: dict, actuals: dict, hit: bool, tensor_output=None, llm_summary=None) -> dict:
+    """
+    Build a result row with schema v1.0 + tensor/llm fields.
+    """
+    row = {
+        'date': date.strftime("%Y-%m-%d"),
+        'symbol': forecast.get('symbol', '/NQ'),
+        'predicted': forecast.get('resistance', None),
+        'actual': actuals.get('close', None) if isinstance(actuals, dict) else None,
+        'scenario': forecast['scenario'],
+        'result': 'hit' if hit else 'miss',
+        'version': 'v1.0',
+    }
+    if tensor_output is not None:
+        row['tensor_output'] = tensor_output
+    if llm_summary is not None:
+        row['llm_summary'] = llm_summary
+    return row
+
+
+def _enrich(forecast: dict, actuals: dict, tensor_model=None, translator=None):
+    """
+    Run the optional tensor model and LLM summary for one evaluated forecast.
+    Returns (tensor_output, llm_summary); failures are logged and yield None.
+    """
+    tensor_output = None
+    llm_summary = None
+    if tensor_model is not None:
+        try:
+            # Example: use [predicted, actual] as features, can be customized
+            features = [forecast.get('resistance', 0), actuals.get('close', 0)]
+            tensor_output = tensor_model.predict(features)
+        except Exception as e:
+            logging.error(f"Tensor model prediction error: {e}")
+    # LLM summary (optional)
+    if translator is not None and tensor_output is not None:
+        try:
+            llm_summary = translator.summarize_tensor_output(tensor_output, context=forecast)
+        except Exception as e:
+            logging.error(f"LLM summary error: {e}")
+    return tensor_output, llm_summary
+
+
+def _enrich_batch(records: list, tensor_model=None, translator=None) -> list:
+    """
+    Batched counterpart of _enrich for (date, forecast, actuals) records:
+    the tensor model runs once over the whole feature matrix via
+    predict_batch, and summaries go through translator.summarize_many when
+    it has one. Falls back to per-row _enrich if the batch cannot be built
+    or the model lacks predict_batch. Returns one (tensor_output, llm_summary)
+    per record.
+    """
+    if tensor_model is None or not records or not hasattr(tensor_model, 'predict_batch'):
+        return [_enrich(forecast, actuals, tensor_model, translator) for _, forecast, actuals in records]
+    try:
+        # Same [predicted, actual] features as _enrich
+        features = [[forecast.get('resistance', 0), actuals.get('close', 0)] for _, forecast, actuals in records]
+        tensor_outputs = tensor_model.predict_batch(features)
+    except Exception as e:
+        logging.error(f"Batched tensor model prediction failed, predicting per row: {e}")
+        return [_enrich(forecast, actuals, tensor_model, translator) for _, forecast, actuals in records]
+    summaries = [None] * len(records)
+    if translator is not None and hasattr(translator, 'summarize_many'):
+        # Concurrent, cached summaries for every row the model scored
+        todo = [i for i, tensor_output in enumerate(tensor_outputs) if tensor_output is not None]
+        try:
+            for i, summary in zip(todo, translator.summarize_many([(tensor_outputs[i], records[i][1]) for i in todo])):
+                summaries[i] = summary
+        except Exception as e:
+            logging.error(f"LLM summary error: {e}")
+    elif translator is not None:
+        for i, ((_, forecast, _), tensor_output) in enumerate(zip(records, tensor_outputs)):
+            if tensor_output is None:
+                continue
+            try:
+                summaries[i] = translator.summarize_tensor_output(tensor_output, context=forecast)
+            except Exception as e:
+                logging.error(f"LLM summary error: {e}")
+    return list(zip(tensor_outputs, summaries))
+
+
+def _write_rows(csv_file: str, rows: list, backend: str | None = None) -> bool:
+    """
+    Append result rows to the results file in one write and refresh its metadata YAML.
+    Returns False (after notifying) if the rows could not be written.
+    """
+    # Append to CSV/Parquet (O(1) in the size of the existing history)
+    writer = get_results_writer(csv_file, backend, buffer_size=max(len(rows), 1))
+    try:
+        writer.extend(rows)
+        writer.flush()
+    except Exception as e:
+        logging.error(f"Error writing CSV: {e}")
+        notify(f"CSV write error: {e}")
+        return False
+
+    # Write schema/version metadata YAML file
+    try:
+        writer.write_metadata()
+    except Exception as e:
+        logging.error(f"Error writing metadata YAML: {e}")
+    return True
+
+
+def _with_prev_close(source, date: datetime, actuals: dict) -> dict:
+    """
+    Best-effort prev_close for one date's actuals: the close of the latest
+    earlier day within PREV_CLOSE_LOOKBACK that has actuals. Unreadable
+    lookback days are logged and skipped; actuals come back unchanged if
+    none is found.
+    """
+    if actuals.get('prev_close') is not None:
+        return actuals
+    for back in range(1, PREV_CLOSE_LOOKBACK + 1):
+        day = date - timedelta(days=back)
+        try:
+            previous = source.get_actuals(day)
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            logging.warning(f"Skipping actuals for {day:%Y-%m-%d} while deriving prev_close: {e}")
+            continue
+        if isinstance(previous, dict) and previous.get('close') is not None:
+            return dict(actuals, prev_close=previous['close'])
+    return actuals
 
 
 def run(date: datetime | None = None, actuals_source: 'ActualsSource | None' = None, tensor_model=None, translator=None):
     """
     Execute one logging cycle: load forecast, fetch actuals, record result.
     """
+    logging.debug(f"Current working directory: {os.getcwd()}")
     cfg = load_config()
     date = date or datetime.now()
-    folder = cfg['forecast_folder']
-    source = JSONFileForecastSource(folder, actuals_source or StubActualsSource())
+    source = get_forecast_source_from_config(cfg, actuals_source or StubActualsSource())
     try:
         forecast = source.load(date)
     except Exception as e:
@@ -33,109 +158,124 @@ def run(date: datetime | None = None, actuals_source: 'ActualsSource | None' = N
         logging.error(f"Failed to fetch actuals: {e}")
         notify(f"Error fetching actuals for {date}: {e}")
         return
+    if isinstance(actuals, dict) and isinstance(forecast, dict) and forecast.get('scenario') == 'momentum':
+        actuals = _with_prev_close(source, date, actuals)
     # Evaluate hit with expanded scenario support
-    scenario = forecast['scenario']
     try:
         if not isinstance(actuals, dict) or not isinstance(forecast, dict):
             logging.error(f"actuals or forecast is not a dict. actuals={actuals}, forecast={forecast}")
             notify(f"Evaluation error for {date}: actuals or forecast is not a dict.")
             return
-        # Expanded scenario support
-        if scenario == 'breakout':
-            # Hit if high >= resistance
-            hit = actuals['high'] >= forecast['resistance']
-        elif scenario == 'fade':
-            # Hit if high <= support (or resistance if no support)
-            reference_level = forecast.get('support', forecast['resistance'])
-            hit = actuals['high'] <= reference_level
-        elif scenario == 'range':
-            # Hit if low >= support and high <= resistance
-            hit = (actuals['low'] >= forecast.get('support', 0)) and (actuals['high'] <= forecast['resistance'])
-        elif scenario == 'trend':
-            # Hit if close > open
-            hit = actuals.get('close', 0) > actuals.get('open', 0)
-        elif scenario == 'reversal':
-            # Hit if close < open
-            hit = actuals.get('close', 0) < actuals.get('open', 0)
-        elif scenario == 'momentum':
-            # Hit if close > previous close (requires previous actuals)
-            prev_close = actuals.get('prev_close')
-            hit = prev_close is not None and actuals.get('close', 0) > prev_close
-        else:
-            logging.warning(f"Unknown scenario '{scenario}'")
-            hit = False
+        hit = evaluate_scenario(forecast, actuals)
     except Exception as e:
         logging.error(f"Error evaluating scenario: {e}")
         notify(f"Evaluation error for {date}: {e}")
         return
-    # Tensor model prediction (optional)
-    tensor_output = None
-    llm_summary = None
-    if tensor_model is not None:
+    # Tensor model prediction and LLM summary (optional)
+    tensor_output, llm_summary = _enrich(forecast, actuals, tensor_model, translator)
+    row = build_row(date, forecast, actuals, hit, tensor_output, llm_summary)
+    _write_rows(cfg['output_csv'], [row], cfg.get('results_backend'))
+
+
+def iter_dates(start: datetime, end: datetime):
+    """Yield each calendar day from start to end, inclusive."""
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+def _iter_evaluations(source, dates, existing=frozenset()):
+    """
+    Stream (date, forecast, actuals) for each date that has a forecast and no
+    recorded result yet. Dates without a forecast file are skipped quietly;
+    other load/fetch errors are reported and skipped. Sources with a
+    load_range() are read in one pass (a single range scan for the SQLite
+    store, one batched validation for JSON folders), and actuals come from
+    one get_actuals_range() call, which also supplies prev_close.
+    """
+    dates = list(dates)
+    prefetched = None
+    if dates and hasattr(source, 'load_range'):
         try:
-            # Example: use [predicted, actual] as features, can be customized
-            features = [forecast.get('resistance', 0), actuals.get('close', 0)]
-            tensor_output = tensor_model.predict(features)
+            prefetched = source.load_range(min(dates), max(dates))
         except Exception as e:
-            logging.error(f"Tensor model prediction error: {e}")
-    # LLM summary (optional)
-    if translator is not None and tensor_output is not None:
+            logging.error(f"Failed to load forecasts: {e}")
+            notify(f"Error loading forecasts for {min(dates):%Y-%m-%d}..{max(dates):%Y-%m-%d}: {e}")
+            return
+    # One bulk actuals read for the window; per-date lookups report errors if it fails
+    actuals_by_date = None
+    actuals_source = getattr(source, 'actuals_source', None)
+    if dates and isinstance(actuals_source, ActualsSource):
         try:
-            llm_summary = translator.summarize_tensor_output(tensor_output, context=forecast)
+            actuals_by_date = actuals_records(actuals_source.get_actuals_range(min(dates), max(dates)))
         except Exception as e:
-            logging.error(f"LLM summary error: {e}")
-    # Record result with schema v1.0 + tensor/llm fields
+            logging.warning(f"Bulk actuals read failed, falling back to per-date reads: {e}")
+    for date in dates:
+        try:
+            if prefetched is None:
+                forecast = source.load(date)
+            elif date.strftime("%Y-%m-%d") in prefetched:
+                forecast = prefetched[date.strftime("%Y-%m-%d")]
+                if isinstance(forecast, Exception):
+                    raise forecast
+            else:
+                raise FileNotFoundError(f"No forecast found for {date}")
+        except FileNotFoundError as e:
+            logging.debug(f"Skipping {date:%Y-%m-%d}: {e}")
+            continue
+        except Exception as e:
+            logging.error(f"Failed to load forecast: {e}")
+            notify(f"Error loading forecast for {date}: {e}")
+            continue
+        if (date.strftime("%Y-%m-%d"), forecast.get('symbol', '/NQ')) in existing:
+            logging.debug(f"Skipping {date:%Y-%m-%d}: result already recorded")
+            continue
+        try:
+            if actuals_by_date is None:
+                actuals = source.get_actuals(date)
+            elif date.strftime("%Y-%m-%d") in actuals_by_date:
+                actuals = actuals_by_date[date.strftime("%Y-%m-%d")]
+            else:
+                raise FileNotFoundError(f"No actuals found for {date}")
+        except Exception as e:
+            logging.error(f"Failed to fetch actuals: {e}")
+            notify(f"Error fetching actuals for {date}: {e}")
+            continue
+        if not isinstance(actuals, dict):
+            logging.error(f"actuals is not a dict. actuals={actuals}")
+            notify(f"Evaluation error for {date}: actuals is not a dict.")
+            continue
+        yield date, forecast, actuals
 
-    row = {
-        'date': date.strftime("%Y-%m-%d"),
-        'symbol': forecast.get('symbol', '/NQ'),
-        'predicted': forecast.get('resistance', None),
-        'actual': actuals.get('close', None) if isinstance(actuals, dict) else None,
-        'scenario': scenario,
-        'result': 'hit' if hit else 'miss',
-        'version': 'v1.0',
-    }
-    if tensor_output is not None:
-        row['tensor_output'] = tensor_output
-    if llm_summary is not None:
-        row['llm_summary'] = llm_summary
 
-    # Append to CSV
+def run_range(start: datetime, end: datetime, actuals_source: 'ActualsSource | None' = None, tensor_model=None,
+              translator=None, skip_existing: bool = True) -> int:
+    """
+    Backfill results for every date in [start, end] in one process.
+    Config, forecast source and actuals source are set up once; all result
+    rows are committed in a single bulk write. Dates that already have a
+    result in the output file are skipped. Returns the number of rows written.
+    """
+    cfg = load_config()
     csv_file = cfg['output_csv']
-    try:
-        df = pd.read_csv(csv_file)
-    except FileNotFoundError:
-        df = pd.DataFrame(columns=list(row.keys()))
-    except Exception as e:
-        logging.error(f"Error reading CSV: {e}")
-        notify(f"CSV read error: {e}")
-        return
-    # Create a new row DataFrame and concatenate
-    new_row = pd.DataFrame([row])
-    df = pd.concat([df, new_row], ignore_index=True)
-
-    # Ensure parent directory exists
-    os.makedirs(os.path.dirname(csv_file), exist_ok=True)
-
-    try:
-        df.to_csv(csv_file, index=False)
-    except Exception as e:
-        logging.error(f"Error writing CSV: {e}")
-        notify(f"CSV write error: {e}")
-
-    # Write schema/version metadata YAML file
-    metadata_path = os.path.splitext(csv_file)[0] + '_metadata.yaml'
-    import yaml
-    metadata = {
-        'schema_version': 'v1.0',
-        'fields': list(row.keys()),
-        'last_updated': datetime.now().isoformat(),
-    }
-    try:
-        with open(metadata_path, 'w') as f:
-            yaml.safe_dump(metadata, f)
-    except Exception as e:
-        logging.error(f"Error writing metadata YAML: {e}")
+    source = get_forecast_source_from_config(cfg, actuals_source or StubActualsSource())
+    backend = cfg.get('results_backend')
+    existing = read_results_index(csv_file, backend) if skip_existing else frozenset()
+    records = list(_iter_evaluations(source, iter_dates(start, end), existing))
+    # Score every date at once with the vectorized engine
+    hits = evaluate_scenarios([forecast for _, forecast, _ in records], [actuals for _, _, actuals in records])
+    enrichments = _enrich_batch(records, tensor_model, translator)
+    rows = []
+    for (date, forecast, actuals), hit, (tensor_output, llm_summary) in zip(records, hits, enrichments):
+        rows.append(build_row(date, forecast, actuals, bool(hit), tensor_output, llm_summary))
+    if not rows:
+        logging.info(f"No new results between {start:%Y-%m-%d} and {end:%Y-%m-%d}")
+        return 0
+    if not _write_rows(csv_file, rows, backend):
+        return 0
+    logging.info(f"Backfilled {len(rows)} result(s) between {start:%Y-%m-%d} and {end:%Y-%m-%d}")
+    return len(rows)
 
 
 def validate_forecast_path_consistency(config_path: str, forecast_filename: str) -> None:
@@ -0,0 +1,404 @@
+import csv
+import io
+import json
+import math
+import os
+from collections import deque
+
+# Rolling windows, in rows of each series (one row per trading day and symbol)
+WINDOWS = (5, 10, 20)
+# Series key component that aggregates over every symbol or scenario
+ALL = '*'
+SNAPSHOT_VERSION = 1
+# Recent overall rolling rates kept for plotting trends
+DEFAULT_HISTORY = 500
+# Appended chunks larger than this are aggregated with pandas instead of row by row
+BULK_BYTES = 1 << 20
+
+
+def binomial_pvalue(k: int, n: int, p: float = 0.5) -> float:
+    """
+    Exact two-sided binomial test p-value (same definition as
+    scipy.stats.binomtest): the probability of every outcome no more likely
+    than k successes in n trials. Tails are summed outward from the mode and
+    stop once terms no longer change the result, so this is O(sqrt(n)) in
+    practice rather than O(n).
+    """
+    if n <= 0:
+        return 1.0
+    if p <= 0.0 or p >= 1.0:
+        return 1.0 if k == round(p * n) else 0.0
+    log_p, log_q = math.log(p), math.log1p(-p)
+
+    def log_pmf(i):
+        return math.lgamma(n + 1) - math.lgamma(i + 1) - math.lgamma(n - i + 1) + i * log_p + (n - i) * log_q
+
+    def tail(start, step):
+        # Terms shrink monotonically away from the mode
+        total = 0.0
+        i = start
+        while 0 <= i <= n:
+            term = math.exp(log_pmf(i))
+            total += term
+            if term < total * 1e-17:
+                break
+            i += step
+        return total
+
+    mean = n * p
+    if k == mean:
+        return 1.0
+    bound = log_pmf(k) + math.log1p(1e-7)
+    if k < mean:
+        # First outcome above the mean at least as unlikely as k
+        lo, hi = math.ceil(mean), n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if log_pmf(mid) <= bound:
+                hi = mid
+            else:
+                lo = mid + 1
+        upper = tail(lo, 1) if log_pmf(lo) <= bound else 0.0
+        return min(1.0, tail(k, -1) + upper)
+    lo, hi = 0, math.floor(mean)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if log_pmf(mid) <= bound:
+            lo = mid
+        else:
+            hi = mid - 1
+    lower = tail(lo, -1) if log_pmf(lo) <= bound else 0.0
+    return min(1.0, tail(k, 1) + lower)
+
+
+class _Window:
+    """Ring buffer of the last `size` outcomes with a running hit count; push() is O(1)."""
+    __slots__ = ('size', 'buf', 'pos', 'count', 'hits')
+
+    def __init__(self, size: int):
+        self.size = size
+        self.buf = bytearray(size)
+        self.pos = 0
+        self.count = 0
+        self.hits = 0
+
+    def push(self, hit: int):
+        if self.count == self.size:
+            self.hits -= self.buf[self.pos]
+        else:
+            self.count += 1
+        self.buf[self.pos] = hit
+        self.hits += hit
+        self.pos = (self.pos + 1) % self.size
+
+    def rate(self):
+        """Hit rate over a full window; None until `size` outcomes were seen (like pandas rolling)."""
+        return self.hits / self.size if self.count == self.size else None
+
+    def state(self) -> str:
+        """Outcomes currently in the window, oldest first, as a '0'/'1' string."""
+        start = self.pos if self.count == self.size else 0
+        return ''.join('1' if self.buf[(start + i) % self.size] else '0' for i in range(self.count))
+
+
+class _Series:
+    __slots__ = ('count', 'hits', 'last_date', 'windows')
+
+    def __init__(self, windows):
+        self.count = 0
+        self.hits = 0
+        self.last_date = None
+        self.windows = [_Window(size) for size in windows]
+
+    def push(self, hit: int, date):
+        self.count += 1
+        self.hits += hit
+        if date:
+            self.last_date = date
+        for window in self.windows:
+            window.push(hit)
+
+
+def _is_hit(row: dict) -> int:
+    """1 for a hit row: result == 'hit' (results file) or a truthy hit column."""
+    if 'result' in row:
+        return int(str(row['result']).strip().lower() == 'hit')
+    return int(str(row.get('hit', '')).strip().lower() in ('1', 'true', 'hit', '1.0'))
+
+
+def snapshot_path_for(results_path: str) -> str:
+    """Default snapshot next to a results file (data/results.csv -> data/results_metrics.json)."""
+    return os.path.splitext(results_path)[0] + '_metrics.json'
+
+
+class RollingMetrics:
+    """
+    Incrementally maintained hit-rate metrics of a results history.
+
+    Every row updates four series: overall, per symbol, per scenario and per
+    (symbol, scenario). Each series keeps running count/hit sums and one
+    ring buffer per rolling window, so adding a row costs O(number of
+    windows) regardless of how long the history is. Binomial p-values are
+    computed on read, and the overall rolling rates of the last `history`
+    rows are kept for trend plots. The state saves to a small JSON snapshot
+    together with the byte offset of the results CSV consumed so far, and
+    refresh() reads only the rows appended after that offset.
+    """
+
+    def __init__(self, windows=WINDOWS, history: int = DEFAULT_HISTORY):
+        self.windows = tuple(int(size) for size in windows)
+        self.series = {}
+        self.rows = 0
+        self.source = {}
+        self.history = deque(maxlen=history)
+        # (symbol, scenario) -> the four series a row of that pair updates
+        self._targets = {}
+
+    def _get(self, key) -> _Series:
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = _Series(self.windows)
+        return series
+
+    def update(self, row: dict):
+        """Add one result row (needs scenario and result/hit; symbol defaults to /NQ)."""
+        self._add(_is_hit(row), row.get('symbol') or '/NQ', row.get('scenario') or '',
+                  str(row.get('date') or '')[:10] or None)
+
+    def _add(self, hit: int, symbol: str, scenario: str, date):
+        targets = self._targets.get((symbol, scenario))
+        if targets is None:
+            targets = self._targets[(symbol, scenario)] = tuple(
+                self._get(key) for key in ((ALL, ALL), (symbol, ALL), (ALL, scenario), (symbol, scenario)))
+        for series in targets:
+            series.push(hit, date)
+        overall = targets[0]
+        self.history.append([date, overall.hits / overall.count] + [window.rate() for window in overall.windows])
+        self.rows += 1
+
+    def update_frame(self, frame) -> int:
+        """
+        Vectorized equivalent of update_many for a DataFrame of rows (date,
+        symbol, scenario, result/hit): running sums come from a groupby and
+        each window only receives the last `size` outcomes of its series.
+        """
+        import numpy as np
+        n = len(frame)
+        if n == 0:
+            return 0
+        if 'result' in frame:
+            hits = (frame['result'].astype(str).str.strip().str.lower() == 'hit').to_numpy(np.int64)
+        else:
+            hits = frame['hit'].astype(str).str.strip().str.lower().isin(['1', 'true', 'hit', '1.0']).to_numpy(np.int64)
+        symbols = frame['symbol'].fillna('').astype(str).replace('', '/NQ') if 'symbol' in frame else '/NQ'
+        dates = frame['date'].astype(str).str[:10].replace({'': None, 'nan': None, 'None': None}) if 'date' in frame else None
+        df = frame.__class__({'hit': hits, 'symbol': symbols, 'scenario': frame['scenario'].fillna('').astype(str),
+                              'date': dates, 'all': ALL})
+        self._overall_history(df['hit'].to_numpy(), df['date'].tolist())
+        longest = max(self.windows, default=0)
+        for symbol_col, scenario_col in (('all', 'all'), ('symbol', 'all'), ('all', 'scenario'),
+                                         ('symbol', 'scenario')):
+            groups = df.groupby([symbol_col, scenario_col], sort=False)
+            totals = groups['hit'].agg(['size', 'sum'])
+            last_dates = groups['date'].last()
+            recent = groups['hit'].apply(lambda column: column.to_numpy()[-longest:]) if longest else None
+            for key, (count, total) in totals.iterrows():
+                series = self._get(key)
+                series.count += int(count)
+                series.hits += int(total)
+                if last_dates[key] is not None:
+                    series.last_date = last_dates[key]
+                if recent is not None:
+                    tail = recent[key]
+                    for window in series.windows:
+                        for hit in tail[-window.size:]:
+                            window.push(int(hit))
+        self.rows += n
+        return n
+
+    def _overall_history(self, hits, dates):
+        """Append the history points of the last `history` rows of a bulk update."""
+        import numpy as np
+        overall = self.series.get((ALL, ALL))
+        count, total = (overall.count, overall.hits) if overall else (0, 0)
+        # Outcomes still in the longest window seed the rolling sums of the first new rows
+        previous = max(overall.windows, key=lambda window: window.size).state() if overall and self.windows else ''
+        keep = min(len(hits), self.history.maxlen or 0)
+        if keep == 0:
+            return
+        sequence = np.concatenate([np.array([int(bit) for bit in previous], dtype=np.int64), hits])
+        sums = np.concatenate([[0], np.cumsum(sequence)])
+        new_sums = np.cumsum(hits)
+        for j in range(len(hits) - keep, len(hits)):
+            seen = count + j + 1
+            position = len(previous) + j + 1
+            point = [dates[j], (total + int(new_sums[j])) / seen]
+            for size in self.windows:
+                point.append(int(sums[position] - sums[position - size]) / size if seen >= size else None)
+            self.history.append(point)
+
+    def update_many(self, rows) -> int:
+        count = 0
+        for row in rows:
+            self.update(row)
+            count += 1
+        return count
+
+    def summary(self, symbol: str = ALL, scenario: str = ALL, p: float = 0.5) -> dict | None:
+        """Counts, hit rate, rolling hit rates and binomial p-value (vs p) of one series."""
+        series = self.series.get((symbol, scenario))
+        if series is None:
+            return None
+        return {
+            'symbol': symbol,
+            'scenario': scenario,
+            'count': series.count,
+            'hits': series.hits,
+            'hit_rate': series.hits / series.count if series.count else None,
+            'rolling': {str(window.size): window.rate() for window in series.windows},
+            'p_value': binomial_pvalue(series.hits, series.count, p),
+            'last_date': series.last_date,
+        }
+
+    def table(self, by: str = 'scenario', p: float = 0.5) -> list:
+        """Summaries of every series grouped by 'scenario', 'symbol', 'symbol_scenario' or 'all'."""
+        keys = {
+            'all': lambda s, c: s == ALL and c == ALL,
+            'symbol': lambda s, c: s != ALL and c == ALL,
+            'scenario': lambda s, c: s == ALL and c != ALL,
+            'symbol_scenario': lambda s, c: s != ALL and c != ALL,
+        }[by]
+        return [self.summary(s, c, p) for s, c in sorted(self.series) if keys(s, c)]
+
+    def trend(self) -> list:
+        """[date, cumulative hit rate, rolling rate per window...] for the last `history` rows."""
+        return [list(point) for point in self.history]
+
+    def state(self) -> dict:
+        return {
+            'version': SNAPSHOT_VERSION,
+            'windows': list(self.windows),
+            'rows': self.rows,
+            'source': self.source,
+            'history': {'maxlen': self.history.maxlen, 'points': list(self.history)},
+            'series': [
+                [symbol, scenario, series.count, series.hits, series.last_date,
+                 [window.state() for window in series.windows]]
+                for (symbol, scenario), series in self.series.items()
+            ],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'RollingMetrics':
+        if state.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported metrics snapshot version: {state.get('version')}")
+        history = state.get('history') or {}
+        metrics = cls(state['windows'], history.get('maxlen', DEFAULT_HISTORY))
+        metrics.history.extend(history.get('points', []))
+        metrics.rows = state['rows']
+        metrics.source = state.get('source') or {}
+        for symbol, scenario, count, hits, last_date, windows in state['series']:
+            series = metrics._get((symbol, scenario))
+            series.count, series.hits, series.last_date = count, hits, last_date
+            for window, bits in zip(series.windows, windows):
+                for bit in bits:
+                    window.push(1 if bit == '1' else 0)
+        return metrics
+
+    def save(self, path: str):
+        """Write the snapshot atomically."""
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.state(), f, separators=(',', ':'))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'RollingMetrics':
+        with open(path) as f:
+            return cls.from_state(json.load(f))
+
+    def _resumable(self, results_path: str, size: int) -> bool:
+        from .results_store import prefix_hash
+        source = self.source
+        offset = source.get('offset', 0)
+        return (source.get('path') == os.path.abspath(results_path)
+                and offset <= size
+                and source.get('prefix_hash') == prefix_hash(results_path, offset))
+
+    def refresh(self, results_path: str) -> int:
+        """
+        Consume the rows appended to a results CSV since the last refresh and
+        return how many were added. Only complete lines are read; if the
+        file was truncated or rewritten the metrics are rebuilt from the start.
+        """
+        from .results_store import prefix_hash
+        try:
+            size = os.path.getsize(results_path)
+        except FileNotFoundError:
+            return 0
+        if self.source and not self._resumable(results_path, size):
+            self.__init__(self.windows, self.history.maxlen)
+        offset = self.source.get('offset', 0)
+        with open(results_path, 'rb') as f:
+            f.seek(offset)
+            data = f.read(size - offset)
+        end = data.rfind(b'\n') + 1
+        if end == 0:
+            return 0
+        lines = io.StringIO(data[:end].decode('utf-8'), newline='')
+        header = self.source.get('header')
+        if offset == 0:
+            header = next(csv.reader([lines.readline()]))
+        if end > BULK_BYTES and 'scenario' in header:
+            import pandas as pd
+            usecols = [col for col in ('date', 'symbol', 'scenario', 'result', 'hit') if col in header]
+            added = self.update_frame(pd.read_csv(lines, header=None, names=header, usecols=usecols, dtype=str,
+                                                  keep_default_na=False))
+        elif 'result' in header and 'scenario' in header:
+            # Positional fast path over the results file columns
+            i_result, i_scenario = header.index('result'), header.index('scenario')
+            i_symbol = header.index('symbol') if 'symbol' in header else None
+            i_date = header.index('date') if 'date' in header else None
+            added = 0
+            for values in csv.reader(lines):
+                if len(values) <= max(i_result, i_scenario):
+                    continue
+                self._add(int(values[i_result].strip().lower() == 'hit'),
+                          (values[i_symbol] if i_symbol is not None and i_symbol < len(values) else '') or '/NQ',
+                          values[i_scenario],
+                          values[i_date][:10] or None if i_date is not None and i_date < len(values) else None)
+                added += 1
+        else:
+            added = self.update_many(csv.DictReader(lines, fieldnames=header))
+        offset += end
+        self.source = {'path': os.path.abspath(results_path), 'offset': offset, 'header': header,
+                       'prefix_hash': prefix_hash(results_path, offset)}
+        return added
+
+
+def load_metrics(results_path: str, snapshot_path: str | None = None, windows=WINDOWS,
+                 backend: str | None = None) -> RollingMetrics:
+    """
+    Metrics for a results file: the saved snapshot (if compatible) plus any
+    rows appended since, re-saved when new rows were found. A Parquet
+    results dataset has no append offset and is always aggregated in full.
+    """
+    from .results_store import read_results, results_backend
+    if results_backend(results_path, backend) == 'parquet':
+        metrics = RollingMetrics(windows)
+        df = read_results(results_path, columns=['date', 'symbol', 'scenario', 'result'], backend='parquet')
+        metrics.update_frame(df.sort_values(['date', 'symbol'], kind='stable'))
+        return metrics
+    snapshot_path = snapshot_path or snapshot_path_for(results_path)
+    try:
+        metrics = RollingMetrics.load(snapshot_path)
+        if metrics.windows != tuple(windows):
+            metrics = RollingMetrics(windows)
+    except (OSError, ValueError, KeyError):
+        metrics = RollingMetrics(windows)
+    if metrics.refresh(results_path):
+        metrics.save(snapshot_path)
+    return metrics
@@ -1,17 +1,27 @@
-import requests
 import logging
 import time
+import atexit
+import os
+import queue
+import threading
 from .config import load_config
 from pathlib import Path
-import smtplib
-from email.message import EmailMessage
 
-def notify(message: str, subject: str = "Prediction Logger Notification"):
+DEFAULT_SUBJECT = "Prediction Logger Notification"
+# Seconds to keep collecting messages into one digest after the first arrives
+DEFAULT_BATCH_WINDOW = 2.0
+DEFAULT_MAX_BATCH = 50
+# Seconds to wait for queued notifications at process exit
+DEFAULT_DRAIN_TIMEOUT = 30.0
+
+
+def _deliver(message: str, subject: str, cfg: dict) -> bool:
     """
     Send a notification to all configured channels (Slack, webhook, email).
     Retries Slack/webhook, falls back to secondary, and supports email if configured.
+    Uses the pooled keep-alive HTTP sessions and persistent SMTP connection
+    from prediction_logger.transport. Returns True if any channel accepted the message.
     """
-    cfg = load_config()
     slack_url = cfg.get('slack_webhook_url')
     secondary_url = cfg.get('secondary_webhook_url')
     email_to = cfg.get('notify_email_to')
@@ -20,14 +30,17 @@ def notify(message: str, subject: str = "Prediction Logger Notification"):
     smtp_port = int(cfg.get('smtp_port', 587)) if cfg.get('smtp_port') else 587
     smtp_user = cfg.get('smtp_user')
     smtp_pass = cfg.get('smtp_pass')
+    # requests/smtplib are only imported once something is actually delivered
+    from email.message import EmailMessage
+    from .transport import get_http_transport, get_smtp_transport
     payload = {'text': message}
+    http = get_http_transport()
     # Slack/webhook with retry
     sent = False
     if slack_url:
         for attempt in range(3):
             try:
-                resp = requests.post(slack_url, json=payload, timeout=5)
-                resp.raise_for_status()
+                http.post(slack_url, json=payload, timeout=5)
                 logging.info("Slack notification sent")
                 sent = True
                 break
@@ -37,8 +50,7 @@ def notify(message: str, subject: str = "Prediction Logger Notification"):
     # Fallback to secondary webhook
     if not sent and secondary_url:
         try:
-            resp = requests.post(secondary_url, json=payload, timeout=5)
-            resp.raise_for_status()
+            http.post(secondary_url, json=payload, timeout=5)
             logging.info("Secondary webhook notification sent")
             sent = True
         except Exception as e:
@@ -51,14 +63,155 @@ def notify(message: str, subject: str = "Prediction Logger Notification"):
             msg['Subject'] = subject
             msg['From'] = email_from
             msg['To'] = email_to
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                if smtp_user and smtp_pass:
-                    server.login(smtp_user, smtp_pass)
-                server.send_message(msg)
+            get_smtp_transport(smtp_server, smtp_port, smtp_user, smtp_pass).send(msg)
             logging.info("Email notification sent")
             sent = True
         except Exception as e:
             logging.error(f"Email notify failed: {e}")
     if not sent:
-        logging.error("All notification channels failed.")
\ No newline at end of file
+        logging.error("All notification channels failed.")
+    return sent
+
+
+def format_digest(messages: list) -> str:
+    """Combine several notifications into one digest message."""
+    if len(messages) == 1:
+        return messages[0]
+    return f"{len(messages)} notifications:\n" + "\n".join(f"- {message}" for message in messages)
+
+
+class NotificationDispatcher:
+    """
+    Background, thread-based notification queue.
+
+    submit() returns immediately; a single worker thread collects messages
+    that arrive within batch_window seconds of each other (up to max_batch)
+    and delivers them as one digest through the usual Slack -> secondary
+    webhook -> email fallback chain, so slow or dead endpoints never stall
+    the caller.
+    """
+
+    def __init__(self, batch_window: float = DEFAULT_BATCH_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self._pid = os.getpid()
+
+    def submit(self, message: str, subject: str, cfg: dict):
+        """Queue a notification for background delivery."""
+        if self._closed:
+            _deliver(message, subject, cfg)
+            return
+        self._ensure_worker()
+        self._queue.put((message, subject, cfg))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queued notification has been delivered (or timeout)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = DEFAULT_DRAIN_TIMEOUT):
+        """Drain queued notifications and stop the worker thread."""
+        if self._closed or os.getpid() != self._pid:
+            return
+        if not self.flush(timeout):
+            logging.error(f"Dropping {self._queue.qsize()} undelivered notification(s) at shutdown")
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=1)
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='notification-dispatcher', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    self._queue.task_done()
+                    break
+                batch.append(item)
+            try:
+                subjects = {subject for _, subject, _ in batch}
+                subject = subjects.pop() if len(subjects) == 1 else DEFAULT_SUBJECT
+                _deliver(format_digest([message for message, _, _ in batch]), subject, batch[-1][2])
+            except Exception as e:
+                logging.error(f"Notification dispatch failed: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher(cfg: dict | None = None) -> NotificationDispatcher:
+    """Return the process-wide dispatcher, creating it from config on first use."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            cfg = cfg or {}
+            _dispatcher = NotificationDispatcher(
+                batch_window=float(cfg.get('notify_batch_window', DEFAULT_BATCH_WINDOW)),
+                max_batch=int(cfg.get('notify_max_batch', DEFAULT_MAX_BATCH)),
+            )
+            drain_timeout = float(cfg.get('notify_drain_timeout', DEFAULT_DRAIN_TIMEOUT))
+            atexit.register(_dispatcher.close, drain_timeout)
+        return _dispatcher
+
+
+def _reset_dispatcher():
+    # A forked child inherits the dispatcher object but not its worker thread
+    global _dispatcher, _dispatcher_lock
+    _dispatcher = None
+    _dispatcher_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_dispatcher)
+
+
+def flush(timeout: float | None = None) -> bool:
+    """Wait for queued notifications to be delivered; True if the queue drained."""
+    return _dispatcher.flush(timeout) if _dispatcher is not None else True
+
+
+def notify(message: str, subject: str = DEFAULT_SUBJECT):
+    """
+    Send a notification to all configured channels (Slack, webhook, email).
+    Delivery happens on a background dispatcher and this call returns
+    immediately; bursts are coalesced into digests. Set notify_async: false
+    in config to deliver synchronously instead.
+    """
+    cfg = load_config()
+    if not cfg.get('notify_async', True):
+        _deliver(message, subject, cfg)
+        return
+    get_dispatcher(cfg).submit(message, subject, cfg)
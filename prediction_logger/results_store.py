@@ -0,0 +1,384 @@
+import abc
+import csv
+import hashlib
+import io
+import logging
+import os
+import uuid
+import yaml
+from datetime import date as date_type, datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: O_APPEND writes are still atomic per call
+    fcntl = None
+
+SCHEMA_VERSION = 'v1.0'
+# Result columns defined by schema v1.0 (see results_metadata.yaml)
+RESULT_FIELDS = ['date', 'symbol', 'predicted', 'actual', 'scenario', 'result', 'version']
+# Columns that are only present when tensor/LLM integration is enabled
+OPTIONAL_FIELDS = ['tensor_output', 'llm_summary']
+# Output paths with these extensions are written as a partitioned Parquet dataset
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+BACKENDS = ('csv', 'parquet')
+# Bytes hashed at each end of a consumed prefix to detect a rewritten results file
+PREFIX_WINDOW = 64 * 1024
+
+
+def metadata_path_for(csv_file: str) -> str:
+    """Return the schema/version metadata YAML path that belongs to a results file."""
+    return os.path.splitext(csv_file)[0] + '_metadata.yaml'
+
+
+def load_schema_fields(metadata_path: str | None = None) -> list:
+    """
+    Return the required result fields declared in a metadata YAML file.
+    Falls back to the schema v1.0 fields if the file does not exist.
+    """
+    if not metadata_path or not os.path.exists(metadata_path):
+        return list(RESULT_FIELDS)
+    with open(metadata_path, 'r') as f:
+        metadata = yaml.safe_load(f) or {}
+    fields = metadata.get('fields') or RESULT_FIELDS
+    names = [next(iter(field)) if isinstance(field, dict) else str(field) for field in fields]
+    return [name for name in names if name not in OPTIONAL_FIELDS]
+
+
+def read_header(csv_file: str) -> list | None:
+    """Read only the header line of a results file; None if the file is missing or empty."""
+    try:
+        with open(csv_file, 'r', newline='') as f:
+            line = f.readline()
+    except FileNotFoundError:
+        return None
+    if not line.strip():
+        return None
+    return next(csv.reader([line]))
+
+
+def results_backend(path: str, backend: str | None = None) -> str:
+    """
+    Resolve the results backend: an explicit 'csv'/'parquet' choice (the
+    results_backend config key) wins, otherwise the output path's extension.
+    """
+    if backend:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown results_backend: {backend}")
+        return backend
+    return 'parquet' if os.path.splitext(path)[1].lower() in PARQUET_EXTENSIONS else 'csv'
+
+
+def read_results(path: str, columns: list | None = None, symbols: list | None = None,
+                 start: date_type | None = None, end: date_type | None = None, backend: str | None = None):
+    """
+    Load results as a DataFrame, optionally projected to columns and filtered
+    to symbols and an inclusive [start, end] date window. The Parquet backend
+    pushes the projection and filters down to the dataset, so only matching
+    partitions and columns are read; the CSV backend parses only the needed
+    columns and filters afterwards.
+    """
+    if results_backend(path, backend) == 'parquet':
+        return ParquetResultsWriter.read(path, columns, symbols, start, end)
+    import pandas as pd
+    header = read_header(path)
+    if not header:
+        return pd.DataFrame(columns=columns or RESULT_FIELDS)
+    wanted = list(columns or header)
+    needed = set(wanted) | ({'symbol'} if symbols else set()) | ({'date'} if start or end else set())
+    df = pd.read_csv(path, usecols=[col for col in header if col in needed], dtype={'date': str, 'symbol': str})
+    if symbols:
+        df = df[df['symbol'].isin(symbols)]
+    if start:
+        df = df[df['date'] >= f"{start:%Y-%m-%d}"]
+    if end:
+        df = df[df['date'] <= f"{end:%Y-%m-%d}"]
+    return df[[col for col in wanted if col in df.columns]].reset_index(drop=True)
+
+
+def read_results_index(csv_file: str, backend: str | None = None) -> frozenset:
+    """
+    Return the set of (date, symbol) pairs already recorded in a results file.
+    Only the two key columns are parsed, so building the index stays cheap on
+    large histories.
+    """
+    if results_backend(csv_file, backend) == 'parquet':
+        df = read_results(csv_file, columns=['date', 'symbol'], backend='parquet')
+        return frozenset(zip(df['date'].astype(str), df['symbol'].astype(str)))
+    header = read_header(csv_file)
+    if not header or 'date' not in header:
+        return frozenset()
+    import pandas as pd
+    usecols = [col for col in ('date', 'symbol') if col in header]
+    df = pd.read_csv(csv_file, usecols=usecols, dtype=str)
+    symbols = df['symbol'] if 'symbol' in df else ['/NQ'] * len(df)
+    return frozenset(zip(df['date'], symbols))
+
+
+def prefix_hash(path: str, end: int) -> str:
+    """
+    Fingerprint of bytes [0, end) of a results file: the length plus the
+    first and last PREFIX_WINDOW bytes. Readers that resume from a byte
+    offset (metrics snapshots, validation checkpoints) use it to detect
+    truncation or a rewrite of the header or recent rows in O(1).
+    """
+    digest = hashlib.sha256(str(end).encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read(min(PREFIX_WINDOW, end)))
+        f.seek(max(0, end - PREFIX_WINDOW))
+        digest.update(f.read(min(PREFIX_WINDOW, end)))
+    return digest.hexdigest()
+
+
+def get_results_writer(path: str, backend: str | None = None, **kwargs):
+    """
+    Factory to create the results writer for an output path.
+    Supports 'csv' and 'parquet' backends, see results_backend().
+    """
+    if results_backend(path, backend) == 'parquet':
+        return ParquetResultsWriter(path, **kwargs)
+    return ResultsWriter(path, **kwargs)
+
+
+class BaseResultsWriter(abc.ABC):
+    """
+    Buffers result rows, checks them against the schema fields declared in
+    the results metadata YAML, and hands them to flush() in batches.
+    """
+
+    def __init__(self, path: str, metadata_path: str | None = None, buffer_size: int = 1000):
+        self.path = path
+        self.metadata_path = metadata_path or metadata_path_for(path)
+        self.buffer_size = buffer_size
+        self.required_fields = load_schema_fields(self.metadata_path)
+        self.fieldnames = None
+        self._buffer = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def append(self, row: dict):
+        """Buffer one result row, flushing when the buffer is full."""
+        missing = [field for field in self.required_fields if field not in row]
+        if missing:
+            raise ValueError(f"Result row missing required fields: {missing}")
+        self._buffer.append(row)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def extend(self, rows):
+        """Buffer many result rows."""
+        for row in rows:
+            self.append(row)
+
+    @abc.abstractmethod
+    def flush(self) -> int:
+        """Persist all buffered rows; returns the number of rows written."""
+        pass
+
+    def close(self):
+        self.flush()
+
+    def write_metadata(self):
+        """Write the schema/version metadata YAML next to the results file."""
+        metadata = {
+            'schema_version': SCHEMA_VERSION,
+            'fields': self.fieldnames or self.required_fields,
+            'last_updated': datetime.now().isoformat(),
+        }
+        with open(self.metadata_path, 'w') as f:
+            yaml.safe_dump(metadata, f)
+
+    def _new_header(self) -> list:
+        header = list(self.required_fields)
+        for row in self._buffer:
+            for key in row:
+                if key not in header:
+                    header.append(key)
+        return header
+
+    def _check_fields(self, row: dict) -> list:
+        """Return the keys of row to keep, rejecting fields outside the schema."""
+        keep = []
+        for key in row:
+            if key in self.fieldnames:
+                keep.append(key)
+            elif key in OPTIONAL_FIELDS:
+                logging.warning(f"Dropping '{key}': column not present in {self.path}")
+            else:
+                raise ValueError(f"Result row field '{key}' is not in results file header {self.fieldnames}")
+        return keep
+
+
+class ResultsWriter(BaseResultsWriter):
+    """
+    Append-only writer for the results CSV.
+
+    Rows are buffered in memory and appended with a single O_APPEND write
+    followed by fsync, so the cost of a flush depends only on the number of
+    buffered rows, never on the size of the existing history. The header is
+    written once, when the file is created, and checked against the schema
+    fields the first time an existing file is appended to.
+    """
+
+    def __init__(self, csv_file: str, metadata_path: str | None = None, buffer_size: int = 1000, fsync: bool = True):
+        super().__init__(csv_file, metadata_path, buffer_size)
+        self.csv_file = csv_file
+        self.fsync = fsync
+
+    def flush(self) -> int:
+        """
+        Append all buffered rows to the results file in one atomic write.
+        Returns the number of rows written.
+        """
+        if not self._buffer:
+            return 0
+        parent = os.path.dirname(self.csv_file)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+        fd = os.open(self.csv_file, flags, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            size = os.fstat(fd).st_size
+            out = io.StringIO()
+            if size == 0:
+                self.fieldnames = self._new_header()
+                csv.writer(out, lineterminator='\n').writerow(self.fieldnames)
+            else:
+                if self.fieldnames is None:
+                    self.fieldnames = self._existing_header()
+                if not self._ends_with_newline(size):
+                    out.write('\n')
+            writer = csv.DictWriter(out, fieldnames=self.fieldnames, lineterminator='\n', extrasaction='ignore')
+            for row in self._buffer:
+                writer.writerow({key: ('' if row[key] is None else row[key]) for key in self._check_fields(row)})
+            data = out.getvalue().encode('utf-8')
+            while data:
+                written = os.write(fd, data)
+                data = data[written:]
+            if self.fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        count = len(self._buffer)
+        self._buffer = []
+        logging.debug(f"Appended {count} result row(s) to {self.csv_file}")
+        return count
+
+    def write_metadata(self):
+        if self.fieldnames is None:
+            self.fieldnames = read_header(self.csv_file)
+        super().write_metadata()
+
+    def _existing_header(self) -> list:
+        header = read_header(self.csv_file) or []
+        missing = [field for field in self.required_fields if field not in header]
+        if missing:
+            raise ValueError(f"Results file {self.csv_file} header {header} does not match schema, missing {missing}")
+        return header
+
+    def _ends_with_newline(self, size: int) -> bool:
+        with open(self.csv_file, 'rb') as f:
+            f.seek(size - 1)
+            return f.read(1) in (b'\n', b'\r')
+
+
+class ParquetResultsWriter(BaseResultsWriter):
+    """
+    Columnar results backend: a Parquet dataset directory partitioned by
+    symbol and year/month (symbol_key=NQ/year=2025/month=8/part-*.parquet).
+
+    Each flush writes one new part file per touched partition (written to a
+    temporary name and renamed into place), so appends never rewrite history.
+    Columns are typed: date as date32, scenario/result/symbol as dictionary
+    (categorical) strings and predicted/actual as float64. Requires pyarrow.
+    """
+
+    PARTITIONING = ['symbol_key', 'year', 'month']
+
+    def __init__(self, path: str, metadata_path: str | None = None, buffer_size: int = 1000):
+        super().__init__(path, metadata_path, buffer_size)
+        self.fieldnames = self.required_fields + [f for f in OPTIONAL_FIELDS if f not in self.required_fields]
+
+    @staticmethod
+    def schema(fieldnames: list):
+        import pyarrow as pa
+        types = {
+            'date': pa.date32(),
+            'symbol': pa.dictionary(pa.int32(), pa.string()),
+            'predicted': pa.float64(),
+            'actual': pa.float64(),
+            'scenario': pa.dictionary(pa.int32(), pa.string()),
+            'result': pa.dictionary(pa.int32(), pa.string()),
+        }
+        return pa.schema([(name, types.get(name, pa.string())) for name in fieldnames])
+
+    def flush(self) -> int:
+        """
+        Write buffered rows as new part files, one per (symbol, year, month).
+        Returns the number of rows written.
+        """
+        if not self._buffer:
+            return 0
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from .sources import symbol_key
+        schema = self.schema(self.fieldnames)
+        partitions = {}
+        for row in self._buffer:
+            record = {key: row[key] for key in self._check_fields(row)}
+            day = datetime.strptime(str(record['date'])[:10], "%Y-%m-%d").date()
+            record['date'] = day
+            for key in OPTIONAL_FIELDS:
+                if record.get(key) is not None:
+                    record[key] = str(record[key])
+            partition = (symbol_key(str(record['symbol'])), day.year, day.month)
+            partitions.setdefault(partition, []).append(record)
+        for (key, year, month), records in partitions.items():
+            folder = os.path.join(self.path, f"symbol_key={key}", f"year={year}", f"month={month}")
+            os.makedirs(folder, exist_ok=True)
+            name = f"part-{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+            tmp_path = os.path.join(folder, '.' + name + '.tmp')
+            pq.write_table(pa.Table.from_pylist(records, schema=schema), tmp_path)
+            os.replace(tmp_path, os.path.join(folder, name))
+        count = len(self._buffer)
+        self._buffer = []
+        logging.debug(f"Wrote {count} result row(s) to {len(partitions)} partition(s) of {self.path}")
+        return count
+
+    @classmethod
+    def read(cls, path: str, columns: list | None = None, symbols: list | None = None,
+             start: date_type | None = None, end: date_type | None = None):
+        """Read a results dataset with column projection and partition/predicate pushdown."""
+        import pandas as pd
+        import pyarrow.dataset as ds
+        from .sources import symbol_key
+        if not os.path.isdir(path):
+            return pd.DataFrame(columns=columns or RESULT_FIELDS)
+        dataset = ds.dataset(path, format='parquet', partitioning='hive', exclude_invalid_files=True)
+        columns = columns or [name for name in dataset.schema.names if name not in cls.PARTITIONING]
+        expr = None
+
+        def both(a, b):
+            return b if a is None else a & b
+
+        if symbols:
+            expr = both(expr, ds.field('symbol_key').isin([symbol_key(s) for s in symbols]))
+            expr = expr & ds.field('symbol').cast('string').isin(list(symbols))
+        if start:
+            year, month = ds.field('year'), ds.field('month')
+            expr = both(expr, (year > start.year) | ((year == start.year) & (month >= start.month)))
+            expr = expr & (ds.field('date') >= _as_date(start))
+        if end:
+            year, month = ds.field('year'), ds.field('month')
+            expr = both(expr, (year < end.year) | ((year == end.year) & (month <= end.month)))
+            expr = expr & (ds.field('date') <= _as_date(end))
+        return dataset.to_table(columns=columns, filter=expr).to_pandas()
+
+
+def _as_date(value) -> date_type:
+    return value.date() if isinstance(value, datetime) else value
@@ -0,0 +1,98 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from .config import load_config
+from .evaluation import evaluate_scenarios
+from .logger import _enrich_batch, _iter_evaluations, _write_rows, build_row, iter_dates
+from .notifications import notify, flush as flush_notifications
+from .results_store import read_results_index
+from .sources import get_actuals_source_from_config, get_forecast_source_from_config
+
+DEFAULT_MAX_WORKERS = 4
+EXECUTORS = {
+    'process': ProcessPoolExecutor,
+    'thread': ThreadPoolExecutor,
+}
+
+
+def evaluate_symbol(cfg: dict, symbol: str, dates: list, existing=frozenset()) -> list:
+    """
+    Load forecasts and actuals for one symbol over the given dates and score them.
+    Runs inside a pool worker, so it only takes and returns picklable values.
+    Returns a list of (date, forecast, actuals, hit) tuples.
+    """
+    actuals_source = get_actuals_source_from_config(cfg, symbol=symbol)
+    source = get_forecast_source_from_config(cfg, actuals_source, symbol=symbol)
+    try:
+        records = list(_iter_evaluations(source, dates, existing))
+    finally:
+        # Pool processes exit without running atexit, so deliver queued errors now
+        flush_notifications()
+    hits = evaluate_scenarios([forecast for _, forecast, _ in records], [actuals for _, _, actuals in records])
+    return [(date, forecast, actuals, bool(hit)) for (date, forecast, actuals), hit in zip(records, hits)]
+
+
+def get_executor_from_config(cfg: dict, max_workers: int | None = None):
+    """
+    Factory to create the concurrent.futures pool used by run_symbols.
+    Supports 'process' (default) and 'thread' executors.
+    """
+    typ = cfg.get('executor', 'process')
+    if typ not in EXECUTORS:
+        raise ValueError(f"Unknown executor type: {typ}")
+    workers = int(max_workers or cfg.get('max_workers') or DEFAULT_MAX_WORKERS)
+    return EXECUTORS[typ](max_workers=workers)
+
+
+def run_symbols(start: datetime | None = None, end: datetime | None = None, symbols: list | None = None,
+                cfg: dict | None = None, tensor_model=None, translator=None, max_workers: int | None = None,
+                skip_existing: bool = True) -> int:
+    """
+    Evaluate many symbols for a date (or the range [start, end]) in parallel.
+
+    Each symbol's forecast/actuals loading and scoring runs in its own pool
+    task; a failing symbol is reported and skipped without aborting the
+    batch. Rows are merged in (date, symbol) order, enriched with the
+    optional tensor (one batched pass) and LLM outputs in this process, and committed in a single
+    bulk write. Returns the number of rows written.
+    """
+    cfg = cfg or load_config()
+    start = start or datetime.now()
+    end = end or start
+    symbols = list(symbols or cfg.get('symbols') or [cfg.get('target_symbol', '/NQ')])
+    dates = list(iter_dates(start, end))
+    csv_file = cfg['output_csv']
+    existing = {symbol: set() for symbol in symbols}
+    if skip_existing:
+        for key in read_results_index(csv_file, cfg.get('results_backend')):
+            if key[1] in existing:
+                existing[key[1]].add(key)
+
+    records = []
+    with get_executor_from_config(cfg, max_workers) as pool:
+        futures = {
+            pool.submit(evaluate_symbol, cfg, symbol, dates, frozenset(existing[symbol])): symbol
+            for symbol in symbols
+        }
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                records.extend((symbol, record) for record in future.result())
+            except Exception as e:
+                logging.error(f"Evaluation failed for {symbol}: {e}")
+                notify(f"Evaluation failed for {symbol} ({start:%Y-%m-%d}..{end:%Y-%m-%d}): {e}")
+
+    order = {symbol: i for i, symbol in enumerate(symbols)}
+    records.sort(key=lambda item: (item[1][0], order[item[0]]))
+    enrichments = _enrich_batch([(date, forecast, actuals) for _, (date, forecast, actuals, _) in records],
+                                tensor_model, translator)
+    rows = []
+    for (_, (date, forecast, actuals, hit)), (tensor_output, llm_summary) in zip(records, enrichments):
+        rows.append(build_row(date, forecast, actuals, hit, tensor_output, llm_summary))
+    if not rows:
+        logging.info(f"No new results for {len(symbols)} symbol(s)")
+        return 0
+    if not _write_rows(csv_file, rows, cfg.get('results_backend')):
+        return 0
+    logging.info(f"Recorded {len(rows)} result(s) for {len(symbols)} symbol(s)")
+    return len(rows)
@@ -1,11 +1,19 @@
 import abc
 import os
 import json
-from datetime import datetime
+import logging
+from datetime import datetime, timedelta
 from pathlib import Path
-from .forecast_schema import Forecast
+from .forecast_schema import Forecast, validate_forecasts
 from pydantic import ValidationError
 
+def symbol_key(symbol: str) -> str:
+    """
+    Return a filesystem-safe folder name for a symbol, e.g. '/NQ' -> 'NQ'.
+    """
+    return symbol.strip('/').replace('/', '_')
+
+
 class ForecastSource(abc.ABC):
     @abc.abstractmethod
     def load(self, date: datetime) -> dict:
@@ -13,20 +21,30 @@ class ForecastSource(abc.ABC):
         pass
 
 class JSONFileForecastSource(ForecastSource):
-    def __init__(self, folder: str, actuals_source=None):
-        self.folder = folder  # Keep the folder path as provided
+    """
+    Loads forecasts from YYYY-MM-DD.json files. When a symbol is given the
+    files live in a per-symbol subfolder (e.g. forecasts/NQ/) and the symbol
+    is added to each loaded forecast.
+    """
+    def __init__(self, folder: str, actuals_source=None, symbol: str | None = None):
+        self.folder = folder if symbol is None else os.path.join(folder, symbol_key(symbol))
         self.actuals_source = actuals_source
+        self.symbol = symbol
+
+    def path_for(self, date: datetime) -> str:
+        """Absolute path of the forecast file for a date."""
+        folder_path = self.folder
+        if not os.path.isabs(folder_path):
+            folder_path = os.path.abspath(os.path.join(os.getcwd(), self.folder))
+        return os.path.join(folder_path, date.strftime("%Y-%m-%d") + ".json")
 
     def load(self, date: datetime) -> dict:
         """
         Load and validate forecast data for a given date using pydantic schema.
         Returns the validated forecast dict or raises ValueError/ValidationError.
         """
-        folder_path = self.folder
-        if not os.path.isabs(folder_path):
-            folder_path = os.path.abspath(os.path.join(os.getcwd(), self.folder))
-
-        filename = os.path.join(folder_path, date.strftime("%Y-%m-%d") + ".json")
+        filename = self.path_for(date)
+        folder_path = os.path.dirname(filename)
         if not os.path.exists(folder_path):
             raise FileNotFoundError(f"Forecast directory not found: {folder_path}")
 
@@ -44,18 +62,150 @@ class JSONFileForecastSource(ForecastSource):
         except ValidationError as e:
             raise ValueError(f"Forecast schema validation failed for {date}: {e}")
         # Optionally, return the validated model as dict
-        return forecast.dict()
+        forecast = forecast.dict()
+        if self.symbol is not None:
+            forecast['symbol'] = self.symbol
+        return forecast
+
+    def load_range(self, start: datetime, end: datetime) -> dict:
+        """
+        Return {'YYYY-MM-DD': forecast} for every forecast file in [start, end],
+        validated in one batched call. Dates without a file are left out;
+        an unreadable or invalid file is logged and its date maps to the
+        ValueError load() would raise, so callers can report and skip it.
+        """
+        loaded, raw, errors = [], [], {}
+        day = start
+        while day <= end:
+            try:
+                with open(self.path_for(day), 'r') as f:
+                    raw.append(json.load(f))
+                loaded.append(day)
+            except FileNotFoundError:
+                pass
+            except json.JSONDecodeError as e:
+                errors[day.strftime("%Y-%m-%d")] = ValueError(f"Invalid forecast data for {day}: {e}")
+            day += timedelta(days=1)
+        forecasts, failed = validate_forecasts(raw)
+        result = {}
+        for i, day in enumerate(loaded):
+            if i in failed:
+                errors[day.strftime("%Y-%m-%d")] = ValueError(f"Forecast schema validation failed for {day}: {failed[i]}")
+                continue
+            if self.symbol is not None:
+                forecasts[i]['symbol'] = self.symbol
+            result[day.strftime("%Y-%m-%d")] = forecasts[i]
+        for key, error in errors.items():
+            logging.error(f"Skipping invalid forecast {key}: {error}")
+        result.update(errors)
+        return dict(sorted(result.items()))
 
     def get_actuals(self, date):
         return self.actuals_source.get_actuals(date) if self.actuals_source else None
 
+def get_forecast_source_from_config(cfg, actuals_source=None, symbol: str | None = None):
+    """
+    Factory to create a ForecastSource based on config dict.
+    Supports 'json' (per-date files in forecast_folder, the default) and
+    'sqlite' (the indexed store at forecast_store, see forecast_store.py).
+    A positive cache_size wraps the source in a shared LRU cache (cache.py).
+    """
+    typ = cfg.get('forecast_source', 'json')
+    if typ == 'json':
+        source = JSONFileForecastSource(cfg['forecast_folder'], actuals_source, symbol=symbol)
+    elif typ == 'sqlite':
+        from .forecast_store import SQLiteForecastSource
+        source = SQLiteForecastSource(cfg.get('forecast_store', './forecasts.db'), actuals_source, symbol=symbol)
+    else:
+        raise ValueError(f"Unknown forecast_source type: {typ}")
+    if cfg.get('cache_size'):
+        from .cache import CachedForecastSource, get_shared_cache
+        source = CachedForecastSource(source, get_shared_cache('forecasts', int(cfg['cache_size'])))
+    return source
+
+# Columns of the frame returned by ActualsSource.get_actuals_range
+ACTUALS_COLUMNS = ['date', 'symbol', 'open', 'high', 'low', 'close', 'prev_close']
+# Calendar days read before a range so its first row can get a prev_close
+PREV_CLOSE_LOOKBACK = 7
+
+
+def derive_prev_close(frame):
+    """
+    Fill missing prev_close values with each symbol's previous close, after
+    sorting by (symbol, date). Values already present are kept.
+    """
+    frame = frame.sort_values(['symbol', 'date'], kind='stable').reset_index(drop=True)
+    previous = frame.groupby('symbol', dropna=False, sort=False)['close'].shift()
+    frame['prev_close'] = frame['prev_close'].fillna(previous) if 'prev_close' in frame else previous
+    return frame
+
+
+def actuals_records(frame) -> dict:
+    """
+    Turn a get_actuals_range frame for one symbol into {'YYYY-MM-DD': actuals
+    dict} shaped like get_actuals() results (null columns are left out).
+    """
+    values = frame.drop(columns=['date', 'symbol'])
+    return {
+        date: {name: value for name, value in row.items() if value == value and value is not None}
+        for date, row in zip(frame['date'], values.to_dict('records'))
+    }
+
+
 class ActualsSource(abc.ABC):
+    symbol = None
+
     @abc.abstractmethod
     def get_actuals(self, date) -> dict:
         """Return a dict of actuals for the given date."""
         pass
 
+    def for_symbol(self, symbol):
+        """Return a source reading the given symbol's actuals."""
+        if symbol != self.symbol:
+            raise ValueError(f"{type(self).__name__} only serves symbol {self.symbol}")
+        return self
+
+    def get_actuals_range(self, start, end, symbols=None):
+        """
+        Return actuals for every available date in [start, end] as one
+        DataFrame with ACTUALS_COLUMNS (date as YYYY-MM-DD) plus any extra
+        fields, sorted by (symbol, date). prev_close is derived from the
+        previous close where the data does not carry it.
+
+        This default makes one get_actuals() call per day, reading a short
+        lookback so the first day also gets a prev_close; missing days are
+        skipped. Sources with a bulk format override it.
+        """
+        import pandas as pd
+        first = start - timedelta(days=PREV_CLOSE_LOOKBACK)
+        rows = []
+        for symbol in symbols or [self.symbol]:
+            source = self.for_symbol(symbol)
+            day = first
+            while day <= end:
+                try:
+                    actuals = source.get_actuals(day)
+                except FileNotFoundError:
+                    actuals = None
+                if isinstance(actuals, dict):
+                    rows.append({**actuals, 'date': day.strftime("%Y-%m-%d"), 'symbol': symbol})
+                day += timedelta(days=1)
+        frame = pd.DataFrame(rows)
+        for column in ACTUALS_COLUMNS:
+            if column not in frame:
+                frame[column] = None if column in ('date', 'symbol') else float('nan')
+        frame = derive_prev_close(frame)
+        frame = frame[frame['date'] >= start.strftime("%Y-%m-%d")]
+        return frame[ACTUALS_COLUMNS + [c for c in frame.columns if c not in ACTUALS_COLUMNS]].reset_index(drop=True)
+
 class StubActualsSource(ActualsSource):
+    def __init__(self, symbol: str | None = None):
+        self.symbol = symbol
+
+    def for_symbol(self, symbol):
+        return self if symbol == self.symbol else StubActualsSource(symbol)
+
     def get_actuals(self, date):
         return {
             'high': 23660,
@@ -67,13 +217,21 @@ class StubActualsSource(ActualsSource):
 class FileActualsSource(ActualsSource):
     """
     Loads actuals from a JSON file in a folder, named YYYY-MM-DD.actuals.json.
+    With a symbol the files live in the symbol's subfolder (e.g. actuals/NQ/).
     """
-    def __init__(self, folder):
-        self.folder = folder
+    def __init__(self, folder, symbol: str | None = None):
+        self.base_folder = folder
+        self.folder = folder if symbol is None else os.path.join(folder, symbol_key(symbol))
+        self.symbol = symbol
+
+    def for_symbol(self, symbol):
+        return self if symbol == self.symbol else FileActualsSource(self.base_folder, symbol)
+
+    def path_for(self, date) -> str:
+        return os.path.join(self.folder, date.strftime("%Y-%m-%d.actuals.json"))
 
     def get_actuals(self, date):
-        file_name = date.strftime("%Y-%m-%d.actuals.json")
-        file_path = os.path.join(self.folder, file_name)
+        file_path = self.path_for(date)
         try:
             with open(file_path, 'r') as f:
                 return json.load(f)
@@ -82,16 +240,91 @@ class FileActualsSource(ActualsSource):
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid actuals data for {date}: {e}")
 
-def get_actuals_source_from_config(cfg):
+
+class OHLCFileActualsSource(ActualsSource):
+    """
+    Reads actuals from one consolidated OHLC file (CSV, or Parquet by
+    extension) with columns date, open, high, low, close and optionally
+    symbol and prev_close. The file is parsed once and re-read only when its
+    mtime/size change; prev_close is derived from the previous row's close.
+    """
+    def __init__(self, path: str, symbol: str | None = None):
+        self.path = path
+        self.symbol = symbol
+        self._frame = None
+        self._version = None
+        self._records = {}
+
+    def for_symbol(self, symbol):
+        return self if symbol == self.symbol else OHLCFileActualsSource(self.path, symbol)
+
+    def _load(self):
+        import pandas as pd
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"OHLC actuals file not found: {self.path}")
+        version = (st.st_mtime_ns, st.st_size)
+        if self._frame is None or self._version != version:
+            if self.path.lower().endswith(('.parquet', '.pq')):
+                frame = pd.read_parquet(self.path)
+            else:
+                frame = pd.read_csv(self.path)
+            frame['date'] = pd.to_datetime(frame['date']).dt.strftime("%Y-%m-%d")
+            if 'symbol' in frame:
+                frame['symbol'] = frame['symbol'].map(symbol_key)
+            else:
+                frame['symbol'] = None
+            self._frame = derive_prev_close(frame)
+            self._version = version
+            self._records = {}
+        return self._frame
+
+    def _symbol_rows(self, frame, symbol):
+        if frame['symbol'].isna().all():
+            return frame
+        return frame[frame['symbol'] == symbol_key(symbol or '/NQ')]
+
+    def get_actuals(self, date):
+        self._load()
+        if self.symbol not in self._records:
+            self._records[self.symbol] = actuals_records(self._symbol_rows(self._frame, self.symbol))
+        try:
+            return dict(self._records[self.symbol][date.strftime("%Y-%m-%d")])
+        except KeyError:
+            raise FileNotFoundError(f"No actuals found for {date}")
+
+    def get_actuals_range(self, start, end, symbols=None):
+        import pandas as pd
+        frame = self._load()
+        window = frame[(frame['date'] >= start.strftime("%Y-%m-%d")) & (frame['date'] <= end.strftime("%Y-%m-%d"))]
+        parts = []
+        for symbol in symbols or [self.symbol]:
+            part = self._symbol_rows(window, symbol).copy()
+            part['symbol'] = symbol
+            parts.append(part)
+        frame = pd.concat(parts, ignore_index=True) if parts else window.iloc[:0]
+        return frame[ACTUALS_COLUMNS + [c for c in frame.columns if c not in ACTUALS_COLUMNS]]
+
+def get_actuals_source_from_config(cfg, symbol: str | None = None):
     """
     Factory to create an ActualsSource based on config dict.
-    Supports 'stub' and 'file' types.
+    Supports 'stub', 'file' and 'ohlc' types. With a symbol, file actuals are
+    read from the symbol's subfolder of actuals_folder and OHLC actuals are
+    filtered on the file's symbol column. 'ohlc' reads the consolidated
+    actuals_file (CSV or Parquet). A positive cache_size wraps file actuals
+    in a shared LRU cache (cache.py).
     """
     typ = cfg.get('actuals_source', 'stub')
     if typ == 'stub':
-        return StubActualsSource()
+        return StubActualsSource(symbol)
+    elif typ == 'ohlc':
+        return OHLCFileActualsSource(cfg.get('actuals_file', './actuals.csv'), symbol)
     elif typ == 'file':
-        folder = cfg.get('actuals_folder', './actuals')
-        return FileActualsSource(folder)
+        source = FileActualsSource(cfg.get('actuals_folder', './actuals'), symbol)
     else:
-        raise ValueError(f"Unknown actuals_source type: {typ}")
\ No newline at end of file
+        raise ValueError(f"Unknown actuals_source type: {typ}")
+    if cfg.get('cache_size'):
+        from .cache import CachedActualsSource, get_shared_cache
+        source = CachedActualsSource(source, get_shared_cache('actuals', int(cfg['cache_size'])))
+    return source
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Local stand-in for the thinkorswim market-data websocket.
+
+Waits for a {"action": "subscribe", "symbols": [...]} message, then streams
+random-walk ticks for the subscribed symbols as {"ticks": [...]} messages.
+Timestamps advance by tick_interval seconds of simulated time, so sessions
+(and completed bars) roll over quickly. Useful for tests, demos and
+benchmarks/bench_ingest.py:
+
+    python -m prediction_logger.stream_server --port 8765 --ticks 1000000
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+from datetime import datetime, timezone
+
+DEFAULT_START = datetime(2025, 7, 28, tzinfo=timezone.utc).timestamp()
+START_PRICES = {'NQ': 23500.0, 'ES': 6350.0}
+
+
+def tick_messages(symbols: list, ticks: int, batch: int = 100, tick_interval: float = 1.0,
+                  start: float = DEFAULT_START, seed: int = 0):
+    """Yield JSON messages carrying `ticks` ticks in total, `batch` per message."""
+    rng = random.Random(seed)
+    prices = {symbol: START_PRICES.get(symbol.strip('/'), 100.0) for symbol in symbols}
+    ts = start
+    sent = 0
+    while sent < ticks:
+        items = []
+        for _ in range(min(batch, ticks - sent)):
+            symbol = symbols[sent % len(symbols)]
+            prices[symbol] = round(prices[symbol] + rng.choice((-0.25, 0.0, 0.25)), 2)
+            items.append({'symbol': symbol, 'price': prices[symbol], 'size': rng.randint(1, 5), 'ts': ts})
+            ts += tick_interval
+            sent += 1
+        yield json.dumps({'ticks': items})
+
+
+async def serve(host: str = 'localhost', port: int = 8765, ticks: int = 100_000, batch: int = 100,
+                tick_interval: float = 1.0, close_after: int | None = None, ready=None, stop=None):
+    """
+    Run the stand-in server until stop (an asyncio.Event) is set. A
+    reconnecting client resumes the stream for its symbols where the last
+    connection left off; close_after drops each connection after that many
+    messages to exercise client reconnects. ready, if given, is called with
+    the bound port once the server is listening.
+    """
+    import websockets
+    streams = {}
+
+    async def handler(ws):
+        subscribe = json.loads(await ws.recv())
+        symbols = subscribe.get('symbols') or ['NQ']
+        await ws.send(json.dumps({'status': 'subscribed', 'symbols': symbols}))
+        stream = streams.setdefault(tuple(symbols), tick_messages(symbols, ticks, batch, tick_interval))
+        for i, message in enumerate(stream):
+            await ws.send(message)
+            if close_after is not None and i + 1 >= close_after:
+                break
+
+    stop = stop or asyncio.Event()
+    async with websockets.serve(handler, host, port, max_size=None) as server:
+        if ready is not None:
+            ready(server.sockets[0].getsockname()[1])
+        await stop.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in thinkorswim market-data websocket server.")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--ticks', type=int, default=100_000, help='Ticks streamed per connection')
+    parser.add_argument('--batch', type=int, default=100, help='Ticks per message')
+    parser.add_argument('--tick-interval', type=float, default=1.0, help='Simulated seconds between ticks')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    logging.info(f"Serving stand-in market data on ws://{args.host}:{args.port}")
+    asyncio.run(serve(args.host, args.port, args.ticks, args.batch, args.tick_interval))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,24 +1,173 @@
 import torch
 import logging
+import os
+import time
+import warnings
 from pathlib import Path
 
+# Rows per forward pass in predict_batch
+DEFAULT_BATCH_SIZE = 1024
+# Input width of the [resistance, close] features the logger feeds the model
+DEFAULT_NUM_FEATURES = 2
+# Artifact suffixes, in the order load() prefers them
+EXPORT_FORMATS = {'torchscript': '.ts', 'onnx': '.onnx'}
+
+
+def exported_path(model_path: str, fmt: str) -> Path:
+    """Where export_model writes the fmt artifact for model_path (model.pt -> model.ts / model.onnx)."""
+    return Path(model_path).with_suffix(EXPORT_FORMATS[fmt])
+
+
+def export_model(model_path: str, fmt: str = 'torchscript', output: str | None = None,
+                 num_features: int = DEFAULT_NUM_FEATURES) -> Path:
+    """
+    Convert a pickled eager model to an inference artifact that TensorModel.load
+    picks up automatically:
+    - torchscript: traced, frozen and optimized for inference (torch.jit),
+    - onnx: exported with a dynamic batch dimension (served with onnxruntime).
+    Returns the artifact path.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {sorted(EXPORT_FORMATS)}")
+    model = torch.load(model_path, map_location='cpu', weights_only=False)
+    model.eval()
+    output = Path(output) if output else exported_path(model_path, fmt)
+    example = torch.zeros(1, num_features)
+    tmp = output.with_name(output.name + '.tmp')
+    if fmt == 'torchscript':
+        # torch.jit is deprecated upstream in favour of torch.export but still the lightest CPU runtime here
+        with torch.inference_mode(), warnings.catch_warnings():
+            warnings.simplefilter('ignore', FutureWarning)
+            scripted = torch.jit.optimize_for_inference(torch.jit.freeze(torch.jit.trace(model, example)))
+            torch.jit.save(scripted, str(tmp))
+    else:
+        torch.onnx.export(model, (example,), str(tmp), input_names=['features'], output_names=['output'],
+                          dynamic_axes={'features': {0: 'batch'}, 'output': {0: 'batch'}}, dynamo=False)
+    os.replace(tmp, output)
+    logging.info(f"Exported {model_path} as {fmt} to {output}")
+    return output
+
+
 class TensorModel:
-    def __init__(self, model_path: str):
+    def __init__(self, model_path: str, batch_size: int = DEFAULT_BATCH_SIZE, num_threads: int | None = None,
+                 prefer_exported: bool = True):
         self.model_path = model_path
         self.model = None
+        self.batch_size = batch_size
+        self.num_threads = num_threads
+        self.prefer_exported = prefer_exported
+        self.backend = None
+        self.loaded_from = None
+        self.stats = {'load_ms': None, 'batches': 0, 'rows': 0, 'batch_ms_total': 0.0, 'batch_ms_max': 0.0}
+
+    def _artifact(self):
+        """The newest exported artifact that is at least as recent as model_path, if any."""
+        source = Path(self.model_path)
+        source_mtime = source.stat().st_mtime if source.exists() else None
+        for fmt in EXPORT_FORMATS:
+            path = exported_path(self.model_path, fmt)
+            if path.exists() and (source_mtime is None or path.stat().st_mtime >= source_mtime):
+                return fmt, path
+        return None, None
 
     def load(self):
-        if not Path(self.model_path).exists():
+        """
+        Load the model, preferring an up-to-date TorchScript or ONNX export of
+        model_path (see export_model) over unpickling the eager model.
+        """
+        start = time.perf_counter()
+        fmt, path = self._artifact() if self.prefer_exported else (None, None)
+        if fmt == 'onnx':
+            try:
+                import onnxruntime
+            except ImportError:
+                logging.warning(f"onnxruntime is not installed; ignoring {path}")
+                fmt, path = None, None
+        if fmt is None and not Path(self.model_path).exists():
             logging.error(f"Tensor model file not found: {self.model_path}")
             raise FileNotFoundError(f"Tensor model file not found: {self.model_path}")
-        self.model = torch.load(self.model_path, map_location='cpu')
-        self.model.eval()
-        logging.info(f"Loaded tensor model from {self.model_path}")
+        if fmt == 'torchscript':
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', FutureWarning)
+                self.model = torch.jit.load(str(path), map_location='cpu')
+        elif fmt == 'onnx':
+            options = onnxruntime.SessionOptions()
+            if self.num_threads:
+                options.intra_op_num_threads = int(self.num_threads)
+            self.model = onnxruntime.InferenceSession(str(path), options, providers=['CPUExecutionProvider'])
+        else:
+            path = self.model_path
+            self.model = torch.load(self.model_path, map_location='cpu', weights_only=False)
+            self.model.eval()
+        self.backend = fmt or 'eager'
+        self.loaded_from = str(path)
+        self.stats['load_ms'] = (time.perf_counter() - start) * 1000
+        logging.info(f"Loaded tensor model from {path} ({self.backend}) in {self.stats['load_ms']:.1f} ms")
+
+    def _forward(self, inputs: torch.Tensor) -> torch.Tensor:
+        if self.backend == 'onnx':
+            feed = {self.model.get_inputs()[0].name: inputs.numpy()}
+            return torch.from_numpy(self.model.run(None, feed)[0])
+        return self.model(inputs)
 
     def predict(self, features):
         if self.model is None:
             raise RuntimeError("Tensor model not loaded. Call load() first.")
         with torch.no_grad():
             input_tensor = torch.tensor(features, dtype=torch.float32).unsqueeze(0)
-            output = self.model(input_tensor)
+            output = self._forward(input_tensor)
             return output.squeeze().tolist()
+
+    def predict_batch(self, features, batch_size: int | None = None, num_threads: int | None = None) -> list:
+        """
+        Run the model over a (rows, features) array in mini-batches on CPU.
+        A float32, C-contiguous NumPy array is wrapped without copying. Runs
+        under torch.inference_mode with the intra-op thread count set to
+        num_threads (if given) for the duration of the call. Returns one
+        output per row, shaped like predict() returns it.
+        """
+        import numpy as np
+        if self.model is None:
+            raise RuntimeError("Tensor model not loaded. Call load() first.")
+        array = np.ascontiguousarray(features, dtype=np.float32)
+        if array.size == 0:
+            return []
+        if array.ndim == 1:
+            array = array.reshape(1, -1)
+        inputs = torch.from_numpy(array)
+        batch_size = batch_size or self.batch_size
+        num_threads = num_threads or self.num_threads
+        previous_threads = torch.get_num_threads()
+        if num_threads:
+            torch.set_num_threads(num_threads)
+        try:
+            outputs = []
+            with torch.inference_mode():
+                for start in range(0, len(inputs), batch_size):
+                    began = time.perf_counter()
+                    outputs.append(self._forward(inputs[start:start + batch_size]))
+                    self._record_batch(len(outputs[-1]), (time.perf_counter() - began) * 1000)
+                output = torch.cat(outputs).numpy()
+        finally:
+            if num_threads:
+                torch.set_num_threads(previous_threads)
+        return [row.squeeze().tolist() for row in output]
+
+    def _record_batch(self, rows: int, elapsed_ms: float):
+        self.stats['batches'] += 1
+        self.stats['rows'] += rows
+        self.stats['batch_ms_total'] += elapsed_ms
+        self.stats['batch_ms_max'] = max(self.stats['batch_ms_max'], elapsed_ms)
+
+    def latency_report(self) -> dict:
+        """Backend, load time and per-batch latency of predict_batch calls so far."""
+        batches = self.stats['batches']
+        return {
+            'backend': self.backend,
+            'loaded_from': self.loaded_from,
+            'load_ms': self.stats['load_ms'],
+            'batches': batches,
+            'rows': self.stats['rows'],
+            'batch_ms_avg': self.stats['batch_ms_total'] / batches if batches else None,
+            'batch_ms_max': self.stats['batch_ms_max'] if batches else None,
+        }
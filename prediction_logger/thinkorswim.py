@@ -1,30 +1,26 @@
 import asyncio
-import json
-import websockets
 import logging
 from .config import load_config
 from pathlib import Path
 
 
-async def _connect():
+async def _connect(stop: asyncio.Event | None = None):
+    """
+    Stream thinkorswim market data into session OHLC bars; completed bars
+    are persisted as actuals. Reconnects with jittered backoff until stopped.
+    """
+    from .ingest import get_ingester_from_config
     cfg = load_config()
-    host = cfg['thinkorswim']['host']
-    port = cfg['thinkorswim']['port']
-    use_ssl = cfg['thinkorswim']['use_ssl']
-    scheme = 'wss' if use_ssl else 'ws'
-    uri = f"{scheme}://{host}:{port}"
+    ingester = get_ingester_from_config(cfg)
     try:
-        async with websockets.connect(uri) as ws:
-            await ws.send(json.dumps({"action": "subscribe", "symbols": ["NQ"]}))
-            async for msg in ws:
-                data = json.loads(msg)
-                logging.debug(f"Received market data: {data}")
+        await ingester.run(stop)
     except Exception as e:
         logging.error(f"Thinkorswim socket error: {e}")
+    return ingester
 
 
 def run_socket():
     try:
         asyncio.run(_connect())
     except Exception as e:
-        logging.critical(f"Socket run failed: {e}")
\ No newline at end of file
+        logging.critical(f"Socket run failed: {e}")
@@ -1,27 +1,244 @@
-import openai
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
 import logging
 import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DEFAULT_MODEL = "gpt-3.5-turbo"
+# Requests in flight at once in summarize_many
+DEFAULT_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_BASE = 1.0
+DEFAULT_BACKOFF_MAX = 30.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def openai_client(**request):
+    """Default client: one blocking chat completion through the openai package."""
+    import openai
+    return openai.ChatCompletion.create(**request)
+
+
+def _content(response) -> str:
+    """Summary text from a client response (a plain string or an OpenAI-style completion)."""
+    if isinstance(response, str):
+        return response.strip()
+    return response.choices[0].message["content"].strip()
+
+
+def _status(error):
+    for owner in (error, getattr(error, 'response', None)):
+        for attr in ('http_status', 'status_code', 'status'):
+            value = getattr(owner, attr, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def _retry_after(error):
+    """Seconds from the Retry-After header of a rate-limit error, if it carries one."""
+    headers = getattr(error, 'headers', None) or getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        value = headers.get('retry-after') or headers.get('Retry-After')
+        return float(value) if value is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _retryable(error) -> bool:
+    if type(error).__name__ in ('RateLimitError', 'ServiceUnavailableError', 'APIConnectionError', 'Timeout',
+                                'APITimeoutError'):
+        return True
+    return _status(error) in RETRY_STATUSES
+
+
+class SummaryCache:
+    """
+    On-disk cache of summaries, one JSON file per sha256 of the request
+    (prompt, model and sampling parameters), written atomically so
+    concurrent runs never see partial entries.
+    """
+
+    def __init__(self, folder: str):
+        self.folder = Path(folder)
+
+    @staticmethod
+    def key(request: dict) -> str:
+        return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.folder / key[:2] / f"{key}.json"
+
+    def get(self, key: str):
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)['summary']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, summary: str):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'w') as f:
+            json.dump({'summary': summary}, f)
+        os.replace(tmp, path)
+
 
 class Translator:
-    def __init__(self, api_key=None):
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OpenAI API key not provided. Set OPENAI_API_KEY env variable or pass to Translator.")
-        openai.api_key = self.api_key
+    """
+    LLM summaries of tensor model outputs.
 
-    def summarize_tensor_output(self, tensor_output, context=None):
+    client is any callable taking the chat completion request (model,
+    messages, max_tokens, temperature) and returning the text or an
+    OpenAI-style response; it may be async. It defaults to the openai
+    package, so tests and offline runs can pass a local fake instead.
+    Results are cached on disk under cache_dir when given. Rate-limited and
+    transient failures are retried, honouring Retry-After, with jittered
+    exponential backoff.
+    """
+
+    def __init__(self, api_key=None, client=None, model: str = DEFAULT_MODEL, max_tokens: int = 128,
+                 temperature: float = 0.2, cache_dir: str | None = None, max_concurrency: int = DEFAULT_CONCURRENCY,
+                 max_retries: int = DEFAULT_MAX_RETRIES, backoff_base: float = DEFAULT_BACKOFF_BASE,
+                 backoff_max: float = DEFAULT_BACKOFF_MAX):
+        if client is None:
+            self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+            if not self.api_key:
+                raise ValueError("OpenAI API key not provided. Set OPENAI_API_KEY env variable or pass to Translator.")
+            import openai
+            openai.api_key = self.api_key
+        self.client = client or openai_client
+        self.model = model
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.cache = SummaryCache(cache_dir) if cache_dir else None
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stats = {'requests': 0, 'cache_hits': 0, 'retries': 0, 'failures': 0}
+
+    def request(self, tensor_output, context=None) -> dict:
         prompt = f"Summarize the following tensor model output for a trading forecast. Output: {tensor_output}."
         if context:
             prompt += f" Context: {context}"
-        try:
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=128,
-                temperature=0.2,
-            )
-            summary = response.choices[0].message["content"].strip()
+        return {
+            'model': self.model,
+            'messages': [{"role": "user", "content": prompt}],
+            'max_tokens': self.max_tokens,
+            'temperature': self.temperature,
+        }
+
+    def _cached(self, request: dict):
+        if self.cache is None:
+            return None, None
+        key = SummaryCache.key(request)
+        summary = self.cache.get(key)
+        if summary is not None:
+            self.stats['cache_hits'] += 1
+        return key, summary
+
+    def _store(self, key, summary):
+        if self.cache is not None and summary is not None:
+            try:
+                self.cache.put(key, summary)
+            except OSError as e:
+                logging.warning(f"Could not cache LLM summary: {e}")
+
+    def backoff(self, attempt: int, error=None) -> float:
+        """Delay before retry number attempt (0-based): Retry-After if given, else full-jitter exponential."""
+        retry_after = _retry_after(error) if error is not None else None
+        if retry_after is not None:
+            return retry_after + random.uniform(0, self.backoff_base)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def summarize_tensor_output(self, tensor_output, context=None):
+        request = self.request(tensor_output, context)
+        key, summary = self._cached(request)
+        if summary is not None:
             return summary
-        except Exception as e:
-            logging.error(f"OpenAI API error: {e}")
-            return None
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.stats['requests'] += 1
+                response = self.client(**request)
+                if inspect.isawaitable(response):
+                    response = asyncio.run(response)
+                summary = _content(response)
+                self._store(key, summary)
+                return summary
+            except Exception as e:
+                if attempt < self.max_retries and _retryable(e):
+                    self.stats['retries'] += 1
+                    time.sleep(self.backoff(attempt, e))
+                    continue
+                self.stats['failures'] += 1
+                logging.error(f"OpenAI API error: {e}")
+                return None
+
+    async def _summarize(self, request: dict, semaphore: asyncio.Semaphore, executor=None):
+        key, summary = self._cached(request)
+        if summary is not None:
+            return summary
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with semaphore:
+                    self.stats['requests'] += 1
+                    if inspect.iscoroutinefunction(self.client):
+                        response = await self.client(**request)
+                    else:
+                        response = await asyncio.get_running_loop().run_in_executor(
+                            executor, functools.partial(self.client, **request))
+                summary = _content(response)
+                self._store(key, summary)
+                return summary
+            except Exception as e:
+                if attempt < self.max_retries and _retryable(e):
+                    self.stats['retries'] += 1
+                    # Sleep outside the semaphore so other requests keep the slots busy
+                    await asyncio.sleep(self.backoff(attempt, e))
+                    continue
+                self.stats['failures'] += 1
+                logging.error(f"OpenAI API error: {e}")
+                return None
+
+    async def asummarize_many(self, items: list) -> list:
+        """
+        Summarize (tensor_output, context) pairs with at most max_concurrency
+        requests in flight; identical requests are sent once. Returns the
+        summaries (None for failures) in input order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        requests = [self.request(tensor_output, context) for tensor_output, context in items]
+        tasks = {}
+        # Blocking clients get one thread per concurrency slot (the loop's default pool is sized by CPU count)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='llm') as executor:
+            for request in requests:
+                key = SummaryCache.key(request)
+                if key not in tasks:
+                    tasks[key] = asyncio.ensure_future(self._summarize(request, semaphore, executor))
+            await asyncio.gather(*tasks.values())
+        return [tasks[SummaryCache.key(request)].result() for request in requests]
+
+    def summarize_many(self, items: list) -> list:
+        """Blocking wrapper around asummarize_many for callers outside an event loop."""
+        if not items:
+            return []
+        return asyncio.run(self.asummarize_many(items))
+
+
+def get_translator_from_config(cfg: dict) -> Translator:
+    """Translator for the openai client configured by the llm_* keys."""
+    return Translator(
+        api_key=cfg.get('openai_api_key'),
+        model=cfg.get('llm_model', DEFAULT_MODEL),
+        cache_dir=cfg.get('llm_cache_dir', 'data/llm_cache') or None,
+        max_concurrency=int(cfg.get('llm_max_concurrency', DEFAULT_CONCURRENCY)),
+        max_retries=int(cfg.get('llm_max_retries', DEFAULT_MAX_RETRIES)),
+    )
@@ -0,0 +1,240 @@
+import logging
+import os
+import smtplib
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_TIMEOUT = 5
+# Keep-alive connections held open per webhook host
+DEFAULT_POOL_SIZE = 4
+
+
+class TransportStats:
+    """
+    Thread-safe counters for one channel (an HTTP host or an SMTP server).
+    Of `requests` sends, `requests - new_connections` reused an open connection.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, latency: float, new_connections: int = 0, error: bool = False):
+        with self._lock:
+            self.requests += 1
+            self.new_connections += new_connections
+            self.errors += int(error)
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'new_connections': self.new_connections,
+                'reused_connections': max(self.requests - self.new_connections, 0),
+                'errors': self.errors,
+                'avg_latency_ms': 1000 * self.total_latency / self.requests if self.requests else 0.0,
+                'max_latency_ms': 1000 * self.max_latency,
+            }
+
+
+class HTTPTransport:
+    """
+    Keep-alive HTTP transport with one requests.Session per webhook host.
+
+    Reusing the session's urllib3 connection pool skips the TCP/TLS handshake
+    for every post after the first; new connections are counted from the
+    pool so reuse can be confirmed under burst load.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE):
+        self.pool_size = pool_size
+        self._sessions = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _session(self, host: str) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[host] = session
+                self._stats[host] = TransportStats()
+            return session
+
+    @staticmethod
+    def _connections_opened(session: requests.Session, url: str) -> int:
+        # Sessions are per host, so every urllib3 pool in the manager belongs to it
+        try:
+            pools = session.get_adapter(url).poolmanager.pools
+            return sum(pools[key].num_connections for key in pools.keys())
+        except Exception:
+            return 0
+
+    def post(self, url: str, json=None, timeout: float = DEFAULT_TIMEOUT) -> requests.Response:
+        """POST to url over the host's pooled session. Raises on HTTP errors."""
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        session = self._session(host)
+        opened = self._connections_opened(session, url)
+        start = time.perf_counter()
+        try:
+            resp = session.post(url, json=json, timeout=timeout)
+            resp.raise_for_status()
+        except Exception:
+            self._stats[host].record(time.perf_counter() - start,
+                                     self._connections_opened(session, url) - opened, error=True)
+            raise
+        self._stats[host].record(time.perf_counter() - start, self._connections_opened(session, url) - opened)
+        return resp
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {host: stats.as_dict() for host, stats in self._stats.items()}
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+class SMTPTransport:
+    """
+    Persistent SMTP connection, opened (STARTTLS + login) on first use and
+    reused for later messages. If the server has dropped the connection it
+    is re-established and re-authenticated once before giving up.
+    """
+
+    def __init__(self, server: str, port: int = 587, user: str | None = None, password: str | None = None,
+                 timeout: float = 30):
+        self.server = server
+        self.port = port
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+        self._conn = None
+        self._lock = threading.Lock()
+        self._stats = TransportStats()
+
+    def _connect(self) -> smtplib.SMTP:
+        conn = smtplib.SMTP(self.server, self.port, timeout=self.timeout)
+        conn.starttls()
+        if self.user and self.password:
+            conn.login(self.user, self.password)
+        return conn
+
+    def send(self, msg):
+        """Send an EmailMessage, reconnecting once if the connection went stale."""
+        with self._lock:
+            start = time.perf_counter()
+            new_connections = 0
+            try:
+                for attempt in range(2):
+                    if self._conn is None:
+                        self._conn = self._connect()
+                        new_connections += 1
+                    try:
+                        self._conn.send_message(msg)
+                        break
+                    except smtplib.SMTPServerDisconnected:
+                        self._drop()
+                        if attempt:
+                            raise
+                        logging.info(f"SMTP connection to {self.server} was closed, reconnecting")
+            except Exception:
+                self._drop()
+                self._stats.record(time.perf_counter() - start, new_connections, error=True)
+                raise
+            self._stats.record(time.perf_counter() - start, new_connections)
+
+    def _drop(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def stats(self) -> dict:
+        return self._stats.as_dict()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.quit()
+                except Exception:
+                    pass
+                self._conn = None
+
+
+_http = None
+_smtp = {}
+_lock = threading.Lock()
+
+
+def get_http_transport() -> HTTPTransport:
+    """Return the process-wide pooled HTTP transport."""
+    global _http
+    with _lock:
+        if _http is None:
+            _http = HTTPTransport()
+        return _http
+
+
+def get_smtp_transport(server: str, port: int = 587, user: str | None = None,
+                       password: str | None = None) -> SMTPTransport:
+    """Return the shared SMTP transport for this server/account."""
+    key = (server, port, user)
+    with _lock:
+        transport = _smtp.get(key)
+        if transport is None or transport.password != password:
+            transport = _smtp[key] = SMTPTransport(server, port, user, password)
+        return transport
+
+
+def transport_stats() -> dict:
+    """Connection-reuse and latency counters for every channel used so far."""
+    with _lock:
+        http, smtp = _http, dict(_smtp)
+    stats = dict(http.stats()) if http is not None else {}
+    for (server, port, _), transport in smtp.items():
+        stats[f"smtp://{server}:{port}"] = transport.stats()
+    return stats
+
+
+def close_transports():
+    """Close pooled HTTP sessions and SMTP connections."""
+    global _http
+    with _lock:
+        http, smtp = _http, list(_smtp.values())
+        _http = None
+        _smtp.clear()
+    if http is not None:
+        http.close()
+    for transport in smtp:
+        transport.close()
+
+
+def _reset_transports():
+    # Sockets inherited over fork must not be shared with the parent
+    global _http, _smtp, _lock
+    _http = None
+    _smtp = {}
+    _lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_transports)
@@ -1 +1,3 @@
-from pathlib import Path__version__ = "0.1.0"
\ No newline at end of file
+from pathlib import Path
+
+__version__ = "0.1.0"
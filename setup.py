@@ -10,10 +10,15 @@ setup(
         "click",
         "PyYAML",
         "pandas",
+        "numpy",
         "python-dateutil",
         "requests",
         "websockets",
     ],
+    extras_require={
+        'parquet': ['pyarrow'],
+        'webhook': ['flask', 'gunicorn'],
+    },
     entry_points={
         'console_scripts': [
             'prediction-logger=prediction_logger.cli:main',
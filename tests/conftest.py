@@ -0,0 +1,19 @@
+import json
+import pytest
+
+
+@pytest.fixture
+def write_forecast():
+    """Write a valid YYYY-MM-DD.json forecast into folder (created if needed); fields override the defaults."""
+    def write(folder, date, scenario='breakout', **fields):
+        folder.mkdir(parents=True, exist_ok=True)
+        with open(folder / f"{date}.json", 'w') as f:
+            json.dump({
+                "scenario": scenario,
+                "resistance": 23650,
+                "support": 23400,
+                "sigma_plus": None,
+                "sigma_minus": None,
+                **fields,
+            }, f)
+    return write
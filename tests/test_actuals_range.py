@@ -0,0 +1,60 @@
+import json
+from datetime import datetime
+import pandas as pd
+from prediction_logger import logger
+from prediction_logger.sources import (
+    FileActualsSource, OHLCFileActualsSource, StubActualsSource, get_actuals_source_from_config,
+)
+
+OHLC = """date,symbol,open,high,low,close
+2025-07-28,/NQ,23400,23500,23300,23450
+2025-07-29,/NQ,23450,23600,23400,23550
+2025-07-29,/ES,6300,6350,6280,6340
+2025-07-30,/NQ,23550,23650,23500,23520
+2025-07-31,/NQ,23520,23700,23480,23690
+"""
+
+
+def test_ohlc_range_derives_prev_close(tmp_path):
+    path = tmp_path / 'ohlc.csv'
+    path.write_text(OHLC)
+    source = get_actuals_source_from_config({'actuals_source': 'ohlc', 'actuals_file': str(path)}, symbol='/NQ')
+    frame = source.get_actuals_range(datetime(2025, 7, 29), datetime(2025, 7, 31))
+    assert list(frame['date']) == ['2025-07-29', '2025-07-30', '2025-07-31']
+    assert list(frame['prev_close']) == [23450, 23550, 23520]
+    assert source.get_actuals(datetime(2025, 7, 31))['prev_close'] == 23520
+
+    both = source.get_actuals_range(datetime(2025, 7, 29), datetime(2025, 7, 29), symbols=['/NQ', '/ES'])
+    assert list(zip(both['symbol'], both['close'])) == [('/NQ', 23550), ('/ES', 6340)]
+
+
+def test_default_range_reads_per_date_files(tmp_path):
+    for day, close in (('2025-07-30', 100), ('2025-07-31', 101)):
+        folder = tmp_path / 'NQ'
+        folder.mkdir(exist_ok=True)
+        with open(folder / f"{day}.actuals.json", 'w') as f:
+            json.dump({'open': 99, 'high': 102, 'low': 98, 'close': close}, f)
+    source = FileActualsSource(str(tmp_path), symbol='/NQ')
+    frame = source.get_actuals_range(datetime(2025, 7, 31), datetime(2025, 8, 1))
+    assert list(frame['date']) == ['2025-07-31']
+    assert frame['prev_close'].iloc[0] == 100
+    stub = StubActualsSource().get_actuals_range(datetime(2025, 7, 30), datetime(2025, 7, 31), symbols=['/NQ', '/ES'])
+    assert len(stub) == 4
+
+
+def test_run_range_scores_momentum_from_ohlc(monkeypatch, tmp_path):
+    (tmp_path / 'ohlc.csv').write_text(OHLC)
+    forecast_folder = tmp_path / 'forecast'
+    forecast_folder.mkdir()
+    for day in ('2025-07-30', '2025-07-31'):
+        with open(forecast_folder / f"{day}.json", 'w') as f:
+            json.dump({"scenario": "momentum", "resistance": 23650, "support": None,
+                       "sigma_plus": None, "sigma_minus": None}, f)
+    monkeypatch.setattr(logger, 'load_config', lambda: {
+        'forecast_folder': str(forecast_folder),
+        'output_csv': str(tmp_path / 'results.csv'),
+    })
+    monkeypatch.setattr(logger, 'notify', lambda *a, **kw: None)
+    source = OHLCFileActualsSource(str(tmp_path / 'ohlc.csv'))
+    assert logger.run_range(datetime(2025, 7, 30), datetime(2025, 7, 31), actuals_source=source) == 2
+    assert list(pd.read_csv(tmp_path / 'results.csv')['result']) == ['miss', 'hit']
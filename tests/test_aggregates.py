@@ -0,0 +1,126 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+import random
+import pandas as pd
+import pytest
+from prediction_logger import aggregates as aggregates_module
+from prediction_logger.aggregates import DailyAggregates
+from prediction_logger.metrics import ALL, binomial_pvalue
+from prediction_logger.results_store import ResultsWriter
+
+SCENARIOS = ['fade', 'breakout', 'range']
+
+
+def make_rows(n, seed=0, shuffle=False):
+    rng = random.Random(seed)
+    rows = [{'date': f"2025-{1 + i // 5 // 28 % 12:02d}-{1 + i // 5 % 28:02d}",
+             'symbol': rng.choice(['/NQ', '/ES']), 'predicted': 1, 'actual': 1,
+             'scenario': rng.choice(SCENARIOS), 'result': rng.choice(['hit', 'miss']), 'version': 'v1.0'}
+            for i in range(n)]
+    if shuffle:
+        rng.shuffle(rows)
+    return rows
+
+
+def write(path, rows):
+    with ResultsWriter(str(path), fsync=False) as writer:
+        writer.extend(rows)
+
+
+def reference(rows, symbol=ALL, scenario=ALL, start=None, end=None):
+    df = pd.DataFrame(rows)
+    mask = pd.Series(True, index=df.index)
+    if symbol != ALL:
+        mask &= df['symbol'] == symbol
+    if scenario != ALL:
+        mask &= df['scenario'] == scenario
+    if start:
+        mask &= df['date'] >= start
+    if end:
+        mask &= df['date'] <= end
+    selected = df[mask]
+    return len(selected), int((selected['result'] == 'hit').sum()), selected['date'].nunique()
+
+
+@pytest.mark.parametrize('bulk', [False, True])
+@pytest.mark.parametrize('shuffle', [False, True])
+def test_range_queries_match_pandas(monkeypatch, tmp_path, shuffle, bulk):
+    if bulk:
+        monkeypatch.setattr(aggregates_module, 'BULK_BYTES', 0)
+    rows = make_rows(400, shuffle=shuffle)
+    write(tmp_path / 'results.csv', rows)
+    aggregates = DailyAggregates(str(tmp_path / 'results.csv'))
+    aggregates.refresh()
+    for symbol in (ALL, '/NQ', '/ES', '/CL'):
+        for scenario in [ALL] + SCENARIOS:
+            for start, end in ((None, None), ('2025-01-05', '2025-02-10'), ('2025-03-01', None),
+                               (None, '2025-01-01'), ('2025-02-10', '2025-01-05')):
+                result = aggregates.query(symbol, scenario, start, end)
+                count, hits, days = reference(rows, symbol, scenario, start, end) if start is None or end is None \
+                    or start <= end else (0, 0, 0)
+                assert (result['count'], result['hits'], result['days']) == (count, hits, days)
+                assert result['p_value'] == binomial_pvalue(hits, count)
+
+
+def test_last_sessions_and_daily(tmp_path):
+    rows = make_rows(300)
+    write(tmp_path / 'results.csv', rows)
+    aggregates = DailyAggregates(str(tmp_path / 'results.csv'))
+    aggregates.refresh()
+    nq_days = sorted({row['date'] for row in rows if row['symbol'] == '/NQ'})
+    result = aggregates.query('/NQ', 'breakout', last=10)
+    assert result['start'] == nq_days[-10]
+    assert (result['count'], result['hits']) == reference(rows, '/NQ', 'breakout', nq_days[-10])[:2]
+    daily = aggregates.daily('/NQ', ALL, nq_days[-3])
+    assert [day['date'] for day in daily] == nq_days[-3:]
+    assert sum(day['count'] for day in daily) == reference(rows, '/NQ', ALL, nq_days[-3])[0]
+    assert aggregates.keys()['symbols'] == ['/ES', '/NQ']
+
+
+def test_refresh_reads_appends_and_detects_rewrites(tmp_path):
+    path = tmp_path / 'results.csv'
+    rows = make_rows(200, shuffle=True)
+    write(path, rows[:120])
+    aggregates = DailyAggregates(str(path))
+    first = aggregates.refresh()
+    assert aggregates.refresh() == first
+    write(path, rows[120:])
+    second = aggregates.refresh()
+    assert second != first
+    assert aggregates.query()['count'] == 200
+    assert aggregates.query('/ES', 'fade')['hits'] == reference(rows, '/ES', 'fade')[1]
+    path.unlink()
+    write(path, rows[:50])
+    aggregates.refresh()
+    assert aggregates.query()['count'] == 50
+    assert aggregates.query('/NQ')['hits'] == reference(rows[:50], '/NQ')[1]
+    # Rewritten with only part of a header so far: no rows, and a version the old answers do not match
+    version = aggregates.refresh()
+    path.write_text('date,sym')
+    assert aggregates.refresh() != version
+    assert aggregates.query()['count'] == 0
+
+
+def test_service_etags(monkeypatch, tmp_path):
+    import metrics_service
+    path = tmp_path / 'results.csv'
+    rows = make_rows(100)
+    write(path, rows)
+    monkeypatch.setattr(metrics_service, 'aggregates', DailyAggregates(str(path)))
+    monkeypatch.setattr(metrics_service, 'responses', metrics_service.LRUCache(16))
+    client = metrics_service.app.test_client()
+    url = '/metrics/hit_rate?symbol=/NQ&scenario=breakout&last=5'
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert response.get_json()['count'] == reference(rows, '/NQ', 'breakout',
+                                                     sorted({r['date'] for r in rows if r['symbol'] == '/NQ'})[-5])[0]
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/metrics/hit_rate?symbol=/ES', headers={'If-None-Match': etag}).status_code == 200
+    write(path, make_rows(10, seed=1))
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200 and response.headers['ETag'] != etag
+    assert client.get('/metrics/hit_rate?start=2025-13-01').status_code == 400
+    assert client.get('/metrics/daily?symbol=/ES').status_code == 200
@@ -0,0 +1,98 @@
+import json
+import pandas as pd
+from datetime import datetime
+from click.testing import CliRunner
+from prediction_logger import cli, logger
+from prediction_logger.sources import FileActualsSource, JSONFileForecastSource, StubActualsSource
+
+
+def patch_config(monkeypatch, tmp_path):
+    forecast_folder = tmp_path / 'forecast'
+    forecast_folder.mkdir()
+    output_csv = tmp_path / 'results.csv'
+    monkeypatch.setattr(logger, 'load_config', lambda: {
+        'forecast_folder': str(forecast_folder),
+        'output_csv': str(output_csv),
+    })
+    monkeypatch.setattr(logger, 'notify', lambda *a, **kw: None)
+    return forecast_folder, output_csv
+
+
+def test_run_range_writes_all_dates_once(monkeypatch, tmp_path, write_forecast):
+    forecast_folder, output_csv = patch_config(monkeypatch, tmp_path)
+    write_forecast(forecast_folder, '2025-07-29', 'breakout')
+    write_forecast(forecast_folder, '2025-07-31', 'range')
+    written = logger.run_range(datetime(2025, 7, 28), datetime(2025, 8, 1), actuals_source=StubActualsSource())
+    assert written == 2
+    df = pd.read_csv(output_csv)
+    assert list(df['date']) == ['2025-07-29', '2025-07-31']
+    assert list(df['result']) == ['hit', 'miss']
+
+
+def test_run_range_skips_recorded_dates(monkeypatch, tmp_path, write_forecast):
+    forecast_folder, output_csv = patch_config(monkeypatch, tmp_path)
+    write_forecast(forecast_folder, '2025-07-30')
+    assert logger.run_range(datetime(2025, 7, 30), datetime(2025, 7, 30)) == 1
+    write_forecast(forecast_folder, '2025-07-31')
+    assert logger.run_range(datetime(2025, 7, 30), datetime(2025, 7, 31)) == 1
+    assert list(pd.read_csv(output_csv)['date']) == ['2025-07-30', '2025-07-31']
+
+
+def test_run_range_reports_invalid_forecasts(monkeypatch, tmp_path, write_forecast):
+    forecast_folder, output_csv = patch_config(monkeypatch, tmp_path)
+    messages = []
+    monkeypatch.setattr(logger, 'notify', messages.append)
+    write_forecast(forecast_folder, '2025-07-30')
+    (forecast_folder / '2025-07-31.json').write_text(json.dumps({"scenario": "fade", "resistance": 23650}))
+    assert logger.run_range(datetime(2025, 7, 30), datetime(2025, 7, 31)) == 1
+    assert len(messages) == 1 and 'schema validation failed' in messages[0]
+
+
+def test_run_range_loads_json_folder_in_one_batch(monkeypatch, tmp_path, write_forecast):
+    forecast_folder, output_csv = patch_config(monkeypatch, tmp_path)
+    for day in ('2025-07-29', '2025-07-30', '2025-07-31'):
+        write_forecast(forecast_folder, day)
+    windows = []
+    load_range = JSONFileForecastSource.load_range
+    monkeypatch.setattr(JSONFileForecastSource, 'load_range',
+                        lambda self, start, end: windows.append((start, end)) or load_range(self, start, end))
+
+    def no_point_loads(self, date):
+        raise AssertionError("run_range should not load forecasts one date at a time")
+    monkeypatch.setattr(JSONFileForecastSource, 'load', no_point_loads)
+    assert logger.run_range(datetime(2025, 7, 28), datetime(2025, 8, 1), actuals_source=StubActualsSource()) == 3
+    assert windows == [(datetime(2025, 7, 28), datetime(2025, 8, 1))]
+
+
+def test_run_derives_prev_close_for_momentum(monkeypatch, tmp_path, write_forecast):
+    forecast_folder, output_csv = patch_config(monkeypatch, tmp_path)
+    write_forecast(forecast_folder, '2025-07-31', 'momentum')
+    actuals_folder = tmp_path / 'actuals'
+    actuals_folder.mkdir()
+    for day, close in (('2025-07-29', 23400), ('2025-07-31', 23500)):
+        (actuals_folder / f"{day}.actuals.json").write_text(json.dumps({"high": 23600, "low": 23300, "close": close}))
+    # A corrupt lookback file is skipped, not fatal
+    (actuals_folder / '2025-07-30.actuals.json').write_text("{corrupt")
+    (actuals_folder / '2025-07-27.actuals.json').write_text("{corrupt")
+    logger.run(datetime(2025, 7, 31), actuals_source=FileActualsSource(str(actuals_folder)))
+    assert list(pd.read_csv(output_csv)['result']) == ['hit']
+
+
+def test_run_reads_only_todays_actuals(monkeypatch, tmp_path, write_forecast):
+    forecast_folder, output_csv = patch_config(monkeypatch, tmp_path)
+    write_forecast(forecast_folder, '2025-07-31', 'breakout')
+    read = []
+
+    class Recording(StubActualsSource):
+        def get_actuals(self, date):
+            read.append(date)
+            return super().get_actuals(date)
+    logger.run(datetime(2025, 7, 31), actuals_source=Recording())
+    assert read == [datetime(2025, 7, 31)]
+    assert list(pd.read_csv(output_csv)['result']) == ['hit']
+
+
+def test_cli_rejects_date_with_range():
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ['--date', '2025-07-31', '--start', '2025-07-01'])
+    assert result.exit_code != 0
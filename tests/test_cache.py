@@ -0,0 +1,61 @@
+import json
+import os
+from datetime import datetime
+from prediction_logger.cache import CachedActualsSource, CachedForecastSource, LRUCache
+from prediction_logger.sources import FileActualsSource, JSONFileForecastSource, StubActualsSource
+
+
+class CountingSource(JSONFileForecastSource):
+    loads = 0
+
+    def load(self, date):
+        self.loads += 1
+        return super().load(date)
+
+
+def test_repeated_loads_hit_cache(tmp_path, write_forecast):
+    write_forecast(tmp_path, '2025-07-31')
+    source = CountingSource(str(tmp_path))
+    cached = CachedForecastSource(source)
+    for _ in range(3):
+        assert cached.load(datetime(2025, 7, 31))['resistance'] == 23650
+    assert source.loads == 1
+    assert cached.stats()['hits'] == 2 and cached.stats()['misses'] == 1
+
+
+def test_rewritten_file_invalidates_entry(tmp_path, write_forecast):
+    write_forecast(tmp_path, '2025-07-31')
+    cached = CachedForecastSource(JSONFileForecastSource(str(tmp_path)))
+    cached.load(datetime(2025, 7, 31))
+    write_forecast(tmp_path, '2025-07-31', resistance=23700)
+    os.utime(tmp_path / '2025-07-31.json', ns=(1, 1))
+    assert cached.load(datetime(2025, 7, 31))['resistance'] == 23700
+
+
+def test_range_reuses_cached_dates(tmp_path, write_forecast):
+    for day in ('2025-07-29', '2025-07-30', '2025-07-31'):
+        write_forecast(tmp_path, day)
+    cached = CachedForecastSource(JSONFileForecastSource(str(tmp_path)))
+    cached.load(datetime(2025, 7, 30))
+    forecasts = cached.load_range(datetime(2025, 7, 28), datetime(2025, 7, 31))
+    assert list(forecasts) == ['2025-07-29', '2025-07-30', '2025-07-31']
+    cached.load_range(datetime(2025, 7, 28), datetime(2025, 7, 31))
+    assert cached.stats()['size'] == 3
+    assert cached.stats()['hits'] == 4
+
+
+def test_lru_eviction_and_passthrough(tmp_path):
+    cache = LRUCache(maxsize=2)
+    for key in 'abc':
+        cache.put(key, {'v': key})
+    assert cache.get('a') is None and cache.get('c') == {'v': 'c'}
+    assert cache.stats()['evictions'] == 1
+
+    with open(tmp_path / '2025-07-31.actuals.json', 'w') as f:
+        json.dump({'high': 1, 'low': 0, 'close': 1}, f)
+    actuals = CachedActualsSource(FileActualsSource(str(tmp_path)))
+    actuals.get_actuals(datetime(2025, 7, 31))
+    assert actuals.get_actuals(datetime(2025, 7, 31))['close'] == 1
+    stub = CachedActualsSource(StubActualsSource())
+    assert stub.get_actuals(datetime(2025, 7, 31))['close'] == 23500
+    assert stub.stats()['hits'] == stub.stats()['misses'] == 0
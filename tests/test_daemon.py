@@ -0,0 +1,80 @@
+import json
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, time as time_type, timezone
+import pytest
+from prediction_logger import logger
+from prediction_logger.daemon import Daemon, next_run, parse_schedule_time
+
+
+def test_parse_schedule_time_accepts_yaml_sexagesimal():
+    assert parse_schedule_time(990) == (16, 30)  # unquoted 16:30 in YAML 1.1
+    assert parse_schedule_time("16:30") == (16, 30)
+    assert parse_schedule_time(" 9:05 ") == (9, 5)
+    assert parse_schedule_time(time_type(6, 0)) == (6, 0)
+    with pytest.raises(ValueError):
+        parse_schedule_time("25:00")
+    with pytest.raises(ValueError):
+        parse_schedule_time("noon")
+
+
+def test_next_run_rolls_to_next_day():
+    now = datetime(2025, 7, 31, 16, 30, tzinfo=timezone.utc)
+    assert next_run(now, 16, 30) == datetime(2025, 8, 1, 16, 30, tzinfo=timezone.utc)
+    assert next_run(now, 17, 0) == datetime(2025, 7, 31, 17, 0, tzinfo=timezone.utc)
+
+
+def request(daemon, method, path):
+    req = urllib.request.Request(f"http://127.0.0.1:{daemon.port}{path}", method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def wait_for_cycles(daemon, count):
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        status, health = request(daemon, 'GET', '/health')
+        if health['cycles'] >= count and not health['running']:
+            return health
+        time.sleep(0.05)
+    raise AssertionError("cycle did not finish")
+
+
+def test_trigger_runs_cycle_and_health_reports_it(monkeypatch, tmp_path):
+    (tmp_path / 'ohlc.csv').write_text("date,open,high,low,close\n2025-07-31,23520,23700,23480,23690\n")
+    (tmp_path / 'forecast').mkdir()
+    (tmp_path / 'forecast' / '2025-07-31.json').write_text(json.dumps(
+        {"scenario": "breakout", "resistance": 23650, "support": None, "sigma_plus": None, "sigma_minus": None}))
+    cfg = {'forecast_folder': str(tmp_path / 'forecast'), 'output_csv': str(tmp_path / 'results.csv'),
+           'schedule_time': 990, 'actuals_source': 'ohlc', 'actuals_file': str(tmp_path / 'ohlc.csv')}
+    monkeypatch.setattr(logger, 'load_config', lambda: cfg)
+    monkeypatch.setattr(logger, 'notify', lambda *a, **kw: None)
+    daemon = Daemon(cfg, host='127.0.0.1', port=0)
+    daemon.start()
+    try:
+        status, health = request(daemon, 'GET', '/health')
+        assert status == 200 and health['status'] == 'ok' and health['next_run'].endswith('16:30:00+00:00')
+        assert request(daemon, 'POST', '/trigger?date=2025-07-31')[0] == 202
+        health = wait_for_cycles(daemon, 1)
+        assert health['last_rows'] == 1 and health['last_date'] == '2025-07-31' and health['last_error'] is None
+        # Rows already recorded are skipped on a re-run
+        assert request(daemon, 'POST', '/trigger?date=2025-07-31')[0] == 202
+        assert wait_for_cycles(daemon, 2)['last_rows'] == 0
+        assert request(daemon, 'POST', '/trigger?date=31-07-2025')[0] == 400
+        assert request(daemon, 'GET', '/nope')[0] == 404
+    finally:
+        daemon.shutdown()
+
+
+def test_trigger_refused_while_cycle_running():
+    daemon = Daemon({'schedule_time': '16:30'}, port=0)
+    daemon._cycle_lock.acquire()
+    try:
+        assert daemon.trigger() is False
+        assert daemon.run_cycle() is None
+    finally:
+        daemon._cycle_lock.release()
@@ -0,0 +1,42 @@
+import random
+import numpy as np
+import pandas as pd
+from prediction_logger.evaluation import evaluate_scenario, evaluate_scenarios, SCENARIOS
+
+
+def test_vectorized_matches_scalar():
+    rng = random.Random(7)
+    forecasts, actuals = [], []
+    for _ in range(2000):
+        forecasts.append({
+            'scenario': rng.choice(SCENARIOS + ('unknown',)),
+            'resistance': rng.uniform(90, 110),
+            'support': rng.choice([None, rng.uniform(85, 105)]),
+        })
+        row = {'high': rng.uniform(95, 115), 'low': rng.uniform(85, 100), 'close': rng.uniform(90, 110)}
+        if rng.random() < 0.7:
+            row['open'] = rng.uniform(90, 110)
+        if rng.random() < 0.5:
+            row['prev_close'] = rng.uniform(90, 110)
+        actuals.append(row)
+    expected = [bool(evaluate_scenario(f, a)) for f, a in zip(forecasts, actuals)]
+    assert evaluate_scenarios(forecasts, actuals).tolist() == expected
+
+
+def test_vectorized_accepts_frames():
+    forecasts = pd.DataFrame({
+        'scenario': ['fade', 'fade', 'momentum', 'momentum'],
+        'resistance': [100.0, 100.0, 0.0, 0.0],
+        'support': [95.0, np.nan, np.nan, np.nan],
+    })
+    actuals = {
+        'high': np.array([97.0, 97.0, 0.0, 0.0]),
+        'close': np.array([0.0, 0.0, 101.0, 101.0]),
+        'prev_close': np.array([np.nan, np.nan, 100.0, np.nan]),
+    }
+    # fade falls back to resistance without support; momentum needs prev_close
+    assert evaluate_scenarios(forecasts, actuals).tolist() == [False, True, True, False]
+
+
+def test_vectorized_empty():
+    assert evaluate_scenarios([], []).tolist() == []
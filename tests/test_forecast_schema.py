@@ -0,0 +1,38 @@
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+from prediction_logger.forecast_schema import Forecast, validate_forecasts
+
+VALID = {"scenario": "fade", "resistance": 23650, "support": 23400, "sigma_plus": None, "sigma_minus": None}
+
+
+def test_validate_forecasts_matches_model():
+    records = [VALID, dict(VALID, resistance="23700.5", sigma_plus=1)]
+    forecasts, errors = validate_forecasts(records)
+    assert errors == {}
+    assert forecasts == [Forecast(**record).dict() for record in records]
+
+
+def test_validate_forecasts_reports_per_record_errors():
+    records = [
+        VALID,
+        {"scenario": "fade", "resistance": 23650},       # optional fields are still required
+        dict(VALID, extra_field=1),                      # extra='forbid'
+        dict(VALID, resistance="high"),
+    ]
+    forecasts, errors = validate_forecasts(records)
+    assert forecasts[0] == Forecast(**VALID).dict()
+    assert forecasts[1:] == [None, None, None]
+    assert sorted(errors) == [1, 2, 3]
+    for i in errors:
+        with pytest.raises(ValidationError) as expected:
+            Forecast(**records[i])
+        assert errors[i].errors() == expected.value.errors()
+
+
+def test_validate_forecasts_accepts_frame():
+    frame = pd.DataFrame([VALID, dict(VALID, support=None, scenario="breakout")])
+    forecasts, errors = validate_forecasts(frame)
+    assert errors == {}
+    assert forecasts[1]['support'] is None
+    assert forecasts[1]['scenario'] == "breakout"
@@ -0,0 +1,35 @@
+import pytest
+from datetime import datetime
+from prediction_logger.forecast_store import SQLiteForecastSource, import_json_folder
+from prediction_logger.sources import get_forecast_source_from_config
+
+
+def test_import_and_point_lookup(tmp_path, write_forecast):
+    write_forecast(tmp_path / 'forecast', '2025-07-31', 'fade')
+    write_forecast(tmp_path / 'forecast' / 'ES', '2025-07-31', 'breakout', resistance=6400)
+    (tmp_path / 'forecast' / '2025-08-01.json').write_text("{invalid_json}")
+    store = str(tmp_path / 'forecasts.db')
+    assert import_json_folder(str(tmp_path / 'forecast'), store) == 2
+
+    forecast = SQLiteForecastSource(store).load(datetime(2025, 7, 31))
+    assert forecast == {'scenario': 'fade', 'resistance': 23650, 'support': 23400,
+                        'sigma_plus': None, 'sigma_minus': None}
+    es = SQLiteForecastSource(store, symbol='/ES').load(datetime(2025, 7, 31))
+    assert es['symbol'] == '/ES' and es['resistance'] == 6400
+    with pytest.raises(FileNotFoundError):
+        SQLiteForecastSource(store).load(datetime(2025, 8, 1))
+
+
+def test_range_scan(tmp_path, write_forecast):
+    for day in range(1, 11):
+        write_forecast(tmp_path / 'forecast' / 'NQ', f"2025-07-{day:02d}", 'fade')
+    store = str(tmp_path / 'forecasts.db')
+    import_json_folder(str(tmp_path / 'forecast'), store)
+    source = get_forecast_source_from_config({'forecast_source': 'sqlite', 'forecast_store': store}, symbol='/NQ')
+    forecasts = source.load_range(datetime(2025, 7, 3), datetime(2025, 7, 5))
+    assert list(forecasts) == ['2025-07-03', '2025-07-04', '2025-07-05']
+
+
+def test_missing_store(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        SQLiteForecastSource(str(tmp_path / 'missing.db')).load(datetime(2025, 7, 31))
@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Cumulative `python -X importtime` budget for `import prediction_logger.cli` (about 30 ms when lazy)
+CLI_IMPORT_BUDGET_US = 150_000
+HEAVY_MODULES = ['pandas', 'numpy', 'torch', 'openai', 'pydantic', 'requests', 'dateutil']
+
+
+def run_python(*args):
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+
+
+def test_cli_import_defers_heavy_dependencies():
+    out = run_python('-c', 'import json, sys, prediction_logger.cli; print(json.dumps(sorted(sys.modules)))')
+    loaded = set(json.loads(out.stdout))
+    assert [m for m in HEAVY_MODULES if m in loaded] == []
+
+
+def test_cli_cold_start_within_budget():
+    # Best of three so a single slow run on a busy machine does not fail the suite
+    timings = []
+    for _ in range(3):
+        err = run_python('-X', 'importtime', '-c', 'import prediction_logger.cli').stderr
+        for line in err.splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == 'prediction_logger.cli':
+                cumulative = fields[1]
+                timings.append(int(cumulative))
+    assert min(timings) < CLI_IMPORT_BUDGET_US, f"import prediction_logger.cli took {min(timings)} us"
+
+
+def test_help_runs_without_logging_setup_noise():
+    out = run_python('-m', 'prediction_logger.cli', '--help')
+    assert 'Usage' in out.stdout
+    assert 'Current working directory' not in out.stderr
+
+
+def test_package_exports_resolve_lazily():
+    import prediction_logger
+    from prediction_logger.evaluation import evaluate_scenarios
+    assert prediction_logger.evaluate_scenarios is evaluate_scenarios
+    with pytest.raises(AttributeError):
+        prediction_logger.not_a_name
@@ -0,0 +1,135 @@
+import asyncio
+import pandas as pd
+import pytest
+from datetime import datetime, timezone
+from prediction_logger.ingest import BarAggregator, Ingester, Tick, parse_ticks, persist_bar
+from prediction_logger.sources import FileActualsSource, OHLCFileActualsSource, get_actuals_source_from_config
+from prediction_logger.stream_server import serve
+
+DAY = datetime(2025, 7, 30, tzinfo=timezone.utc).timestamp()
+
+
+def test_aggregator_completes_bar_on_session_rollover():
+    agg = BarAggregator()
+    for i, price in enumerate([100, 103, 99, 101]):
+        assert agg.add(Tick('NQ', price, 1, DAY + i)) is None
+    assert agg.add(Tick('NQ', 90, 1, DAY - 10)) is None
+    assert agg.late_ticks == 1
+    bar = agg.add(Tick('NQ', 102, 2, DAY + 86400))
+    assert (bar.session, bar.open, bar.high, bar.low, bar.close, bar.volume) == ('2025-07-30', 100, 103, 99, 101, 4)
+    assert agg.open_bars()[0].session == '2025-07-31'
+
+
+def test_parse_ticks_formats():
+    assert parse_ticks('{"status": "subscribed"}') == []
+    ticks = parse_ticks('{"ticks": [{"symbol": "NQ", "last": 1.5, "timestamp": 1753833600000}]}')
+    assert ticks == [Tick('NQ', 1.5, 0.0, 1753833600.0)]
+    assert parse_ticks([{'symbol': 'ES', 'price': 2, 'ts': '2025-07-30T00:00:00Z'}])[0].ts == DAY
+
+
+def test_persisted_bars_are_readable_as_actuals(tmp_path):
+    agg = BarAggregator()
+    agg.add(Tick('/NQ', 100, 1, DAY))
+    agg.add(Tick('/NQ', 105, 1, DAY + 60))
+    bar = agg.add(Tick('/NQ', 104, 1, DAY + 86400))
+    persist_bar(bar, {'actuals_folder': str(tmp_path / 'actuals'), 'symbols': ['/NQ', '/ES']})
+    actuals = FileActualsSource(str(tmp_path / 'actuals'), symbol='/NQ').get_actuals(datetime(2025, 7, 30))
+    assert (actuals['high'], actuals['close']) == (105, 105)
+    persist_bar(bar, {'actuals_source': 'ohlc', 'actuals_file': str(tmp_path / 'ohlc.csv')})
+    assert OHLCFileActualsSource(str(tmp_path / 'ohlc.csv'), '/NQ').get_actuals(datetime(2025, 7, 30))['low'] == 100
+
+
+def test_persisted_bar_round_trips_through_default_config(tmp_path):
+    agg = BarAggregator()
+    agg.add(Tick('/NQ', 100, 1, DAY))
+    bar = agg.add(Tick('/NQ', 101, 1, DAY + 86400))
+    cfg = {'actuals_source': 'file', 'actuals_folder': str(tmp_path / 'actuals')}
+    path = persist_bar(bar, cfg)
+    assert path == str(tmp_path / 'actuals' / '2025-07-30.actuals.json')
+    assert get_actuals_source_from_config(cfg).get_actuals(datetime(2025, 7, 30))['close'] == 100
+
+
+def make_bar(symbol='/NQ'):
+    agg = BarAggregator()
+    agg.add(Tick(symbol, 100, 1, DAY))
+    agg.add(Tick(symbol, 97, 1, DAY + 60))
+    return agg.add(Tick(symbol, 101, 1, DAY + 86400))
+
+
+def test_persisted_bar_keeps_csv_layout(tmp_path):
+    path = tmp_path / 'ohlc.csv'
+    path.write_text("date,open,high,low,close\n2025-07-29,90,99,89,95")
+    cfg = {'actuals_source': 'ohlc', 'actuals_file': str(path)}
+    persist_bar(make_bar(), cfg)
+    actuals = OHLCFileActualsSource(str(path)).get_actuals(datetime(2025, 7, 30))
+    assert (actuals['low'], actuals['close'], actuals['prev_close']) == (97, 97, 95)
+    with pytest.raises(ValueError, match='no symbol column'):
+        persist_bar(make_bar('/ES'), dict(cfg, symbols=['/NQ', '/ES']))
+    (tmp_path / 'bad.csv').write_text("day,price\n")
+    with pytest.raises(ValueError, match='missing column'):
+        persist_bar(make_bar(), dict(cfg, actuals_file=str(tmp_path / 'bad.csv')))
+
+
+def test_persisted_bar_appends_to_parquet(tmp_path):
+    path = tmp_path / 'ohlc.parquet'
+    pd.DataFrame({'date': pd.to_datetime(['2025-07-29']), 'symbol': ['NQ'], 'open': [90.0], 'high': [99.0],
+                  'low': [89.0], 'close': [95.0]}).to_parquet(path)
+    cfg = {'actuals_source': 'ohlc', 'actuals_file': str(path)}
+    persist_bar(make_bar(), cfg)
+    persist_bar(make_bar('/ES'), cfg)
+    actuals = OHLCFileActualsSource(str(path), '/NQ').get_actuals(datetime(2025, 7, 30))
+    assert (actuals['high'], actuals['prev_close']) == (100, 95)
+    assert len(pd.read_parquet(path)) == 3
+    persist_bar(make_bar(), dict(cfg, actuals_file=str(tmp_path / 'new.parquet')))
+    assert list(pd.read_parquet(tmp_path / 'new.parquet')['close']) == [97]
+
+
+def test_ingester_reconnects_and_emits_bars():
+    async def scenario():
+        server_stop, stop = asyncio.Event(), asyncio.Event()
+        port = asyncio.get_running_loop().create_future()
+        server = asyncio.create_task(serve('127.0.0.1', 0, ticks=24 * 10, batch=12, tick_interval=3600,
+                                           close_after=3, ready=port.set_result, stop=server_stop))
+        bars = []
+
+        def on_bar(bar):
+            bars.append(bar)
+            if len(bars) >= 4:
+                stop.set()
+
+        ingester = Ingester(f"ws://127.0.0.1:{await port}", ['NQ'], on_bar=on_bar, queue_size=2,
+                            backoff_base=0.01, backoff_max=0.05)
+        await asyncio.wait_for(ingester.run(stop), timeout=10)
+        server_stop.set()
+        await server
+        return ingester, bars
+
+    ingester, bars = asyncio.run(scenario())
+    # 36 ticks per connection, 24 per session: bars span reconnects without losing ticks
+    assert ingester.stats['reconnects'] >= 2
+    assert [bar.ticks for bar in bars] == [24, 24, 24, 24]
+    assert [bar.session for bar in bars] == ['2025-07-28', '2025-07-29', '2025-07-30', '2025-07-31']
+    assert ingester.stats['queue_high_water'] <= 2
+
+
+def test_failing_callbacks_do_not_stop_the_consumer():
+    def on_tick(tick):
+        if tick.price == 101:
+            raise ValueError("bad tick")
+
+    def on_bar(bar):
+        raise RuntimeError("disk full")
+
+    async def scenario():
+        ingester = Ingester('ws://unused', ['NQ'], on_bar=on_bar, on_tick=on_tick)
+        queue = asyncio.Queue()
+        for price, ts in ((100, DAY), (101, DAY + 1), (102, DAY + 86400)):
+            queue.put_nowait([{'symbol': 'NQ', 'price': price, 'ts': ts}])
+        consumer = asyncio.create_task(ingester._consume(queue))
+        await queue.join()
+        consumer.cancel()
+        return ingester
+
+    ingester = asyncio.run(scenario())
+    assert ingester.stats['ticks'] == 3 and ingester.stats['bars'] == 1
+    assert (ingester.stats['tick_errors'], ingester.stats['bar_errors']) == (1, 1)
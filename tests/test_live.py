@@ -0,0 +1,90 @@
+import asyncio
+from datetime import datetime, timezone
+from prediction_logger import ingest
+from prediction_logger.ingest import Tick
+from prediction_logger.live import LiveEvaluator, run_live
+
+DAY = datetime(2025, 7, 30, tzinfo=timezone.utc).timestamp()
+
+
+def forecast(scenario, resistance, support=None):
+    return {'scenario': scenario, 'resistance': resistance, 'support': support, 'sigma_plus': None, 'sigma_minus': None}
+
+
+def feed(evaluator, prices, start=DAY):
+    events = []
+    for i, price in enumerate(prices):
+        events.extend((i, event) for event in evaluator.on_tick(Tick('NQ', price, 1, start + i)))
+    return events
+
+
+def test_breakout_and_range_resolve_on_the_crossing_tick():
+    evaluator = LiveEvaluator(loader=lambda symbol, session: [
+        forecast('breakout', 105), forecast('range', 110, support=95), forecast('fade', 103),
+        forecast('breakout', 120),
+    ])
+    events = feed(evaluator, [100, 102, 104, 105, 104, 96, 94])
+    assert [(i, e.scenario, e.result) for i, e in events] == [
+        (2, 'fade', 'miss'), (3, 'breakout', 'hit'), (6, 'range', 'miss'),
+    ]
+    assert all(e.tick_ts == DAY + i and e.latency == e.detected_at - e.tick_ts for i, e in events)
+
+
+def test_session_close_settles_open_forecasts():
+    evaluator = LiveEvaluator(loader=lambda symbol, session: [
+        forecast('breakout', 120), forecast('range', 110, support=90), forecast('trend', 100),
+        forecast('momentum', 100),
+    ])
+    feed(evaluator, [100, 101, 99, 104])
+    events = feed(evaluator, [103], start=DAY + 86400)
+    assert [(e.scenario, e.result, e.final) for _, e in events] == [
+        ('breakout', 'miss', True), ('range', 'hit', True), ('trend', 'hit', True), ('momentum', 'miss', True),
+    ]
+    # The next session's momentum forecasts see the previous close
+    assert evaluator.books['NQ'].prev_close == 104
+    assert evaluator.summary()['events'] == 4
+
+
+def test_ladders_only_walk_resolved_thresholds():
+    levels = list(range(1000, 2000))
+    evaluator = LiveEvaluator(loader=lambda symbol, session: [forecast('breakout', level) for level in levels])
+    feed(evaluator, [900] * 50)
+    assert evaluator.books['NQ'].hit_above.next == 0
+    events = feed(evaluator, [1000.5, 1499.5, 1200], start=DAY + 100)
+    assert len(events) == 500
+    assert evaluator.books['NQ'].hit_above.next == 500
+
+
+def test_run_live_settles_open_sessions_on_shutdown(monkeypatch, tmp_path):
+    (tmp_path / 'forecast').mkdir()
+    (tmp_path / 'forecast' / '2025-07-30.json').write_text(
+        '{"scenario": "breakout", "resistance": 120, "support": null, "sigma_plus": null, "sigma_minus": null}')
+
+    class FeedThenStop:
+        def __init__(self, on_tick):
+            self.on_tick = on_tick
+
+        async def run(self, stop=None):
+            for i, price in enumerate([100, 104, 103]):
+                self.on_tick(Tick('/NQ', price, 1, DAY + i))
+
+    monkeypatch.setattr(ingest, 'get_ingester_from_config', lambda cfg, symbols, on_tick: FeedThenStop(on_tick))
+    events_file = tmp_path / 'events.jsonl'
+    cfg = {'forecast_folder': str(tmp_path / 'forecast')}
+    evaluator = asyncio.run(run_live(cfg, events_file=str(events_file)))
+    assert evaluator.books == {}
+    assert (evaluator.stats['events'], evaluator.stats['misses']) == (1, 1)
+    assert '"final": true' in events_file.read_text()
+
+
+def test_shutdown_leaves_sessions_in_progress_unresolved():
+    events = []
+    evaluator = LiveEvaluator(loader=lambda symbol, session: [forecast('breakout', 120), forecast('fade', 103)],
+                              on_event=events.append)
+    feed(evaluator, [100, 104, 102])
+    assert [(e.scenario, e.result) for e in events] == [('fade', 'miss')]
+    evaluator.shutdown(now=DAY + 3600)
+    assert [(e.scenario, e.result, e.final) for e in events[1:]] == [('breakout', 'unresolved', False)]
+    assert evaluator.stats['unresolved'] == 1 and 'NQ' in evaluator.books
+    evaluator.shutdown(now=DAY + 86400)
+    assert [(e.scenario, e.result, e.final) for e in events[2:]] == [('breakout', 'miss', True)]
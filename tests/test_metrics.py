@@ -0,0 +1,108 @@
+import math
+import random
+import pandas as pd
+import pytest
+from prediction_logger.metrics import RollingMetrics, binomial_pvalue, load_metrics, snapshot_path_for
+from prediction_logger.results_store import ResultsWriter
+
+SCENARIOS = ['fade', 'breakout', 'range']
+
+
+def make_rows(n, seed=0, start=0):
+    rng = random.Random(seed)
+    return [{'date': f"2025-{1 + (start + i) // 28 % 12:02d}-{1 + (start + i) % 28:02d}",
+             'symbol': rng.choice(['/NQ', '/ES']), 'predicted': 1, 'actual': 1,
+             'scenario': rng.choice(SCENARIOS), 'result': rng.choice(['hit', 'miss']), 'version': 'v1.0'}
+            for i in range(n)]
+
+
+def write(path, rows):
+    with ResultsWriter(str(path), fsync=False) as writer:
+        writer.extend(rows)
+
+
+def reference_pvalue(k, n, p):
+    pmf = [math.comb(n, i) * p ** i * (1 - p) ** (n - i) for i in range(n + 1)]
+    return min(1.0, sum(x for x in pmf if x <= pmf[k] * (1 + 1e-7)))
+
+
+@pytest.mark.parametrize('p', [0.5, 0.2, 0.75])
+def test_binomial_pvalue_matches_exact_sum(p):
+    for n in (1, 7, 30, 101):
+        for k in range(n + 1):
+            assert binomial_pvalue(k, n, p) == pytest.approx(reference_pvalue(k, n, p), rel=1e-9, abs=1e-15)
+    assert binomial_pvalue(0, 0) == 1.0
+
+
+def test_matches_full_recompute(tmp_path):
+    rows = make_rows(300)
+    metrics = RollingMetrics()
+    metrics.update_many(rows)
+    df = pd.DataFrame(rows)
+    df['hit'] = (df['result'] == 'hit').astype(int)
+    overall = metrics.summary()
+    assert overall['hit_rate'] == pytest.approx(df['hit'].mean())
+    for window in (5, 10, 20):
+        assert overall['rolling'][str(window)] == pytest.approx(df['hit'].rolling(window).mean().iloc[-1])
+    for scenario, group in df.groupby('scenario'):
+        summary = metrics.summary(scenario=scenario)
+        assert (summary['count'], summary['hits']) == (len(group), group['hit'].sum())
+        assert summary['rolling']['20'] == pytest.approx(group['hit'].rolling(20).mean().iloc[-1])
+    nq_fade = df[(df['symbol'] == '/NQ') & (df['scenario'] == 'fade')]
+    assert metrics.summary('/NQ', 'fade')['hits'] == nq_fade['hit'].sum()
+    assert [row['scenario'] for row in metrics.table('scenario')] == sorted(SCENARIOS)
+    assert metrics.trend()[-1][2:] == [overall['rolling'][str(w)] for w in (5, 10, 20)]
+
+
+def test_refresh_reads_only_appended_rows(tmp_path):
+    results = tmp_path / 'results.csv'
+    rows = make_rows(120)
+    write(results, rows[:50])
+    first = load_metrics(str(results))
+    assert first.rows == 50
+    write(results, rows[50:])
+    # A half-written last line is left for the next refresh
+    with open(results, 'a') as f:
+        f.write('2025-12-01,/NQ,1,1,fa')
+    resumed = load_metrics(str(results))
+    assert resumed.source['offset'] < results.stat().st_size
+    full = RollingMetrics()
+    full.update_many(rows)
+    assert resumed.rows == 120
+    assert resumed.table('symbol_scenario') == full.table('symbol_scenario')
+    assert resumed.trend() == full.trend()
+    # Nothing new: the snapshot is returned without re-reading anything
+    assert RollingMetrics.load(snapshot_path_for(str(results))).refresh(str(results)) == 0
+
+
+def test_rewritten_results_file_is_rebuilt(tmp_path):
+    results = tmp_path / 'results.csv'
+    write(results, make_rows(40))
+    load_metrics(str(results))
+    results.unlink()
+    write(results, make_rows(30, seed=5))
+    metrics = load_metrics(str(results))
+    expected = RollingMetrics()
+    expected.update_many(make_rows(30, seed=5))
+    assert metrics.rows == 30 and metrics.summary() == expected.summary()
+
+
+def test_bulk_update_matches_row_by_row(monkeypatch, tmp_path):
+    rows = make_rows(400, seed=3)
+    by_row = RollingMetrics(history=50)
+    by_row.update_many(rows)
+    bulk = RollingMetrics(history=50)
+    bulk.update_many(rows[:7])
+    bulk.update_frame(pd.DataFrame(rows[7:]))
+    assert bulk.table('symbol_scenario') == by_row.table('symbol_scenario')
+    assert bulk.table('all') == by_row.table('all')
+    for got, expected in zip(bulk.trend(), by_row.trend(), strict=True):
+        assert got[0] == expected[0] and got[1:] == pytest.approx(expected[1:])
+    # refresh() switches to the bulk path for large appends
+    import prediction_logger.metrics as metrics_module
+    monkeypatch.setattr(metrics_module, 'BULK_BYTES', 0)
+    results = tmp_path / 'results.csv'
+    write(results, rows)
+    refreshed = RollingMetrics(history=50)
+    refreshed.refresh(str(results))
+    assert refreshed.table('symbol_scenario') == by_row.table('symbol_scenario')
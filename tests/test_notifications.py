@@ -1,13 +1,32 @@
-
+import time
 import pytest
 from unittest.mock import patch
 from prediction_logger import notifications
 
-@patch('prediction_logger.notifications.requests.post')
+@patch('prediction_logger.transport.requests.Session.post')
 @patch('prediction_logger.notifications.load_config')
 def test_notify_slack_success(mock_load_config, mock_post):
     mock_load_config.return_value = {'slack_webhook_url': 'http://fake', 'secondary_webhook_url': None, 'notify_email_to': None}
     mock_post.return_value.status_code = 200
     mock_post.return_value.raise_for_status = lambda: None
     # Should not raise
-    notifications.notify("test message")
\ No newline at end of file
+    notifications.notify("test message")
+    assert notifications.flush(timeout=10)
+    assert mock_post.call_count == 1
+
+
+def test_dispatcher_returns_immediately_and_coalesces():
+    delivered = []
+
+    def slow_deliver(message, subject, cfg):
+        time.sleep(0.5)
+        delivered.append((message, subject))
+
+    dispatcher = notifications.NotificationDispatcher(batch_window=0.2)
+    with patch('prediction_logger.notifications._deliver', side_effect=slow_deliver):
+        start = time.monotonic()
+        for i in range(3):
+            dispatcher.submit(f"error {i}", "Backfill", {})
+        assert time.monotonic() - start < 0.1
+        dispatcher.close(timeout=10)
+    assert delivered == [("3 notifications:\n- error 0\n- error 1\n- error 2", "Backfill")]
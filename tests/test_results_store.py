@@ -0,0 +1,92 @@
+import pytest
+import pandas as pd
+from datetime import datetime
+from prediction_logger.results_store import ResultsWriter, RESULT_FIELDS, read_header
+
+
+def make_row(date, **extra):
+    row = {
+        'date': date,
+        'symbol': '/NQ',
+        'predicted': 23650.0,
+        'actual': 23500.0,
+        'scenario': 'breakout',
+        'result': 'miss',
+        'version': 'v1.0',
+    }
+    row.update(extra)
+    return row
+
+
+def test_writer_creates_file_with_header_once(tmp_path):
+    csv_file = tmp_path / 'data' / 'results.csv'
+    with ResultsWriter(str(csv_file)) as writer:
+        writer.append(make_row('2025-07-30'))
+    with ResultsWriter(str(csv_file)) as writer:
+        writer.extend([make_row('2025-07-31'), make_row('2025-08-01')])
+    assert read_header(str(csv_file)) == RESULT_FIELDS
+    df = pd.read_csv(csv_file)
+    assert list(df['date']) == ['2025-07-30', '2025-07-31', '2025-08-01']
+
+
+def test_writer_buffers_until_flush(tmp_path):
+    csv_file = tmp_path / 'results.csv'
+    writer = ResultsWriter(str(csv_file), buffer_size=3)
+    writer.append(make_row('2025-07-30'))
+    writer.append(make_row('2025-07-31'))
+    assert not csv_file.exists()
+    writer.append(make_row('2025-08-01'))
+    assert len(pd.read_csv(csv_file)) == 3
+
+
+def test_writer_rejects_header_mismatch(tmp_path):
+    csv_file = tmp_path / 'results.csv'
+    csv_file.write_text("date,scenario,hit\n")
+    writer = ResultsWriter(str(csv_file))
+    writer.append(make_row('2025-07-31'))
+    with pytest.raises(ValueError):
+        writer.flush()
+
+
+def test_writer_rejects_missing_fields(tmp_path):
+    writer = ResultsWriter(str(tmp_path / 'results.csv'))
+    with pytest.raises(ValueError):
+        writer.append({'date': '2025-07-31'})
+
+
+def test_writer_repairs_missing_trailing_newline(tmp_path):
+    csv_file = tmp_path / 'results.csv'
+    csv_file.write_text(",".join(RESULT_FIELDS) + "\n2025-07-30,/NQ,1.0,2.0,fade,hit,v1.0")
+    with ResultsWriter(str(csv_file)) as writer:
+        writer.append(make_row('2025-07-31', tensor_output=[0.5]))
+    df = pd.read_csv(csv_file)
+    assert list(df['date']) == ['2025-07-30', '2025-07-31']
+    assert 'tensor_output' not in df.columns
+
+
+def test_parquet_backend_partitions_and_filters(tmp_path):
+    pytest.importorskip('pyarrow')
+    from prediction_logger.results_store import get_results_writer, read_results, read_results_index
+    path = str(tmp_path / 'results.parquet')
+    with get_results_writer(path) as writer:
+        writer.extend([
+            make_row('2025-06-30'),
+            make_row('2025-07-31'),
+            dict(make_row('2025-07-31'), symbol='/ES', scenario='fade', result='hit'),
+        ])
+    assert (tmp_path / 'results.parquet' / 'symbol_key=NQ' / 'year=2025' / 'month=7').is_dir()
+    df = read_results(path, columns=['date', 'result'], symbols=['/NQ'], start=datetime(2025, 7, 1))
+    assert list(df.columns) == ['date', 'result']
+    assert [str(d) for d in df['date']] == ['2025-07-31']
+    full = read_results(path)
+    assert full['scenario'].dtype.name == 'category'
+    assert full['predicted'].dtype.name == 'float64'
+    assert read_results_index(path) == {('2025-06-30', '/NQ'), ('2025-07-31', '/NQ'), ('2025-07-31', '/ES')}
+
+
+def test_backend_selected_by_config_key(tmp_path):
+    from prediction_logger.results_store import get_results_writer, ParquetResultsWriter
+    assert isinstance(get_results_writer(str(tmp_path / 'out'), 'parquet'), ParquetResultsWriter)
+    assert isinstance(get_results_writer(str(tmp_path / 'out.csv')), ResultsWriter)
+    with pytest.raises(ValueError):
+        get_results_writer(str(tmp_path / 'out.csv'), 'sqlite')
@@ -0,0 +1,44 @@
+import pandas as pd
+from datetime import datetime
+from prediction_logger import logger, runner
+
+
+def make_cfg(tmp_path, executor):
+    return {
+        'forecast_folder': str(tmp_path / 'forecast'),
+        'output_csv': str(tmp_path / 'results.csv'),
+        'actuals_source': 'stub',
+        'executor': executor,
+        'max_workers': 2,
+    }
+
+
+def test_run_symbols_merges_in_date_symbol_order(monkeypatch, tmp_path, write_forecast):
+    monkeypatch.setattr(logger, 'notify', lambda *a, **kw: None)
+    cfg = make_cfg(tmp_path, 'process')
+    for date in ('2025-07-30', '2025-07-31'):
+        write_forecast(tmp_path / 'forecast' / 'ES', date, 'fade')
+        write_forecast(tmp_path / 'forecast' / 'NQ', date, 'breakout')
+    written = runner.run_symbols(datetime(2025, 7, 30), datetime(2025, 7, 31), symbols=['/NQ', '/ES'], cfg=cfg)
+    assert written == 4
+    df = pd.read_csv(cfg['output_csv'])
+    assert list(zip(df['date'], df['symbol'])) == [
+        ('2025-07-30', '/NQ'), ('2025-07-30', '/ES'), ('2025-07-31', '/NQ'), ('2025-07-31', '/ES'),
+    ]
+
+
+def test_run_symbols_isolates_failures(monkeypatch, tmp_path, write_forecast):
+    monkeypatch.setattr(runner, 'notify', lambda *a, **kw: None)
+    cfg = make_cfg(tmp_path, 'thread')
+    write_forecast(tmp_path / 'forecast' / 'NQ', '2025-07-31', 'breakout')
+    write_forecast(tmp_path / 'forecast' / 'ES', '2025-07-31', 'breakout')
+    evaluate_symbol = runner.evaluate_symbol
+
+    def flaky(cfg, symbol, dates, existing):
+        if symbol == '/ES':
+            raise RuntimeError("feed down")
+        return evaluate_symbol(cfg, symbol, dates, existing)
+
+    monkeypatch.setattr(runner, 'evaluate_symbol', flaky)
+    assert runner.run_symbols(datetime(2025, 7, 31), symbols=['/NQ', '/ES'], cfg=cfg) == 1
+    assert list(pd.read_csv(cfg['output_csv'])['symbol']) == ['/NQ']
@@ -4,14 +4,82 @@ import torch
 from prediction_logger.tensor_model import TensorModel
 from unittest.mock import patch, MagicMock
 
-def test_tensor_model_predict(monkeypatch):
+
+def test_tensor_model_predict(monkeypatch, tmp_path):
     # Patch torch.load to return a dummy model
     class DummyModel(torch.nn.Module):
         def forward(self, x):
             return torch.ones_like(x)
     monkeypatch.setattr(torch, 'load', lambda *a, **kw: DummyModel())
-    model = TensorModel('dummy.pt')
+    model_path = tmp_path / 'dummy.pt'
+    model_path.write_bytes(b'')
+    model = TensorModel(str(model_path))
     model.load()
     features = [0.1, 0.2, 0.3]
     result = model.predict(features)
     assert isinstance(result, list)
+
+
+def test_predict_batch_matches_predict():
+    torch.manual_seed(0)
+    model = TensorModel('dummy.pt', batch_size=3)
+    model.model = torch.nn.Linear(2, 1).eval()
+    features = [[float(i), float(i) * 0.5] for i in range(10)]
+    batched = model.predict_batch(features, num_threads=1)
+    assert len(batched) == 10
+    for row, out in zip(features, batched):
+        assert out == pytest.approx(model.predict(row), rel=1e-6)
+
+
+def test_predict_batch_restores_threads_and_handles_empty():
+    model = TensorModel('dummy.pt')
+    model.model = torch.nn.Linear(2, 1).eval()
+    threads = torch.get_num_threads()
+    assert model.predict_batch([[1.0, 2.0]], num_threads=threads + 1) != []
+    assert torch.get_num_threads() == threads
+    assert model.predict_batch([]) == []
+
+
+def test_predict_batch_requires_load():
+    with pytest.raises(RuntimeError):
+        TensorModel('dummy.pt').predict_batch([[1.0, 2.0]])
+
+
+def _save_model(path):
+    torch.manual_seed(0)
+    torch.save(torch.nn.Sequential(torch.nn.Linear(2, 8), torch.nn.ReLU(), torch.nn.Linear(8, 1)), path)
+
+
+def test_export_torchscript_is_loaded_automatically(tmp_path):
+    from prediction_logger.tensor_model import export_model
+    model_path = tmp_path / 'model.pt'
+    _save_model(model_path)
+    eager = TensorModel(str(model_path), prefer_exported=False)
+    eager.load()
+    artifact = export_model(str(model_path))
+    assert artifact == tmp_path / 'model.ts'
+    model = TensorModel(str(model_path))
+    model.load()
+    assert model.backend == 'torchscript'
+    features = [[23600.0, 23550.0], [1.0, 2.0]]
+    assert model.predict_batch(features) == pytest.approx(eager.predict_batch(features), rel=1e-5)
+    report = model.latency_report()
+    assert report['load_ms'] > 0 and report['batches'] == 1 and report['rows'] == 2
+
+
+def test_stale_export_is_ignored(tmp_path):
+    import os
+    from prediction_logger.tensor_model import export_model
+    model_path = tmp_path / 'model.pt'
+    _save_model(model_path)
+    artifact = export_model(str(model_path))
+    os.utime(artifact, (0, 0))
+    model = TensorModel(str(model_path))
+    model.load()
+    assert model.backend == 'eager'
+
+
+def test_export_rejects_unknown_format(tmp_path):
+    from prediction_logger.tensor_model import export_model
+    with pytest.raises(ValueError):
+        export_model(str(tmp_path / 'model.pt'), 'tflite')
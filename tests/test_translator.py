@@ -3,9 +3,90 @@ import pytest
 from unittest.mock import patch
 from prediction_logger.translator import Translator
 
-@patch('prediction_logger.translator.openai.ChatCompletion.create')
+@patch('openai.ChatCompletion.create')
 def test_summarize_tensor_output(mock_create):
     mock_create.return_value.choices = [type('obj', (object,), {"message": {"content": "summary text"}})()]
     t = Translator(api_key='sk-test')
     result = t.summarize_tensor_output([1,2,3], context="test context")
     assert "summary" in result
+
+class RateLimitError(Exception):
+    def __init__(self, retry_after=None):
+        super().__init__("rate limited")
+        self.http_status = 429
+        self.headers = {'retry-after': str(retry_after)} if retry_after is not None else {}
+
+def test_summarize_many_is_concurrent_bounded_and_ordered():
+    import asyncio
+    state = {'active': 0, 'peak': 0, 'calls': 0}
+
+    async def fake(**request):
+        state['calls'] += 1
+        state['active'] += 1
+        state['peak'] = max(state['peak'], state['active'])
+        await asyncio.sleep(0.01)
+        state['active'] -= 1
+        return request['messages'][0]['content'][-12:]
+
+    t = Translator(client=fake, max_concurrency=3)
+    items = [([i], None) for i in range(10)] + [([0], None)]
+    summaries = t.summarize_many(items)
+    assert summaries == [t.request([i])['messages'][0]['content'][-12:] for i in list(range(10)) + [0]]
+    assert state['peak'] == 3
+    assert state['calls'] == 10  # the duplicate request is sent once
+
+def test_rate_limit_retry_honours_retry_after(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr('prediction_logger.translator.time.sleep', sleeps.append)
+    responses = [RateLimitError(retry_after=2), RateLimitError(), "ok"]
+
+    def fake(**request):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    t = Translator(client=fake, backoff_base=0.5)
+    assert t.summarize_tensor_output([1.0]) == "ok"
+    assert 2.0 <= sleeps[0] <= 2.5 and 0 <= sleeps[1] <= 1.0
+    assert t.stats['retries'] == 2
+
+def test_non_retryable_error_returns_none():
+    def fake(**request):
+        raise ValueError("bad request")
+    t = Translator(client=fake)
+    assert t.summarize_tensor_output([1.0]) is None
+    assert t.stats == {'requests': 1, 'cache_hits': 0, 'retries': 0, 'failures': 1}
+
+def test_disk_cache_makes_reruns_free(tmp_path):
+    calls = []
+    def fake(**request):
+        calls.append(request)
+        return f"summary {len(calls)}"
+    first = Translator(client=fake, cache_dir=str(tmp_path)).summarize_many([([1.0], {'scenario': 'fade'}), ([2.0], None)])
+    again = Translator(client=fake, cache_dir=str(tmp_path))
+    assert again.summarize_many([([1.0], {'scenario': 'fade'}), ([2.0], None)]) == first
+    assert len(calls) == 2 and again.stats['cache_hits'] == 2
+    # Different sampling parameters are a different cache entry
+    assert Translator(client=fake, cache_dir=str(tmp_path), temperature=0.9).summarize_tensor_output([1.0], {'scenario': 'fade'}) == "summary 3"
+
+def test_enrich_batch_summarizes_concurrently():
+    from datetime import datetime
+    from prediction_logger.logger import _enrich_batch
+
+    class Model:
+        def predict_batch(self, features):
+            return [row[0] + row[1] for row in features]
+
+    class Fake:
+        def __init__(self):
+            self.batches = []
+        def summarize_many(self, items):
+            self.batches.append(items)
+            return [f"out {output}" for output, _ in items]
+
+    fake = Fake()
+    records = [(datetime(2025, 7, 30), {'resistance': 1}, {'close': 2}),
+               (datetime(2025, 7, 31), {'resistance': 3}, {'close': 4})]
+    assert _enrich_batch(records, Model(), fake) == [(3, 'out 3'), (7, 'out 7')]
+    assert fake.batches == [[(3, {'resistance': 1}), (7, {'resistance': 3})]]
@@ -0,0 +1,76 @@
+import smtplib
+import threading
+from email.message import EmailMessage
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+import pytest
+from prediction_logger.transport import HTTPTransport, SMTPTransport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def webhook_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/hook"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_transport_reuses_connection(webhook_url):
+    transport = HTTPTransport()
+    for i in range(5):
+        transport.post(webhook_url, json={'text': f"message {i}"})
+    (stats,) = transport.stats().values()
+    transport.close()
+    assert stats['requests'] == 5
+    assert stats['new_connections'] == 1
+    assert stats['reused_connections'] == 4
+    assert stats['max_latency_ms'] > 0
+
+
+def _message():
+    msg = EmailMessage()
+    msg.set_content("body")
+    msg['Subject'] = "subject"
+    msg['From'] = "a@example.com"
+    msg['To'] = "b@example.com"
+    return msg
+
+
+@patch('prediction_logger.transport.smtplib.SMTP')
+def test_smtp_transport_keeps_connection_open(mock_smtp):
+    transport = SMTPTransport('smtp.example.com', 587, 'user', 'secret')
+    transport.send(_message())
+    transport.send(_message())
+    assert mock_smtp.call_count == 1
+    assert mock_smtp.return_value.login.call_count == 1
+    assert transport.stats()['reused_connections'] == 1
+
+
+@patch('prediction_logger.transport.smtplib.SMTP')
+def test_smtp_transport_reauthenticates_after_disconnect(mock_smtp):
+    stale, fresh = MagicMock(), MagicMock()
+    stale.send_message.side_effect = [None, smtplib.SMTPServerDisconnected()]
+    mock_smtp.side_effect = [stale, fresh]
+    transport = SMTPTransport('smtp.example.com', 587, 'user', 'secret')
+    transport.send(_message())
+    transport.send(_message())
+    fresh.login.assert_called_once_with('user', 'secret')
+    assert fresh.send_message.call_count == 1
+    assert transport.stats()['new_connections'] == 2
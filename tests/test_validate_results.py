@@ -0,0 +1,187 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+import pytest
+from validate_results import validate_results
+
+
+def run_validation(monkeypatch, tmp_path, csv_text, schema_text="fields: [date, symbol, result]\n", chunk_size=2):
+    results = tmp_path / 'results.csv'
+    schema = tmp_path / 'schema.yaml'
+    results.write_text(csv_text)
+    schema.write_text(schema_text)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('RESULTS_FILE_PATH', str(results))
+    monkeypatch.setenv('SCHEMA_FILE_PATH', str(schema))
+    monkeypatch.setenv('VALIDATION_CHUNK_SIZE', str(chunk_size))
+    monkeypatch.delenv('SLACK_WEBHOOK', raising=False)
+    return validate_results()
+
+
+@pytest.mark.parametrize('with_pyarrow', [True, False])
+def test_row_errors_keep_global_indices_across_chunks(monkeypatch, tmp_path, with_pyarrow):
+    if not with_pyarrow:
+        monkeypatch.setitem(sys.modules, 'pyarrow', None)
+    report, code = run_validation(monkeypatch, tmp_path, (
+        "date,symbol,result\n"
+        "2025-07-28,/NQ,hit\n"
+        "2025-07-29,,miss\n"
+        "2025-07-30,/NQ,hit\n"
+        ",/NQ,\n"
+        "2025-08-01,/NQ,hit\n"
+    ))
+    assert code == 4
+    assert report["valid_rows"] == 3
+    assert report["invalid_rows"] == 2
+    assert report["row_errors"] == [
+        {"row": 1, "errors": ["Missing symbol"]},
+        {"row": 3, "errors": ["Missing date", "Missing result"]},
+    ]
+
+
+def test_missing_column_and_typed_schema(monkeypatch, tmp_path):
+    schema = "fields:\n  - date: ISO8601\n  - scenario: enum [breakout, fade]\n"
+    report, code = run_validation(monkeypatch, tmp_path, "date\n2025-07-31\n", schema)
+    assert code == 4
+    assert report["row_errors"] == [{"row": 0, "errors": ["Missing scenario"]}]
+
+
+def test_empty_results_file(monkeypatch, tmp_path):
+    report, code = run_validation(monkeypatch, tmp_path, "")
+    assert code == 2
+    assert "empty" in report["schema_errors"][0]
+
+
+def test_all_rows_valid(monkeypatch, tmp_path):
+    report, code = run_validation(monkeypatch, tmp_path, "date,symbol,result\n2025-07-31,/NQ,hit\n")
+    assert code == 0
+    assert report["file_valid"] is True
+
+
+def test_incremental_validation_only_reads_appended_rows(monkeypatch, tmp_path):
+    import validate_results as vr
+    checkpoint = str(tmp_path / 'checkpoint.json')
+    results = tmp_path / 'results.csv'
+    report, code = run_validation(monkeypatch, tmp_path, "date,symbol,result\n2025-07-28,/NQ,hit\n2025-07-29,,miss\n")
+    report, code = vr.validate_results(checkpoint_path=checkpoint)
+    assert (report["valid_rows"], report["invalid_rows"]) == (1, 1)
+
+    seen = []
+    check_chunk = vr.check_chunk
+    monkeypatch.setattr(vr, 'check_chunk', lambda chunk, *a: seen.append(chunk.num_rows) or check_chunk(chunk, *a))
+    with open(results, 'a') as f:
+        f.write("2025-07-30,/NQ,\n2025-07-31,/NQ,hit\n2025-08-01,/NQ")  # last row still being written
+    report, code = vr.validate_results(checkpoint_path=checkpoint)
+    assert seen == [2]
+    assert code == 4
+    assert report["valid_rows"] == 2
+    assert report["row_errors"] == [
+        {"row": 1, "errors": ["Missing symbol"]},
+        {"row": 2, "errors": ["Missing result"]},
+    ]
+
+
+def test_incremental_validation_rescans_when_prefix_changes(monkeypatch, tmp_path):
+    import validate_results as vr
+    checkpoint = str(tmp_path / 'checkpoint.json')
+    run_validation(monkeypatch, tmp_path, "date,symbol,result\n2025-07-28,,hit\n")
+    report, code = vr.validate_results(checkpoint_path=checkpoint)
+    assert report["invalid_rows"] == 1
+    (tmp_path / 'results.csv').write_text("date,symbol,result\n2025-07-28,/NQ,hit\n2025-07-29,/NQ,hit\n")
+    report, code = vr.validate_results(checkpoint_path=checkpoint)
+    assert code == 0
+    assert (report["valid_rows"], report["invalid_rows"]) == (2, 0)
+
+
+def test_repeated_calls_have_constant_overhead(monkeypatch, tmp_path):
+    import logging
+    import time
+    import validate_results as vr
+    run_validation(monkeypatch, tmp_path, "date,symbol,result\n2025-07-28,/NQ,hit\n2025-07-29,,miss\n")
+    logger = logging.getLogger(vr.LOGGER_NAME)
+    validator = vr.Validator()
+    handlers = list(logger.handlers)
+    fds = len(os.listdir('/proc/self/fd')) if os.path.isdir('/proc/self/fd') else None
+    loads = []
+    monkeypatch.setattr(vr.yaml, 'safe_load', lambda data, load=vr.yaml.safe_load: loads.append(1) or load(data))
+    timings = []
+    for _ in range(1000):
+        start = time.perf_counter()
+        report, code = validator()
+        timings.append(time.perf_counter() - start)
+        assert code == 4 and report["row_errors"] == [{"row": 1, "errors": ["Missing symbol"]}]
+    assert logger.handlers == handlers
+    assert len(loads) == 1
+    if fds is not None:
+        assert len(os.listdir('/proc/self/fd')) <= fds + 2
+    # No per-call growth: the last calls cost about what the first ones did
+    first, last = sorted(timings[:200])[100], sorted(timings[-200:])[100]
+    assert last < first * 2 + 1e-3
+
+
+def test_function_form_reuses_validator(monkeypatch, tmp_path):
+    import logging
+    import validate_results as vr
+    run_validation(monkeypatch, tmp_path, "date,symbol,result\n2025-07-31,/NQ,hit\n")
+    handlers = list(logging.getLogger(vr.LOGGER_NAME).handlers)
+    for _ in range(5):
+        assert vr.validate_results() == ({"file_valid": True, "missing_fields": [], "schema_errors": [],
+                                          "row_errors": [], "valid_rows": 1, "invalid_rows": 0}, 0)
+    assert logging.getLogger(vr.LOGGER_NAME).handlers == handlers
+    assert vr._validator.cache_info().currsize >= 1
+
+
+TYPED_SCHEMA = (
+    "fields:\n"
+    "  - date: ISO8601\n"
+    "  - symbol: string (e.g. \"/NQ\")\n"
+    "  - predicted: float\n"
+    "  - scenario: enum [breakout, fade]\n"
+    "  - result: enum [hit, miss]\n"
+)
+
+
+@pytest.mark.parametrize('with_pyarrow', [True, False])
+def test_typed_schema_reports_type_and_enum_violations(monkeypatch, tmp_path, with_pyarrow):
+    if not with_pyarrow:
+        monkeypatch.setitem(sys.modules, 'pyarrow', None)
+    report, code = run_validation(monkeypatch, tmp_path, (
+        "date,symbol,predicted,scenario,result\n"
+        "2025-07-28,/NQ,23650.5,breakout,hit\n"
+        "2025-02-30,/NQ,-1e3,fade,miss\n"
+        "2025-07-30T16:00:00Z,/NQ,abc,sideways,hit\n"
+        "07/31/2025,/NQ,.5,breakout,HIT\n"
+        "2025-08-01 09:30,,1,fade,miss\n"
+    ), TYPED_SCHEMA, chunk_size=2)
+    assert code == 4
+    assert report["valid_rows"] == 1
+    assert report["row_errors"] == [
+        {"row": 1, "errors": ["Invalid date: '2025-02-30' is not an ISO 8601 date"]},
+        {"row": 2, "errors": ["Invalid predicted: 'abc' is not a number",
+                              "Invalid scenario: 'sideways' is not one of ['breakout', 'fade']"]},
+        {"row": 3, "errors": ["Invalid date: '07/31/2025' is not an ISO 8601 date",
+                              "Invalid result: 'HIT' is not one of ['hit', 'miss']"]},
+        {"row": 4, "errors": ["Missing symbol"]},
+    ]
+
+
+def test_repo_schemas_accept_logged_results(monkeypatch, tmp_path):
+    from prediction_logger.evaluation import SCENARIOS
+    from prediction_logger.results_store import ResultsWriter
+    results = tmp_path / 'logged.csv'
+    with ResultsWriter(str(results), fsync=False) as writer:
+        writer.extend([{'date': '2025-07-31', 'symbol': '/NQ', 'predicted': 23650.25, 'actual': 23600.0,
+                        'scenario': scenario, 'result': 'hit', 'version': 'v1.0'} for scenario in SCENARIOS])
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+    for schema in ('results_metadata.yaml', os.path.join('config', 'results_schema.yaml')):
+        monkeypatch.setenv('RESULTS_FILE_PATH', str(results))
+        monkeypatch.setenv('SCHEMA_FILE_PATH', os.path.join(root, schema))
+        report, code = validate_results()
+        assert code == 0, (schema, report["row_errors"])
+
+
+def test_unknown_schema_type_is_a_schema_error(monkeypatch, tmp_path):
+    report, code = run_validation(monkeypatch, tmp_path, "date\n2025-07-31\n", "fields:\n  - date: timestamp-ish\n")
+    assert code == 3
+    assert "Unknown type for field 'date'" in report["schema_errors"][0]
@@ -0,0 +1,112 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+import subprocess
+import threading
+import time
+import webhook_receiver
+from webhook_receiver import ValidationJobs
+
+
+class BlockingRun:
+    """Validation stand-in that blocks until released and counts its runs."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        assert self.release.wait(5)
+        return {"file_valid": True, "run": self.calls}, 0
+
+
+def wait_done(jobs, job_id, timeout=5):
+    job = jobs.wait(job_id, timeout)
+    assert job['status'] in ('done', 'failed')
+    return job
+
+
+def test_triggers_coalesce_into_one_follow_up(tmp_path):
+    run = BlockingRun()
+    jobs = ValidationJobs(str(tmp_path / 'jobs'), str(tmp_path / 'results.csv'), run=run)
+    first, coalesced = jobs.submit()
+    assert not coalesced
+    assert run.started.wait(5)
+    # A burst while the first run is busy queues a single follow-up
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(jobs.submit())) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({job['id'] for job, _ in results}) == 1
+    assert sum(not coalesced for _, coalesced in results) == 1
+    follow_up = results[0][0]['id']
+    assert jobs.summary()['running']['id'] == first['id']
+    assert jobs.summary()['pending']['triggers'] == 20
+    run.release.set()
+    assert wait_done(jobs, first['id'])['report'] == {"file_valid": True, "run": 1}
+    assert wait_done(jobs, follow_up)['report'] == {"file_valid": True, "run": 2}
+    assert run.calls == 2
+    assert jobs.summary()['last']['id'] == follow_up
+
+
+def test_dead_runner_is_recovered(tmp_path):
+    run = BlockingRun()
+    run.release.set()
+    jobs = ValidationJobs(str(tmp_path / 'jobs'), str(tmp_path / 'results.csv'), run=run)
+    dead = subprocess.Popen([sys.executable, '-c', 'pass'])
+    dead.wait()
+    # A worker that claimed a job and then exited
+    with jobs._locked():
+        state = jobs._state()
+    stale = {'id': 'a' * 32, 'status': 'running', 'triggers': 1}
+    webhook_receiver._write_json(jobs._job_path(stale['id']), stale)
+    state.update(running=stale['id'], runner={'pid': dead.pid, 'host': webhook_receiver.socket.gethostname()})
+    webhook_receiver._write_json(jobs._state_path(), state)
+    job, _ = jobs.submit()
+    assert wait_done(jobs, job['id'])['exit_code'] == 0
+    failed = jobs.job(stale['id'])
+    assert failed['status'] == 'failed' and 'exited' in failed['error']
+
+
+def test_failed_validation_is_reported(tmp_path):
+    def run():
+        raise RuntimeError("boom")
+    jobs = ValidationJobs(str(tmp_path / 'jobs'), str(tmp_path / 'results.csv'), run=run)
+    job, _ = jobs.submit()
+    assert wait_done(jobs, job['id'])['error'] == 'boom'
+    second, coalesced = jobs.submit()
+    assert not coalesced and wait_done(jobs, second['id'])['status'] == 'failed'
+
+
+def test_endpoints(monkeypatch, tmp_path):
+    run = BlockingRun()
+    monkeypatch.setattr(webhook_receiver, 'WEBHOOK_SECRET', 'secret')
+    monkeypatch.setattr(webhook_receiver, 'jobs',
+                        ValidationJobs(str(tmp_path / 'jobs'), str(tmp_path / 'results.csv'), run=run))
+    client = webhook_receiver.app.test_client()
+    auth = {'Authorization': 'Bearer secret'}
+    assert client.post('/hook/results').status_code == 403
+    assert client.get('/hook/results', headers={'Authorization': 'Bearer nope'}).status_code == 403
+    began = time.perf_counter()
+    response = client.post('/hook/results', headers=auth)
+    assert time.perf_counter() - began < 1
+    assert response.status_code == 202
+    body = response.get_json()
+    assert response.headers['Location'] == body['status_url']
+    assert client.get(body['status_url'], headers=auth).get_json()['status'] in ('queued', 'running')
+    assert client.get('/hook/results/' + 'f' * 32, headers=auth).status_code == 404
+    assert client.get('/hook/results/..%2Fsecret', headers=auth).status_code == 404
+    # Once the first job is running, the next trigger queues a follow-up instead of joining it
+    assert run.started.wait(5)
+    run.release.set()
+    response = client.post('/hook/results?wait=5', headers=auth)
+    assert response.status_code == 200
+    assert response.get_json()['report'] == {"file_valid": True, "run": 2}
+    assert client.get(body['status_url'], headers=auth).get_json()['status'] == 'done'
+    assert client.get('/hook/results', headers=auth).get_json()['last']['report']['run'] == 2
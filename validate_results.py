@@ -1,164 +1,579 @@
 
+import io
 import os
 import sys
 import time
 import json
+import functools
 import logging
 import argparse
+import re
+from collections import namedtuple
+import numpy as np
 import pandas as pd
 import yaml
 import requests
+from prediction_logger.results_store import PREFIX_WINDOW, prefix_hash
 
-def validate_results():
+DEFAULT_CHUNK_SIZE = 100_000
+PANDAS_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
 
-    # --- Logging setup ---
-    logger = logging.getLogger("validate_results")
+
+def is_parquet_results(path: str) -> bool:
+    """Partitioned Parquet results dataset (see prediction_logger.results_store)."""
+    return os.path.isdir(path) or path.lower().endswith(('.parquet', '.pq'))
+
+
+def read_columns_with_retry(path, retries=3):
+    """
+    Return the column names of a results file without reading its rows.
+    Raises FileNotFoundError if missing and EmptyDataError if it has no header.
+    """
+    for i in range(retries):
+        try:
+            if is_parquet_results(path):
+                if not os.path.exists(path):
+                    raise FileNotFoundError(path)
+                import pyarrow.dataset as ds
+                return ds.dataset(path, format='parquet', partitioning='hive').schema.names
+            return list(pd.read_csv(path, nrows=0).columns)
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            raise
+        except IOError:
+            if i < retries - 1:
+                time.sleep(2 ** i)
+            else:
+                raise
+
+
+def schema_field_names(schema: dict) -> list:
+    """
+    Return required field names from a schema's 'fields' list, which may hold
+    plain names or {name: type} entries (results_metadata.yaml, config/results_schema.yaml).
+    """
+    return [next(iter(field)) if isinstance(field, dict) else field for field in schema["fields"]]
+
+
+# Column-wise checks compiled from a schema; kind is present, string, float, int, date or enum
+ColumnRule = namedtuple('ColumnRule', 'name kind values')
+TYPE_ALIASES = {
+    'iso8601': 'date', 'date': 'date', 'datetime': 'date',
+    'float': 'float', 'double': 'float', 'number': 'float',
+    'int': 'int', 'integer': 'int',
+    'string': 'string', 'str': 'string',
+}
+FLOAT_PATTERN = r"\s*[-+]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|[iI]nf(?:inity)?)\s*"
+INT_PATTERN = r"\s*[-+]?\d+\s*"
+# Calendar dates (days per month are checked separately) with an optional time and UTC offset
+ISO8601_PATTERN = (r"\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])"
+                   r"(?:[T ](?:[01]\d|2[0-3]):[0-5]\d(?::[0-5]\d(?:\.\d+)?)?(?:Z|[+-](?:[01]\d|2[0-3]):?[0-5]\d)?)?")
+PATTERNS = {'float': FLOAT_PATTERN, 'int': INT_PATTERN, 'date': ISO8601_PATTERN}
+EXPECTED = {'float': "a number", 'int': "an integer", 'date': "an ISO 8601 date"}
+DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+
+def parse_field_type(name, spec) -> ColumnRule:
+    """
+    Rule for one schema field type: 'float', 'ISO8601', 'enum [a, b]' (or a
+    YAML list), 'string (e.g. ...)', ... A field without a type is only
+    checked for presence. Raises ValueError for an unknown type.
+    """
+    if spec is None:
+        return ColumnRule(name, 'present', None)
+    if isinstance(spec, (list, tuple)):
+        return ColumnRule(name, 'enum', tuple(str(value) for value in spec))
+    text = str(spec).strip()
+    match = re.fullmatch(r"enum\s*\[(.*)\]", text, re.IGNORECASE)
+    if match:
+        values = tuple(value.strip().strip('\'"') for value in match.group(1).split(','))
+        return ColumnRule(name, 'enum', tuple(value for value in values if value))
+    word = re.match(r"[A-Za-z0-9_]*", text).group(0).lower()
+    if word not in TYPE_ALIASES:
+        raise ValueError(f"Unknown type for field '{name}': {spec}")
+    return ColumnRule(name, TYPE_ALIASES[word], None)
+
+
+def _arrow_strings(column):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    # Typed Parquet columns (doubles, dates, dictionary partitions) are checked in their text form
+    if pa.types.is_dictionary(column.type):
+        column = column.dictionary_decode()
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        return column
+    return pc.cast(column, pa.string())
+
+
+def _invalid_mask(column, rule):
+    """
+    Boolean NumPy mask of non-null values in a DataFrame column or Arrow
+    array that violate a typed rule, computed without a per-row loop.
+    """
+    if isinstance(column, pd.Series):
+        if rule.kind == 'enum':
+            # Categorical codes: one membership test per distinct value; nulls (code -1) hit the trailing slot
+            codes, uniques = pd.factorize(column)
+            valid = np.append(np.isin(np.asarray(uniques, dtype=object), rule.values), True)
+            return ~valid[codes]
+        # Nulls count as invalid here; the caller masks them out as missing
+        invalid = ~column.str.fullmatch(PATTERNS[rule.kind]).fillna(False).astype(bool).to_numpy()
+        if rule.kind == 'date':
+            invalid |= pd.to_datetime(column.str.slice(0, 10), format="%Y-%m-%d", errors='coerce').isna().to_numpy()
+        return invalid
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    # Parquet columns already stored with the rule's type are valid as a whole
+    native = {'float': (pa.types.is_floating, pa.types.is_integer), 'int': (pa.types.is_integer,),
+              'date': (pa.types.is_date, pa.types.is_timestamp)}
+    if any(is_type(column.type) for is_type in native.get(rule.kind, ())):
+        return np.zeros(len(column), dtype=bool)
+    column = _arrow_strings(column)
+    if rule.kind == 'enum':
+        encoded = pc.dictionary_encode(column)
+        dictionary = encoded.dictionary.to_pylist()
+        allowed = set(rule.values)
+        valid = np.array([value in allowed for value in dictionary] + [True])
+        return ~valid[encoded.indices.fill_null(len(dictionary)).to_numpy(zero_copy_only=False)]
+    matches = pc.match_substring_regex(column, f"^(?:{PATTERNS[rule.kind]})$").fill_null(False)
+    invalid = ~matches.to_numpy(zero_copy_only=False)
+    if rule.kind == 'date':
+        # The pattern fixes the YYYY-MM-DD digits, so only day-of-month limits remain to check
+        day = pc.if_else(matches, pc.utf8_slice_codeunits(column, 0, 10), "2000-01-01")
+        year, month, dom = (pc.cast(pc.utf8_slice_codeunits(day, start, stop), 'int32').to_numpy(zero_copy_only=False)
+                            for start, stop in ((0, 4), (5, 7), (8, 10)))
+        leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        invalid |= dom > DAYS_IN_MONTH[month - 1] + (leap & (month == 2))
+    return invalid
+
+
+class SchemaPlan:
+    """
+    A schema compiled once into column-wise checks: presence via null masks,
+    then per typed column a vectorized check over the whole chunk (regex
+    match for numbers and ISO 8601 dates plus a calendar parse, categorical
+    codes for enums). Only rows that fail some check are visited to build
+    their error messages.
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self.fields = [rule.name for rule in self.rules]
+        # Identifies the checks in checkpoints; untyped fields keep their plain names
+        self.signature = [rule.name if rule.kind in ('present', 'string') else
+                          f"{rule.name}:{rule.kind}" + (f"[{','.join(rule.values)}]" if rule.values else "")
+                          for rule in self.rules]
+
+    @classmethod
+    def compile(cls, schema: dict) -> 'SchemaPlan':
+        rules = []
+        for field in schema["fields"]:
+            if isinstance(field, dict):
+                name, spec = next(iter(field.items()))
+            else:
+                name, spec = field, None
+            rules.append(parse_field_type(str(name), spec))
+        return cls(rules)
+
+    def check(self, chunk, offset, report):
+        """Check one chunk and record row-level errors (global row index) in the report."""
+        frame = isinstance(chunk, pd.DataFrame)
+        names = list(chunk.columns) if frame else chunk.schema.names
+        rows = len(chunk) if frame else chunk.num_rows
+        missing = np.ones((rows, len(self.rules)), dtype=bool)
+        invalid = np.zeros((rows, len(self.rules)), dtype=bool)
+        for j, rule in enumerate(self.rules):
+            if rule.name not in names:
+                continue
+            missing[:, j] = null_mask(chunk, rule.name)
+            if rule.kind not in ('present', 'string'):
+                invalid[:, j] = _invalid_mask(chunk[rule.name] if frame else chunk.column(rule.name), rule)
+                invalid[:, j] &= ~missing[:, j]
+        bad = np.flatnonzero(missing.any(axis=1) | invalid.any(axis=1))
+        for i in bad:
+            errors = []
+            for j in np.flatnonzero(missing[i] | invalid[i]):
+                rule = self.rules[j]
+                if missing[i, j]:
+                    errors.append(f"Missing {rule.name}")
+                    continue
+                value = chunk[rule.name].iat[i] if frame else chunk.column(rule.name)[int(i)].as_py()
+                expected = f"one of {list(rule.values)}" if rule.kind == 'enum' else EXPECTED[rule.kind]
+                errors.append(f"Invalid {rule.name}: {value!r} is not {expected}")
+            report["row_errors"].append({"row": offset + int(i), "errors": errors})
+        report["invalid_rows"] += len(bad)
+        report["valid_rows"] += rows - len(bad)
+        return rows
+
+
+def as_plan(fields) -> SchemaPlan:
+    """A SchemaPlan as given, or a presence-only plan for a list of field names."""
+    if isinstance(fields, SchemaPlan):
+        return fields
+    return SchemaPlan(ColumnRule(field, 'present', None) for field in fields)
+
+
+def iter_result_chunks(path, columns, fields, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield the results file in chunks of roughly chunk_size rows, parsing only
+    the required columns so memory stays bounded by the chunk size. Chunks
+    are pyarrow RecordBatches when pyarrow is installed (streaming CSV reader)
+    and pandas DataFrames otherwise. path may also be a binary file object
+    holding CSV text (see open_byte_range).
+    """
+    usecols = [col for col in columns if col in fields] or columns[:1]
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        import pyarrow.dataset as ds
+    except ImportError:
+        yield from pd.read_csv(path, usecols=usecols, dtype=str, chunksize=chunk_size)
+        return
+    if isinstance(path, str) and is_parquet_results(path):
+        dataset = ds.dataset(path, format='parquet', partitioning='hive')
+        yield from dataset.to_batches(columns=usecols, batch_size=chunk_size)
+        return
+    # Same null markers as pandas.read_csv so the report matches the pandas path
+    reader = pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=max(chunk_size * 64, 1 << 16)),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=usecols,
+            column_types={col: pa.string() for col in usecols},
+            strings_can_be_null=True,
+            null_values=PANDAS_NA_VALUES,
+        ),
+    )
+    yield from reader
+
+
+def null_mask(chunk, field):
+    """Boolean NumPy mask of null values for one column of a DataFrame or RecordBatch."""
+    if isinstance(chunk, pd.DataFrame):
+        return chunk[field].isna().to_numpy()
+    return chunk.column(field).is_null().to_numpy(zero_copy_only=False)
+
+
+def check_chunk(chunk, fields, offset, report):
+    """
+    Check one chunk against a SchemaPlan (or a list of required field names,
+    checked for presence only) and record row-level errors (global row
+    index) in the report. Returns the number of rows checked.
+    """
+    return as_plan(fields).check(chunk, offset, report)
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only stream of a header line followed by bytes [start, end) of a file."""
+
+    def __init__(self, path, start, end, header=b""):
+        self._file = open(path, 'rb')
+        self._file.seek(start)
+        self._remaining = end - start
+        self._header = header
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._header:
+            n = min(len(buffer), len(self._header))
+            buffer[:n] = self._header[:n]
+            self._header = self._header[n:]
+            return n
+        n = min(len(buffer), self._remaining)
+        if n <= 0:
+            return 0
+        data = self._file.read(n)
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+def open_byte_range(path, start, end, header=b""):
+    """Open bytes [start, end) of a results file as CSV, prefixed with its header line."""
+    return io.BufferedReader(_ByteRange(path, start, end, header), buffer_size=1 << 20)
+
+
+def complete_lines_end(path, size):
+    """Return the offset just past the last newline at or before size (0 if none)."""
+    with open(path, 'rb') as f:
+        pos = size
+        while pos > 0:
+            step = min(PREFIX_WINDOW, pos)
+            f.seek(pos - step)
+            block = f.read(step)
+            i = block.rfind(b"\n")
+            if i >= 0:
+                return pos - step + i + 1
+            pos -= step
+    return 0
+
+
+def load_checkpoint(checkpoint_path, results_path, fields):
+    """
+    Return the saved checkpoint if it still describes a prefix of results_path
+    validated against the same checks (SchemaPlan.signature), else None
+    (forcing a full scan).
+    """
+    try:
+        with open(checkpoint_path, 'r') as f:
+            checkpoint = json.load(f)
+        size = os.path.getsize(results_path)
+    except (OSError, ValueError):
+        return None
+    if (checkpoint.get("results_path") != os.path.abspath(results_path)
+            or checkpoint.get("fields") != fields
+            or checkpoint.get("offset", 0) > size
+            or checkpoint.get("prefix_hash") != prefix_hash(results_path, checkpoint.get("offset", 0))):
+        return None
+    return checkpoint
+
+
+def save_checkpoint(checkpoint_path, checkpoint):
+    tmp_path = checkpoint_path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def validate_incremental(results_path, columns, fields, chunk_size, checkpoint_path, report):
+    """
+    Validate only the rows appended since the last checkpoint and merge them
+    into the checkpointed report. Falls back to a full scan when there is no
+    usable checkpoint (missing, other file/schema, or prefix hash changed).
+    Only complete lines are consumed; a partially written last row is left
+    for the next trigger.
+    """
+    plan = as_plan(fields)
+    checkpoint = load_checkpoint(checkpoint_path, results_path, plan.signature)
+    if checkpoint is None:
+        checkpoint = {
+            "results_path": os.path.abspath(results_path), "fields": plan.signature, "header": None,
+            "offset": 0, "rows": 0, "valid_rows": 0, "invalid_rows": 0, "row_errors": [],
+        }
+    end = complete_lines_end(results_path, os.path.getsize(results_path))
+    partial = {"row_errors": [], "valid_rows": 0, "invalid_rows": 0}
+    start = checkpoint["offset"]
+    if end > start:
+        header = b""
+        if start > 0:
+            header = checkpoint["header"].encode('utf-8')
+        with open_byte_range(results_path, start, end, header) as stream:
+            rows = checkpoint["rows"]
+            for chunk in iter_result_chunks(stream, columns, plan.fields, chunk_size):
+                rows += check_chunk(chunk, plan, rows, partial)
+        if start == 0:
+            with open(results_path, 'rb') as f:
+                checkpoint["header"] = f.readline().decode('utf-8')
+        checkpoint.update(
+            offset=end,
+            rows=rows,
+            prefix_hash=prefix_hash(results_path, end),
+            valid_rows=checkpoint["valid_rows"] + partial["valid_rows"],
+            invalid_rows=checkpoint["invalid_rows"] + partial["invalid_rows"],
+            row_errors=checkpoint["row_errors"] + partial["row_errors"],
+        )
+        save_checkpoint(checkpoint_path, checkpoint)
+    report["valid_rows"] = checkpoint["valid_rows"]
+    report["invalid_rows"] = checkpoint["invalid_rows"]
+    report["row_errors"] = list(checkpoint["row_errors"])
+
+
+LOGGER_NAME = "validate_results"
+LOG_FILE = "validation.log"
+
+
+def get_validation_logger():
+    """
+    The validate_results logger with its file (validation.log) and console
+    handlers. Handlers are installed once per process, so repeated
+    validations neither duplicate log lines nor leak file descriptors.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
     logger.setLevel(logging.INFO)
-    log_formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s')
-    # File handler
-    file_handler = logging.FileHandler('validation.log')
-    file_handler.setFormatter(log_formatter)
-    logger.addHandler(file_handler)
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(log_formatter)
-    logger.addHandler(console_handler)
-
-    def notify_slack(message: str):
-        webhook_url = os.environ.get("SLACK_WEBHOOK")
-        if webhook_url:
+    if not any(getattr(handler, '_validate_results', False) for handler in logger.handlers):
+        log_formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s')
+        # File handler
+        file_handler = logging.FileHandler(LOG_FILE, delay=True)
+        # Console handler
+        console_handler = logging.StreamHandler()
+        for handler in (file_handler, console_handler):
+            handler.setFormatter(log_formatter)
+            handler._validate_results = True
+            logger.addHandler(handler)
+    return logger
+
+
+def read_file_with_retry(path, mode='r', retries=3):
+    for i in range(retries):
+        try:
+            with open(path, mode) as f:
+                return f.read()
+        except IOError as e:
+            if i < retries - 1:
+                time.sleep(2 ** i)
+            else:
+                raise
+
+
+class ValidationError(Exception):
+    """A failure that ends validation with the given exit code."""
+
+    def __init__(self, message, exit_code):
+        super().__init__(message)
+        self.exit_code = exit_code
+
+
+class Validator:
+    """
+    Validates one results file against one schema, set up once and called
+    per request. Settings default to the RESULTS_FILE_PATH,
+    SCHEMA_FILE_PATH, VALIDATION_CHUNK_SIZE, VALIDATION_CHECKPOINT_PATH and
+    SLACK_WEBHOOK environment variables read at construction. The parsed
+    schema is cached and reloaded only when the schema file changes; Slack
+    notifications reuse one pooled session.
+    """
+
+    def __init__(self, results_path=None, schema_path=None, checkpoint_path=None, chunk_size=None,
+                 slack_webhook=None):
+        self.results_path = results_path or os.getenv("RESULTS_FILE_PATH")
+        self.schema_path = schema_path or os.getenv("SCHEMA_FILE_PATH")
+        self.checkpoint_path = checkpoint_path or os.getenv("VALIDATION_CHECKPOINT_PATH")
+        self.chunk_size = int(chunk_size or os.getenv("VALIDATION_CHUNK_SIZE", DEFAULT_CHUNK_SIZE))
+        self.slack_webhook = slack_webhook or os.environ.get("SLACK_WEBHOOK")
+        self.logger = get_validation_logger()
+        self._session = None
+        self._schema_key = None
+        self._plan = None
+
+    def notify_slack(self, message: str):
+        if self.slack_webhook:
+            if self._session is None:
+                self._session = requests.Session()
             try:
-                requests.post(webhook_url, json={"text": message}, timeout=5)
+                self._session.post(self.slack_webhook, json={"text": message}, timeout=5)
             except Exception as e:
-                logger.warning(f"Failed to send Slack notification: {e}")
+                self.logger.warning(f"Failed to send Slack notification: {e}")
 
-    def read_file_with_retry(path, mode='r', retries=3):
-        for i in range(retries):
+    def schema_plan(self) -> SchemaPlan:
+        """The schema compiled into a SchemaPlan, once per schema file version."""
+        try:
+            stat = os.stat(self.schema_path)
+            key = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            key = None
+        if key is not None and key == self._schema_key:
+            return self._plan
+        try:
+            schema_data = read_file_with_retry(self.schema_path)
+            if schema_data is None:
+                raise FileNotFoundError(f"Schema file not found or empty: {self.schema_path}")
+            schema = yaml.safe_load(schema_data)
+        except FileNotFoundError:
+            raise ValidationError(f"Schema file not found: {self.schema_path}", 2)
+        except yaml.YAMLError as e:
+            raise ValidationError(f"Failed to parse schema YAML: {e}", 3)
+        except Exception as e:
+            raise ValidationError(f"Failed to read schema file: {e}", 2)
+        if not isinstance(schema, dict) or "fields" not in schema:
+            raise ValidationError("Schema file missing required 'fields' key.", 3)
+        try:
+            self._plan = SchemaPlan.compile(schema)
+        except (TypeError, ValueError) as e:
+            raise ValidationError(f"Invalid schema: {e}", 3)
+        self._schema_key = key
+        return self._plan
+
+    def _columns(self) -> list:
+        try:
+            return read_columns_with_retry(self.results_path)
+        except FileNotFoundError:
+            raise ValidationError(f"Results file not found: {self.results_path}", 2)
+        except pd.errors.EmptyDataError:
+            raise ValidationError(f"Results file is empty: {self.results_path}", 2)
+        except Exception as e:
+            raise ValidationError(f"Failed to read results file: {e}", 2)
+
+    def validate(self):
+        """Validate the results file; returns (report, exit_code)."""
+        report = {
+            "file_valid": False,
+            "missing_fields": [],
+            "schema_errors": [],
+            "row_errors": [],
+            "valid_rows": 0,
+            "invalid_rows": 0
+        }
+        try:
+            # --- Env var checks ---
+            if not self.results_path:
+                raise ValidationError("Missing RESULTS_FILE_PATH environment variable.", 1)
+            if not self.schema_path:
+                raise ValidationError("Missing SCHEMA_FILE_PATH environment variable.", 1)
+            # --- Open results (header only; rows are streamed below) ---
+            columns = self._columns()
+            plan = self.schema_plan()
             try:
-                with open(path, mode) as f:
-                    return f.read()
-            except IOError as e:
-                if i < retries - 1:
-                    time.sleep(2 ** i)
+                if self.checkpoint_path and not is_parquet_results(self.results_path):
+                    validate_incremental(self.results_path, columns, plan, self.chunk_size,
+                                         self.checkpoint_path, report)
                 else:
-                    raise
-
-    results_path = os.getenv("RESULTS_FILE_PATH")
-    schema_path = os.getenv("SCHEMA_FILE_PATH")
-
-    report = {
-        "file_valid": False,
-        "missing_fields": [],
-        "schema_errors": [],
-        "row_errors": [],
-        "valid_rows": 0,
-        "invalid_rows": 0
-    }
-
-    # --- Env var checks ---
-    if not results_path:
-        logger.error("Missing RESULTS_FILE_PATH environment variable.")
-        notify_slack(":x: Validation failed: Missing RESULTS_FILE_PATH env var.")
-        report["schema_errors"].append("Missing RESULTS_FILE_PATH environment variable.")
-        return report, 1
-    if not schema_path:
-        logger.error("Missing SCHEMA_FILE_PATH environment variable.")
-        notify_slack(":x: Validation failed: Missing SCHEMA_FILE_PATH env var.")
-        report["schema_errors"].append("Missing SCHEMA_FILE_PATH environment variable.")
-        return report, 1
-
-    # --- Load CSV ---
-    try:
-        csv_data = read_file_with_retry(results_path)
-        from io import StringIO
-        df = pd.read_csv(StringIO(csv_data))
-    except FileNotFoundError:
-        logger.error(f"Results file not found: {results_path}")
-        notify_slack(f":x: Validation failed: Results file not found: {results_path}")
-        report["schema_errors"].append(f"Results file not found: {results_path}")
-        return report, 2
-    except pd.errors.EmptyDataError:
-        logger.error(f"Results file is empty: {results_path}")
-        notify_slack(f":x: Validation failed: Results file is empty: {results_path}")
-        report["schema_errors"].append(f"Results file is empty: {results_path}")
-        return report, 2
-    except Exception as e:
-        logger.error(f"Failed to read results file: {e}")
-        notify_slack(f":x: Validation failed: Failed to read results file: {e}")
-        report["schema_errors"].append(f"Failed to read results file: {e}")
-        return report, 2
-
-    # --- Load YAML schema ---
-    try:
-        schema_data = read_file_with_retry(schema_path)
-        if schema_data is None:
-            raise FileNotFoundError(f"Schema file not found or empty: {schema_path}")
-        schema = yaml.safe_load(schema_data)
-    except FileNotFoundError:
-        logger.error(f"Schema file not found: {schema_path}")
-        notify_slack(f":x: Validation failed: Schema file not found: {schema_path}")
-        report["schema_errors"].append(f"Schema file not found: {schema_path}")
-        return report, 2
-    except yaml.YAMLError as e:
-        logger.error(f"Failed to parse schema YAML: {e}")
-        notify_slack(f":x: Validation failed: Failed to parse schema YAML: {e}")
-        report["schema_errors"].append(f"Failed to parse schema YAML: {e}")
-        return report, 3
-    except Exception as e:
-        logger.error(f"Failed to read schema file: {e}")
-        notify_slack(f":x: Validation failed: Failed to read schema file: {e}")
-        report["schema_errors"].append(f"Failed to read schema file: {e}")
-        return report, 2
-
-    # --- Validate schema structure ---
-    if not isinstance(schema, dict) or "fields" not in schema:
-        logger.error("Schema file missing required 'fields' key.")
-        notify_slack(":x: Validation failed: Schema file missing required 'fields' key.")
-        report["schema_errors"].append("Schema file missing required 'fields' key.")
-        return report, 3
-
-    required_fields = [field for field in schema["fields"]]
-    for index, row in df.iterrows():
-        row_errors = []
-        for field in required_fields:
-            value = row.get(field) if hasattr(row, 'get') else row[field] if field in row else None
-            is_missing = value is None
-            try:
-                if not is_missing:
-                    is_missing = bool(pd.isna(value))
-            except Exception:
-                pass
-            if is_missing:
-                row_errors.append(f"Missing {field}")
-        if row_errors:
-            report["invalid_rows"] += 1
-            report["row_errors"].append({"row": index, "errors": row_errors})
-        else:
-            report["valid_rows"] += 1
-
-    # --- Final report and exit code ---
-    if report["schema_errors"]:
-        report["file_valid"] = False
-        logger.error("Schema validation failed.")
-        notify_slack(":x: Schema validation failed.")
-        return report, 3
-    if report["invalid_rows"] > 0:
-        report["file_valid"] = False
-        logger.warning(f"Validation completed with {report['invalid_rows']} invalid rows.")
-        notify_slack(f":warning: Validation completed with {report['invalid_rows']} invalid rows.")
-        return report, 4
-    report["file_valid"] = True
-    logger.info("Validation succeeded. All rows valid.")
-    notify_slack(":white_check_mark: Validation succeeded. All rows valid.")
-    return report, 0
+                    offset = 0
+                    for chunk in iter_result_chunks(self.results_path, columns, plan.fields, self.chunk_size):
+                        offset += check_chunk(chunk, plan, offset, report)
+            except Exception as e:
+                raise ValidationError(f"Failed to read results file: {e}", 2)
+        except ValidationError as e:
+            self.logger.error(str(e))
+            self.notify_slack(f":x: Validation failed: {e}")
+            report["schema_errors"].append(str(e))
+            return report, e.exit_code
+
+        # --- Final report and exit code ---
+        if report["invalid_rows"] > 0:
+            report["file_valid"] = False
+            self.logger.warning(f"Validation completed with {report['invalid_rows']} invalid rows.")
+            self.notify_slack(f":warning: Validation completed with {report['invalid_rows']} invalid rows.")
+            return report, 4
+        report["file_valid"] = True
+        self.logger.info("Validation succeeded. All rows valid.")
+        self.notify_slack(":white_check_mark: Validation succeeded. All rows valid.")
+        return report, 0
+
+    __call__ = validate
+
+
+@functools.lru_cache(maxsize=32)
+def _validator(results_path, schema_path, checkpoint_path, chunk_size, slack_webhook):
+    return Validator(results_path, schema_path, checkpoint_path, chunk_size, slack_webhook)
+
+
+def validate_results(checkpoint_path=None):
+    """
+    Validate the results file named by RESULTS_FILE_PATH against the schema
+    at SCHEMA_FILE_PATH. With a checkpoint path (argument or
+    VALIDATION_CHECKPOINT_PATH), CSV results are validated incrementally.
+    Reuses one Validator per configuration. Returns (report, exit_code).
+    """
+    return _validator(os.getenv("RESULTS_FILE_PATH"), os.getenv("SCHEMA_FILE_PATH"),
+                      checkpoint_path or os.getenv("VALIDATION_CHECKPOINT_PATH"),
+                      os.getenv("VALIDATION_CHUNK_SIZE"), os.environ.get("SLACK_WEBHOOK")).validate()
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Validate results file against schema.")
     parser.add_argument('--json-report', action='store_true', help='Write validation_summary.json for CI/CD')
+    parser.add_argument('--checkpoint', default=None, help='Checkpoint file for incremental validation of appended rows')
     args = parser.parse_args()
 
-    report, exit_code = validate_results()
+    report, exit_code = validate_results(checkpoint_path=args.checkpoint)
     print(json.dumps(report, indent=2))
     if args.json_report:
         with open("validation_summary.json", "w") as f:
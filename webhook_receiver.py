@@ -1,19 +1,271 @@
+import hashlib
+import json
 import os
-from flask import Flask, request, jsonify
-from validate_results import validate_results
+import re
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from flask import Flask, request, jsonify, url_for
+from validate_results import Validator
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the single-process dev server, where the thread lock suffices
+    fcntl = None
 
 app = Flask(__name__)
 WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET")
+# Results are append-only, so each trigger only validates rows added since the last one
+CHECKPOINT_PATH = os.getenv("VALIDATION_CHECKPOINT_PATH", ".validation_checkpoint.json")
+# Job state shared by every worker process; keep it on local disk, one directory per host
+JOBS_DIR = os.getenv("VALIDATION_JOBS_DIR", ".validation_jobs")
+DEFAULT_JOB_HISTORY = 200
+# Longest a POST may block with ?wait=N before it returns the still-unfinished job
+MAX_WAIT = 25.0
+JOB_ID = re.compile(r"[0-9a-f]{32}")
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _write_json(path: Path, data: dict):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, 'w') as f:
+        json.dump(data, f, default=str)
+    os.replace(tmp, path)
+
+
+class ValidationJobs:
+    """
+    Validation runs as background jobs, shared by every worker process
+    through files under jobs_dir: one JSON file per job, plus a state file
+    per results file naming the job that is running, the job queued behind
+    it and the worker draining them, all updated under an exclusive flock.
+
+    A trigger while a job is queued joins that job; a trigger while one is
+    running queues exactly one follow-up. A burst of triggers therefore
+    costs at most two validation runs, and the last one sees every row
+    written before the burst ended. If the draining worker dies (restart,
+    OOM kill) its running job is marked failed and the next request starts
+    a new runner for whatever is queued.
+    """
+
+    def __init__(self, jobs_dir: str, results_path: str | None, run=None, history: int = DEFAULT_JOB_HISTORY):
+        self.dir = Path(jobs_dir)
+        self.results_path = os.path.abspath(results_path) if results_path else None
+        self.key = hashlib.sha256(str(self.results_path).encode()).hexdigest()[:16]
+        # Callable returning (report, exit_code); by default one Validator per worker, built on first use
+        self.run = run
+        self.history = history
+        self._thread_lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self):
+        (self.dir / self.key).mkdir(parents=True, exist_ok=True)
+        with self._thread_lock, open(self.dir / f"{self.key}.lock", 'a') as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _state_path(self) -> Path:
+        return self.dir / f"{self.key}.json"
+
+    def _job_path(self, job_id: str) -> Path:
+        return self.dir / self.key / f"{job_id}.json"
+
+    def _state(self) -> dict:
+        try:
+            with open(self._state_path()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'running': None, 'pending': None, 'last': None, 'runner': None}
+
+    def _read_job(self, job_id: str | None):
+        if not job_id or not JOB_ID.fullmatch(job_id):
+            return None
+        try:
+            with open(self._job_path(job_id)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _recover(self, state: dict) -> bool:
+        """Release a runner whose process is gone (same host only); marks its job failed. Call locked."""
+        runner = state.get('runner')
+        if not runner or runner.get('host') != socket.gethostname() or _alive(runner.get('pid', 0)):
+            return False
+        job = self._read_job(state.get('running'))
+        if job is not None:
+            job.update(status='failed', finished=time.time(), error=f"worker {runner['pid']} exited during validation")
+            _write_json(self._job_path(job['id']), job)
+            state['last'] = job['id']
+        state.update(running=None, runner=None)
+        return True
+
+    def _claim(self, state: dict) -> bool:
+        """Make this process the runner if work is queued and nobody is draining it. Call locked."""
+        changed = self._recover(state)
+        claim = bool(state.get('pending')) and not state.get('runner')
+        if claim:
+            state['runner'] = {'pid': os.getpid(), 'host': socket.gethostname()}
+        if claim or changed:
+            _write_json(self._state_path(), state)
+        return claim
+
+    def submit(self):
+        """Queue a validation run or join the one already queued. Returns (job, coalesced)."""
+        with self._locked():
+            state = self._state()
+            job = self._read_job(state.get('pending'))
+            coalesced = job is not None
+            if coalesced:
+                job['triggers'] += 1
+            else:
+                job = {'id': uuid.uuid4().hex, 'status': 'queued', 'results_path': self.results_path,
+                       'created': time.time(), 'started': None, 'finished': None, 'triggers': 1,
+                       'exit_code': None, 'report': None}
+                state['pending'] = job['id']
+            _write_json(self._job_path(job['id']), job)
+            _write_json(self._state_path(), state)
+            start = self._claim(state)
+        if start:
+            threading.Thread(target=self._drain, name='validation-runner', daemon=True).start()
+        return job, coalesced
+
+    def _drain(self):
+        """Runner loop: run queued jobs one at a time until none is left."""
+        try:
+            self._drain_queue()
+        except Exception as e:
+            # Never leave this live process registered as runner, or queued jobs would wait forever
+            print(f"[Webhook] Validation runner failed: {e}")
+            with self._locked():
+                state = self._state()
+                state.update(running=None, runner=None)
+                _write_json(self._state_path(), state)
+
+    def _drain_queue(self):
+        while True:
+            with self._locked():
+                state = self._state()
+                job = self._read_job(state.get('pending'))
+                if job is None:
+                    state.update(pending=None, runner=None)
+                    _write_json(self._state_path(), state)
+                    return
+                job.update(status='running', started=time.time(), worker=os.getpid())
+                state.update(pending=None, running=job['id'])
+                _write_json(self._job_path(job['id']), job)
+                _write_json(self._state_path(), state)
+            try:
+                if self.run is None:
+                    self.run = Validator(self.results_path, checkpoint_path=CHECKPOINT_PATH)
+                report, exit_code = self.run()
+                job.update(status='done', exit_code=exit_code, report=report)
+            except Exception as e:
+                job.update(status='failed', error=str(e))
+            job['finished'] = time.time()
+            with self._locked():
+                _write_json(self._job_path(job['id']), job)
+                state = self._state()
+                state.update(running=None, last=job['id'])
+                _write_json(self._state_path(), state)
+                self._prune(state)
+
+    def _prune(self, state: dict):
+        """Drop the oldest finished job files beyond the history limit. Call locked."""
+        jobs = sorted((self.dir / self.key).glob('*.json'), key=lambda path: path.stat().st_mtime)
+        keep = {state.get('running'), state.get('pending'), state.get('last')}
+        for path in jobs[:max(0, len(jobs) - self.history)]:
+            if path.stem not in keep:
+                path.unlink(missing_ok=True)
+
+    def job(self, job_id: str):
+        """A job by id (None if unknown); restarts draining if its runner died."""
+        with self._locked():
+            state = self._state()
+            start = self._claim(state)
+            job = self._read_job(job_id)
+        if start:
+            threading.Thread(target=self._drain, name='validation-runner', daemon=True).start()
+        return job
+
+    def summary(self) -> dict:
+        with self._locked():
+            state = self._state()
+            return {name: self._read_job(state.get(name)) for name in ('running', 'pending', 'last')}
+
+    def wait(self, job_id: str, timeout: float):
+        """Poll a job until it finishes or timeout seconds pass; returns its latest state."""
+        deadline = time.monotonic() + timeout
+        job = self._read_job(job_id)
+        while job is not None and job['status'] in ('queued', 'running') and time.monotonic() < deadline:
+            time.sleep(0.05)
+            job = self._read_job(job_id)
+        return job
+
+
+jobs = ValidationJobs(JOBS_DIR, os.getenv("RESULTS_FILE_PATH"))
+
+
+def _authorized() -> bool:
+    token = request.headers.get("Authorization", "").replace("Bearer ", "")
+    return token == WEBHOOK_SECRET
+
 
 @app.route("/hook/results", methods=["POST"])
 def handle_webhook():
-    token = request.headers.get("Authorization", "").replace("Bearer ", "")
-    if token != WEBHOOK_SECRET:
+    if not _authorized():
+        return jsonify({"error": "Unauthorized"}), 403
+
+    job, coalesced = jobs.submit()
+    print(f"[Webhook] Received update trigger: job {job['id']}{' (coalesced)' if coalesced else ''}.")
+    wait = min(request.args.get("wait", 0.0, type=float), MAX_WAIT)
+    if wait > 0:
+        job = jobs.wait(job['id'], wait)
+    status_url = url_for("job_status", job_id=job['id'])
+    body = {"job_id": job['id'], "status": job['status'], "coalesced": coalesced, "status_url": status_url}
+    if job['status'] in ('done', 'failed'):
+        body.update(job)
+        return jsonify(body), 200
+    return jsonify(body), 202, {"Location": status_url}
+
+
+@app.route("/hook/results", methods=["GET"])
+def results_status():
+    if not _authorized():
         return jsonify({"error": "Unauthorized"}), 403
+    return jsonify(jobs.summary()), 200
+
+
+@app.route("/hook/results/<job_id>", methods=["GET"])
+def job_status(job_id):
+    if not _authorized():
+        return jsonify({"error": "Unauthorized"}), 403
+    job = jobs.job(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    return jsonify(job), 200
+
 
-    print("[Webhook] Received update trigger.")
-    validation_report = validate_results()
-    return jsonify(validation_report), 200
+@app.route("/health", methods=["GET"])
+def health():
+    return jsonify({"status": "ok"}), 200
 
 if __name__ == "__main__":
-    app.run(port=int(os.getenv("WEBHOOK_PORT", 8080)))
+    # Development only; production runs under gunicorn -c gunicorn.conf.py
+    app.run(port=int(os.getenv("WEBHOOK_PORT", 8080)), threaded=True)